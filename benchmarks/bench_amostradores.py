@@ -0,0 +1,55 @@
+"""
+Benchmark dos amostradores de Monte Carlo: erro real médio e erro padrão
+estimado contra o número de amostras, para cada amostrador, nos integrandos
+dos testes.
+
+Uso:
+    python benchmarks/bench_amostradores.py [n_max] [repeticoes]
+
+Por padrão n vai de 10^2 a 10^6 e cada caso é repetido 20 vezes com
+sementes diferentes.
+"""
+
+import math
+import sys
+
+import numpy as np
+
+from CB2325NumericaG1.integracao import monte_carlo_one_variable, monte_carlo_two_variables
+
+AMOSTRADORES = ("uniforme", "estratificado", "antitetico", "hipercubo_latino", "halton")
+
+# (nome, função que recebe n, semente e amostrador, valor exato)
+INTEGRANDOS = [
+    ("sin(x) em [0, pi]",
+     lambda n, s, a: monte_carlo_one_variable(np.sin, 0, math.pi, n, semente=s, full_output=True, amostrador=a),
+     2.0),
+    ("exp(x) em [0, 1]",
+     lambda n, s, a: monte_carlo_one_variable(np.exp, 0, 1, n, semente=s, full_output=True, amostrador=a),
+     math.e - 1),
+    ("x² y em [0, 1]²",
+     lambda n, s, a: monte_carlo_two_variables(lambda x, y: x**2 * y, 0, 1, 0, 1, n, semente=s,
+                                               full_output=True, amostrador=a),
+     1 / 6),
+]
+
+
+def main():
+    n_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    repeticoes = int(sys.argv[2]) if len(sys.argv) > 2 else 20
+
+    for nome, integrar, exato in INTEGRANDOS:
+        print(f"\n{nome}")
+        print(f"{'amostrador':<18}{'n':>10}{'erro real médio':>18}{'erro padrão médio':>20}")
+        for amostrador in AMOSTRADORES:
+            n = 10**2
+            while n <= n_max:
+                resultados = [integrar(n, semente, amostrador) for semente in range(repeticoes)]
+                erro_real = np.mean([abs(r.valor - exato) for r in resultados])
+                erro_padrao = np.mean([r.erro for r in resultados])
+                print(f"{amostrador:<18}{n:>10.0e}{erro_real:>18.2e}{erro_padrao:>20.2e}")
+                n *= 10
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark do tempo de importação a frio do pacote, medido com
+'python -X importtime' em processos novos.
+
+Mostra o tempo cumulativo de 'import CB2325NumericaG1' e, para comparação,
+o tempo dos backends (matplotlib e sympy) que deixaram de ser importados
+junto com o pacote. Antes dessa mudança, o tempo do pacote incluía a soma
+dos dois.
+
+Uso:
+    python benchmarks/bench_importacao.py [repeticoes]
+"""
+
+import statistics
+import subprocess
+import sys
+
+
+def tempo_importacao(codigo, modulo):
+    """Tempo cumulativo (em ms) de 'modulo' ao executar 'codigo' em um processo novo."""
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        capture_output=True, text=True, check=True,
+    )
+    for linha in processo.stderr.splitlines():
+        partes = linha.split("|")
+        if len(partes) == 3 and partes[2].strip() == modulo:
+            return int(partes[1]) / 1000
+    raise RuntimeError(f"{modulo} não apareceu na saída de -X importtime.")
+
+
+def main():
+    repeticoes = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+
+    casos = [
+        ("CB2325NumericaG1 (com numpy)", "import CB2325NumericaG1", "CB2325NumericaG1"),
+        ("CB2325NumericaG1 (sem numpy)", "import numpy, CB2325NumericaG1", "CB2325NumericaG1"),
+        ("matplotlib.pyplot", "import numpy, matplotlib.pyplot", "matplotlib.pyplot"),
+        ("sympy", "import numpy, sympy", "sympy"),
+    ]
+
+    print(f"mediana de {repeticoes} importações a frio")
+    for nome, codigo, modulo in casos:
+        tempos = [tempo_importacao(codigo, modulo) for _ in range(repeticoes)]
+        print(f"{nome:<32}{statistics.median(tempos):>10.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,65 @@
+"""
+Benchmark do trapézio e de Simpson 1/3: caminho vetorizado (f avaliada uma
+única vez sobre a malha) contra o caminho ponto a ponto (f que não aceita
+arrays), e pico de memória da malha inteira contra o modo em blocos.
+
+Uso:
+    python benchmarks/bench_integracao.py [n_max] [n_max_ponto_a_ponto]
+
+Por padrão n vai de 10^3 a 10^7 no caminho vetorizado e até 10^6 no
+caminho ponto a ponto. Com n_max = 1e8 o caminho vetorizado precisa de
+alguns GB de memória para a malha.
+"""
+
+import math
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+from CB2325NumericaG1.integracao import trapezio, simpson13
+
+
+def cronometrar(metodo, f, n):
+    inicio = time.perf_counter()
+    metodo(f, 0, math.pi, n)
+    return time.perf_counter() - inicio
+
+
+def main():
+    n_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**7
+    n_max_laco = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6
+
+    f_vetorizada = np.sin
+    f_escalar = lambda x: math.sin(x)   # math.sin não aceita arrays
+
+    print(f"{'método':<12}{'n':>12}{'vetorizado (s)':>18}{'ponto a ponto (s)':>20}{'aceleração':>12}")
+    for metodo in (trapezio, simpson13):
+        n = 10**3
+        while n <= n_max:
+            t_vet = cronometrar(metodo, f_vetorizada, n)
+            if n <= n_max_laco:
+                t_laco = cronometrar(metodo, f_escalar, n)
+                print(f"{metodo.__name__:<12}{n:>12.0e}{t_vet:>18.4f}{t_laco:>20.4f}{t_laco / t_vet:>11.0f}x")
+            else:
+                print(f"{metodo.__name__:<12}{n:>12.0e}{t_vet:>18.4f}{'-':>20}{'-':>12}")
+            n *= 10
+
+    bloco = 10**5
+    print(f"\n{'método':<12}{'n':>12}{'memória malha (MB)':>22}{'memória blocos (MB)':>22}")
+    for metodo in (trapezio, simpson13):
+        n = 10**5
+        while n <= n_max:
+            picos = []
+            for tamanho_bloco in (None, bloco):
+                tracemalloc.start()
+                metodo(f_vetorizada, 0, math.pi, n, tamanho_bloco=tamanho_bloco)
+                picos.append(tracemalloc.get_traced_memory()[1] / 1e6)
+                tracemalloc.stop()
+            print(f"{metodo.__name__:<12}{n:>12.0e}{picos[0]:>22.1f}{picos[1]:>22.1f}")
+            n *= 10
+
+
+if __name__ == "__main__":
+    main()
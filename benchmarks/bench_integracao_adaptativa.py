@@ -0,0 +1,59 @@
+"""
+Benchmark da integração adaptativa de Gauss–Kronrod contra o trapézio e
+Simpson 1/3 com malha uniforme: número de avaliações da função e tempo
+necessários para atingir o mesmo erro.
+
+Para o trapézio e Simpson 1/3, n é dobrado até que o erro real fique abaixo
+do alvo (os dois métodos arredondam o resultado para 4 casas decimais, por
+isso o alvo padrão é 1e-3).
+
+Uso:
+    python benchmarks/bench_integracao_adaptativa.py [erro_alvo]
+"""
+
+import math
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.integracao import trapezio, simpson13, gauss_kronrod
+
+
+# (nome, f, inicio, final, valor exato)
+INTEGRANDOS = [
+    ("sin(x)", np.sin, 0, math.pi, 2.0),
+    ("sqrt(x)", np.sqrt, 0, 1, 2 / 3),
+    ("pico em 0.3", lambda x: 1 / (1e-4 + (x - 0.3)**2), 0, 1,
+     (math.atan(0.7 / 1e-2) + math.atan(0.3 / 1e-2)) / 1e-2),
+    ("exp(-100 x²)", lambda x: np.exp(-100 * x**2), -5, 5, math.sqrt(math.pi / 100)),
+]
+
+
+def malha_uniforme(metodo, f, inicio, final, exato, erro_alvo):
+    n = 2
+    inicio_tempo = time.perf_counter()
+    while abs(metodo(f, inicio, final, n) - exato) > erro_alvo:
+        n *= 2
+    return n + 1, time.perf_counter() - inicio_tempo
+
+
+def main():
+    erro_alvo = float(sys.argv[1]) if len(sys.argv) > 1 else 1e-3
+
+    print(f"{'integrando':<16}{'método':<16}{'avaliações':>12}{'tempo (s)':>12}{'erro':>12}")
+    for nome, f, inicio, final, exato in INTEGRANDOS:
+        for metodo in (trapezio, simpson13):
+            avaliacoes, tempo = malha_uniforme(metodo, f, inicio, final, exato, erro_alvo)
+            erro = abs(metodo(f, inicio, final, avaliacoes - 1) - exato)
+            print(f"{nome:<16}{metodo.__name__:<16}{avaliacoes:>12}{tempo:>12.4f}{erro:>12.1e}")
+
+        inicio_tempo = time.perf_counter()
+        resultado = gauss_kronrod(f, inicio, final, tol_abs=erro_alvo, tol_rel=0)
+        tempo = time.perf_counter() - inicio_tempo
+        erro = abs(resultado.valor - exato)
+        print(f"{nome:<16}{'gauss_kronrod':<16}{resultado.avaliacoes:>12}{tempo:>12.4f}{erro:>12.1e}")
+
+
+if __name__ == "__main__":
+    main()
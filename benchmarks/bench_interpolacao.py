@@ -0,0 +1,79 @@
+"""
+Benchmark da avaliação de lin_interp: tempo por chamada escalar com busca
+binária, para tabelas de 10 a 10^6 nós, comparado com a varredura linear
+usada antes (O(n) por chamada), e tempo para reamostrar um array de pontos
+de uma vez, comparado com np.interp.
+
+Uso:
+    python benchmarks/bench_interpolacao.py [nos_max] [nos_max_varredura] [pontos]
+
+Por padrão a tabela vai até 10^6 nós, a varredura linear até 10^4 e a
+reamostragem usa 10^7 pontos.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import lin_interp
+
+
+def varredura_linear(x, y):
+    """Avaliação anterior de lin_interp: percorre todos os nós a cada chamada."""
+    def f(x1):
+        for i in range(1, len(x)):
+            if x[i] >= x1 >= x[i-1]:
+                return y[i-1] + (x1 - x[i-1]) * (y[i] - y[i-1]) / (x[i] - x[i-1])
+    return f
+
+
+def tempo_por_chamada(f, consultas):
+    inicio = time.perf_counter()
+    for t in consultas:
+        f(t)
+    return (time.perf_counter() - inicio) / len(consultas)
+
+
+def main():
+    nos_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    nos_max_varredura = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**4
+    pontos = int(float(sys.argv[3])) if len(sys.argv) > 3 else 10**7
+
+    rng = np.random.default_rng(0)
+    consultas = rng.random(10**4).tolist()
+
+    print(f"{'nós':>10}{'construção (s)':>16}{'busca binária (µs)':>20}{'varredura (µs)':>16}")
+    n = 10
+    while n <= nos_max:
+        x = np.linspace(0, 1, n).tolist()
+        y = np.sin(10 * np.array(x)).tolist()
+
+        inicio = time.perf_counter()
+        f = lin_interp(x, y)
+        construcao = time.perf_counter() - inicio
+
+        t_busca = tempo_por_chamada(f, consultas) * 1e6
+        if n <= nos_max_varredura:
+            t_varredura = tempo_por_chamada(varredura_linear(x, y), consultas[:1000]) * 1e6
+            print(f"{n:>10.0e}{construcao:>16.4f}{t_busca:>20.2f}{t_varredura:>16.2f}")
+        else:
+            print(f"{n:>10.0e}{construcao:>16.4f}{t_busca:>20.2f}{'-':>16}")
+        n *= 10
+
+    x = np.linspace(0, 1, 10**4)
+    y = np.sin(10 * x)
+    f = lin_interp(list(x), list(y))
+    t = rng.random(pontos)
+
+    inicio = time.perf_counter()
+    f(t)
+    t_array = time.perf_counter() - inicio
+    inicio = time.perf_counter()
+    np.interp(t, x, y)
+    t_numpy = time.perf_counter() - inicio
+    print(f"\nreamostragem de {pontos:.0e} pontos: lin_interp {t_array:.3f} s, np.interp {t_numpy:.3f} s")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,62 @@
+"""
+Benchmark da interpolação de Chebyshev (cheb_interp): custo de construção
+com grau fixo (FFT, O(n log n)) comparado com os pesos baricêntricos de
+poly_interp (O(n^2)), e um aproximante de Chebyshev com grau escolhido
+automaticamente comparado com uma tabela de lin_interp para a mesma função.
+
+Uso:
+    python benchmarks/bench_interpolacao_chebyshev.py [pontos]
+
+Por padrão as avaliações usam 10^6 pontos.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import cheb_interp, lin_interp, poly_interp
+
+
+def f(x):
+    return np.exp(np.sin(3 * x)) / (1 + x**2)
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    pontos = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    a, b = 0.0, 10.0
+
+    print(f"{'grau':>8}{'cheb_interp (ms)':>18}{'poly_interp (ms)':>18}")
+    for n in (16, 64, 256, 1024, 4096, 16384):
+        _, t_cheb = cronometrar(cheb_interp, f, a, b, n=n)
+        nos = np.cos(np.pi * np.arange(n + 1) / n) * (b - a) / 2 + (a + b) / 2
+        if n <= 4096:
+            _, t_poly = cronometrar(poly_interp, list(nos), list(f(nos)))
+            print(f"{n:>8}{t_cheb * 1e3:>18.2f}{t_poly * 1e3:>18.2f}")
+        else:
+            print(f"{n:>8}{t_cheb * 1e3:>18.2f}{'-':>18}")
+
+    t = np.random.default_rng(0).uniform(a, b, pontos)
+    exato = f(t)
+
+    P, t_construcao = cronometrar(cheb_interp, f, a, b)
+    valores, t_avaliacao = cronometrar(P, t)
+    print(f"\nChebyshev adaptativo: grau {P.grau}, construção {t_construcao * 1e3:.2f} ms, "
+          f"avaliação {t_avaliacao:.3f} s, erro máximo {np.max(np.abs(valores - exato)):.1e}")
+
+    for nos in (5000, 50000):
+        x = np.linspace(a, b, nos)
+        L, t_construcao = cronometrar(lin_interp, list(x), list(f(x)))
+        valores, t_avaliacao = cronometrar(L, t)
+        print(f"lin_interp com {nos} nós: construção {t_construcao * 1e3:.2f} ms, "
+              f"avaliação {t_avaliacao:.3f} s, erro máximo {np.max(np.abs(valores - exato)):.1e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,64 @@
+"""
+Benchmark de hermite_interp: construção pelo sistema 2n x 2n na base de
+monômios (metodo='matriz') contra as diferenças divididas com nós
+repetidos (metodo='diferencas_divididas'), e o erro máximo de cada uma.
+
+Uso:
+    python benchmarks/bench_interpolacao_hermite.py [nos_max] [pontos]
+
+Por padrão os nós vão de 10 a 500, em [-1, 1] e com f(x) = sin(3x), e o
+erro é medido em 10^4 pontos. Cada tamanho é medido com nós de Chebyshev
+e com nós igualmente espaçados: as diferenças divididas só mantêm a
+precisão nos primeiros.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import hermite_interp
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    nos_max = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+    pontos = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**4
+
+    t = np.linspace(-1, 1, pontos)
+    exato = np.sin(3 * t)
+    hermite_interp([0.0, 1.0], [0.0, 1.0], [1.0, 1.0], metodo='diferencas_divididas')  # aquecimento
+
+    distribuicoes = {
+        'Chebyshev': lambda n: np.cos(np.pi * (np.arange(n) + 0.5) / n),
+        'igual': lambda n: np.linspace(-1, 1, n),
+    }
+
+    print(f"{'nós':>6}{'espaçamento':>13}{'matriz (ms)':>14}{'erro matriz':>14}"
+          f"{'dif. divididas (ms)':>21}{'erro dif. div.':>16}{'avaliação (ms)':>16}")
+    for n in (10, 20, 50, 100, 200, 500):
+        if n > nos_max:
+            break
+        for nome, nos in distribuicoes.items():
+            x = list(nos(n))
+            y = list(np.sin(3 * np.array(x)))
+            dy = list(3 * np.cos(3 * np.array(x)))
+
+            with np.errstate(all='ignore'):
+                P, t_matriz = cronometrar(hermite_interp, x, y, dy, metodo='matriz')
+                erro_matriz = np.max(np.abs(P(t) - exato)) if P is not None else np.nan
+                Q, t_dd = cronometrar(hermite_interp, x, y, dy, metodo='diferencas_divididas')
+                valores, t_avaliacao = cronometrar(Q, t)
+                erro_dd = np.max(np.abs(valores - exato))
+
+            print(f"{n:>6}{nome:>13}{t_matriz * 1e3:>14.2f}{erro_matriz:>14.2e}"
+                  f"{t_dd * 1e3:>21.2f}{erro_dd:>16.2e}{t_avaliacao * 1e3:>16.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""
+Benchmark do InterpoladorNewton: tempo para adicionar pontos um a um e
+reavaliar o polinômio após cada ponto, comparado com reconstruir o
+polinômio do zero com poly_interp e vandermond_interp a cada ponto.
+
+Uso:
+    python benchmarks/bench_interpolacao_newton.py [pontos]
+
+Por padrão são adicionados 500 pontos de Chebyshev de exp(x), em ordem
+aleatória.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import InterpoladorNewton, poly_interp, vandermond_interp
+
+
+def main():
+    n = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+
+    rng = np.random.default_rng(0)
+    x = rng.permutation(np.cos(np.pi * (np.arange(n) + 0.5) / n))
+    y = np.exp(x)
+
+    inicio = time.perf_counter()
+    p = InterpoladorNewton()
+    for xi, yi in zip(x, y):
+        p.adicionar(xi, yi)
+        p(0.3)
+    t_newton = time.perf_counter() - inicio
+
+    tempos = {}
+    for metodo in (poly_interp, vandermond_interp):
+        inicio = time.perf_counter()
+        for k in range(1, n + 1):
+            metodo(list(x[:k]), list(y[:k]))(0.3)
+        tempos[metodo.__name__] = time.perf_counter() - inicio
+
+    print(f"{n} pontos adicionados um a um:")
+    print(f"  InterpoladorNewton     {t_newton:8.3f} s")
+    for nome, tempo in tempos.items():
+        print(f"  {nome:<22} {tempo:8.3f} s  ({tempo / t_newton:.0f}x)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+"""
+Benchmark da interpolação polinomial de Lagrange (poly_interp): tempo de
+construção e tempo por avaliação na forma baricêntrica, comparado com o
+produto direto dos fatores de Lagrange usado antes (O(n^2) por avaliação),
+e o maior erro de cada forma ao interpolar exp(x). Com muitos nós, os
+produtos da forma direta estouram e o resultado vira nan. Por fim, o tempo
+para reamostrar o polinômio em um array de pontos de uma só vez.
+
+Uso:
+    python benchmarks/bench_interpolacao_polinomial.py [nos_max] [pontos]
+
+Os nós são os pontos de Chebyshev em [-1, 1], de 10 a nos_max (padrão 2000),
+e a reamostragem usa 10^6 pontos.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import poly_interp
+
+
+def lagrange_direto(x, y):
+    """Avaliação anterior de poly_interp: um np.delete e um produto por nó."""
+    def P(t):
+        soma = 0
+        for j in range(len(x)):
+            outros = np.delete(x, j)
+            soma += y[j] * np.prod((t - outros) / (x[j] - outros))
+        return soma
+    return P
+
+
+def tempo_e_erro(P, consultas):
+    inicio = time.perf_counter()
+    valores = np.array([P(t) for t in consultas])
+    tempo = (time.perf_counter() - inicio) / len(consultas)
+    return tempo, np.max(np.abs(valores - np.exp(consultas)))
+
+
+def main():
+    nos_max = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pontos = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6
+
+    consultas = np.random.default_rng(0).uniform(-1, 1, 20)
+
+    print(f"{'nós':>8}{'construção (ms)':>18}{'baricêntrica (µs)':>20}{'direta (µs)':>14}"
+          f"{'aceleração':>12}{'erro baric.':>14}{'erro direta':>14}")
+    for n in (10, 50, 100, 200, 500, 1000, 2000, 5000):
+        if n > nos_max:
+            break
+        x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        y = np.exp(x)
+
+        inicio = time.perf_counter()
+        P = poly_interp(list(x), list(y))
+        construcao = (time.perf_counter() - inicio) * 1e3
+
+        t_bar, e_bar = tempo_e_erro(P, consultas)
+        with np.errstate(all='ignore'):
+            t_dir, e_dir = tempo_e_erro(lagrange_direto(x, y), consultas)
+        print(f"{n:>8}{construcao:>18.2f}{t_bar * 1e6:>20.1f}{t_dir * 1e6:>14.1f}"
+              f"{t_dir / t_bar:>11.0f}x{e_bar:>14.1e}{e_dir:>14.1e}")
+
+    t = np.random.default_rng(1).uniform(-1, 1, pontos)
+    print(f"\n{'nós':>8}{'array (s)':>12}{'laço escalar (s, estimado)':>30}")
+    for n in (10, 100, 1000):
+        x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        P = poly_interp(list(x), list(np.exp(x)))
+
+        inicio = time.perf_counter()
+        P(t)
+        t_array = time.perf_counter() - inicio
+        t_laco, _ = tempo_e_erro(P, t[:1000])
+        print(f"{n:>8}{t_array:>12.3f}{t_laco * pontos:>30.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,57 @@
+"""
+Benchmark de spline_interp e pchip_interp em tabelas grandes: tempo de
+construção (sistema tridiagonal pelo algoritmo de Thomas) para cada
+condição de contorno, tempo de avaliação e erro máximo, comparados com a
+interpolação linear (lin_interp).
+
+Uso:
+    python benchmarks/bench_interpolacao_spline.py [nos_max] [pontos]
+
+Por padrão os nós vão de 10^3 a 10^6 (f(x) = sin(x) em [0, 10]) e a
+avaliação usa 10^6 pontos aleatórios.
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import lin_interp, spline_interp, pchip_interp
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    nos_max = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**6
+    pontos = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**6
+
+    t = np.random.default_rng(0).uniform(0, 10, pontos)
+    exato = np.sin(t)
+
+    construtores = {
+        'linear': lambda x, y: lin_interp(x, y),
+        'natural': lambda x, y: spline_interp(x, y),
+        'fixada': lambda x, y: spline_interp(x, y, 'fixada', (np.cos(x[0]), np.cos(x[-1]))),
+        'not-a-knot': lambda x, y: spline_interp(x, y, 'not-a-knot'),
+        'pchip': lambda x, y: pchip_interp(x, y),
+    }
+
+    print(f"{'nós':>9}{'método':>12}{'construção (ms)':>17}{'avaliação (ms)':>16}{'erro máximo':>14}")
+    for n in (10**3, 10**4, 10**5, 10**6):
+        if n > nos_max:
+            break
+        x = np.linspace(0, 10, n)
+        y = np.sin(x)
+        for nome, construir in construtores.items():
+            f, t_construcao = cronometrar(construir, x, y)
+            valores, t_avaliacao = cronometrar(f, t)
+            erro = np.max(np.abs(valores - exato))
+            print(f"{n:>9}{nome:>12}{t_construcao * 1e3:>17.2f}{t_avaliacao * 1e3:>16.2f}{erro:>14.2e}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,83 @@
+"""
+Benchmark de vandermond_interp, com as etapas medidas separadamente:
+montagem da matriz de Vandermonde (laço duplo usado antes contra np.vander),
+resolução do sistema (np.linalg.solve contra Björck–Pereyra) e avaliação
+do polinômio retornado em um array de pontos (laço de Horner usado antes,
+np.polyval e Horner compensado).
+
+Uso:
+    python benchmarks/bench_interpolacao_vandermond.py [nos_max] [pontos]
+
+Por padrão os nós vão de 10 a 2000 e a avaliação usa 10^5 pontos. Só os
+tempos são medidos: com centenas de nós, os coeficientes na base de
+monômios perdem o sentido numérico (e as diferenças divididas estouram).
+"""
+
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.interpolacao import vandermond_interp
+from CB2325NumericaG1.interpolacao.interpolacao_polinomial_vandermond import _bjorck_pereyra
+
+
+def montagem_laco(x):
+    """Montagem anterior da matriz: laço duplo em Python."""
+    n = len(x)
+    matriz = np.ones([n, n])
+    for i in range(n):
+        for k in range(1, n):
+            matriz[i][k] = matriz[i][k-1] * x[i]
+    return matriz
+
+
+def horner_laco(coef, t):
+    """Avaliação anterior: Horner invertendo os coeficientes a cada chamada."""
+    y = 0
+    for a in coef[::-1]:
+        y = a + y * t
+    return y
+
+
+def cronometrar(funcao, *args, **kwargs):
+    inicio = time.perf_counter()
+    resultado = funcao(*args, **kwargs)
+    return resultado, time.perf_counter() - inicio
+
+
+def main():
+    nos_max = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+    pontos = int(float(sys.argv[2])) if len(sys.argv) > 2 else 10**5
+
+    t = np.random.default_rng(0).uniform(-1, 1, pontos)
+
+    print(f"{'nós':>6}{'laço (ms)':>12}{'np.vander (ms)':>16}{'solve (ms)':>12}"
+          f"{'Björck–Pereyra (ms)':>21}{'Horner laço (ms)':>18}{'polyval (ms)':>14}"
+          f"{'compensado (ms)':>17}")
+    for n in (10, 50, 100, 200, 500, 1000, 2000):
+        if n > nos_max:
+            break
+        x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+        y = np.exp(x)
+
+        _, t_laco = cronometrar(montagem_laco, x)
+        matriz, t_vander = cronometrar(np.vander, x, increasing=True)
+        coef, t_solve = cronometrar(np.linalg.solve, matriz, y)
+        with np.errstate(all='ignore'):
+            _, t_bp = cronometrar(_bjorck_pereyra, np.sort(x), y[np.argsort(x)])
+
+        P = vandermond_interp(list(x), list(y))
+        Q = vandermond_interp(list(x), list(y), horner_compensado=True)
+        with np.errstate(all='ignore'):
+            _, t_laco_horner = cronometrar(horner_laco, coef, t)
+            _, t_polyval = cronometrar(P, t)
+            _, t_compensado = cronometrar(Q, t)
+
+        print(f"{n:>6}{t_laco * 1e3:>12.2f}{t_vander * 1e3:>16.2f}{t_solve * 1e3:>12.2f}"
+              f"{t_bp * 1e3:>21.2f}{t_laco_horner * 1e3:>18.2f}{t_polyval * 1e3:>14.2f}"
+              f"{t_compensado * 1e3:>17.2f}")
+
+
+if __name__ == "__main__":
+    main()
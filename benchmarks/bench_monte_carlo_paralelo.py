@@ -0,0 +1,40 @@
+"""
+Benchmark de escalabilidade do Monte Carlo em vários processos: tempo e
+aceleração de monte_carlo_one_variable com 1 a N processos, para o mesmo
+número total de amostras.
+
+Uso:
+    python benchmarks/bench_monte_carlo_paralelo.py [n] [processos_max]
+
+Por padrão n = 10^8 e processos_max é o número de núcleos da máquina.
+"""
+
+import math
+import os
+import sys
+import time
+
+import numpy as np
+
+from CB2325NumericaG1.integracao import monte_carlo_one_variable
+
+
+def main():
+    n = int(float(sys.argv[1])) if len(sys.argv) > 1 else 10**8
+    processos_max = int(sys.argv[2]) if len(sys.argv) > 2 else os.cpu_count()
+
+    print(f"{'processos':>10}{'tempo (s)':>12}{'aceleração':>12}{'integral':>14}{'erro padrão':>14}")
+    tempo_serial = None
+    for processos in range(1, processos_max + 1):
+        inicio = time.perf_counter()
+        resultado = monte_carlo_one_variable(np.sin, 0, math.pi, n, semente=0,
+                                             full_output=True, processos=processos)
+        tempo = time.perf_counter() - inicio
+        if tempo_serial is None:
+            tempo_serial = tempo
+        print(f"{processos:>10}{tempo:>12.3f}{tempo_serial / tempo:>11.2f}x"
+              f"{resultado.valor:>14.6f}{resultado.erro:>14.2e}")
+
+
+if __name__ == "__main__":
+    main()
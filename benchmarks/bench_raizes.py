@@ -0,0 +1,45 @@
+"""
+Benchmark dos métodos de raízes com intervalo: número de avaliações da
+função gastas pela Bisseção e pelo método de Brent.
+
+Uso:
+    python benchmarks/bench_raizes.py
+"""
+
+import numpy as np
+
+from CB2325NumericaG1.raizes import bissecao, brent
+
+
+def contar_avaliacoes(f):
+    """Envolve f em uma função que conta quantas vezes foi chamada."""
+    def g(x):
+        g.avaliacoes += 1
+        return f(x)
+    g.avaliacoes = 0
+    return g
+
+
+# Funções e intervalos usados em tests/test_raizes.py, mais um polinômio clássico
+CASOS = [
+    ("sin(x) em [1, 6]", lambda x: np.sin(x), 1, 6, 1e-7),
+    ("exp(x) - 2 em [0, 1]", lambda x: np.exp(x) - 2, 0, 1, 1e-8),
+    ("x^3 - 2x - 5 em [2, 3]", lambda x: x**3 - 2*x - 5, 2, 3, 1e-12),
+]
+
+
+def main():
+    print(f"{'função':<25}{'tolerância':>12}{'bisseção':>12}{'brent':>10}{'economia':>12}")
+    for nome, f, a, b, tol in CASOS:
+        f_bis = contar_avaliacoes(f)
+        bissecao(f_bis, a, b, tol)
+
+        f_brent = contar_avaliacoes(f)
+        brent(f_brent, a, b, tol)
+
+        economia = 1 - f_brent.avaliacoes / f_bis.avaliacoes
+        print(f"{nome:<25}{tol:>12.0e}{f_bis.avaliacoes:>12}{f_brent.avaliacoes:>10}{economia:>12.0%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,3 +1,4 @@
+from . import cache
 from . import aproximacao
 from . import interpolacao
 from . import erros
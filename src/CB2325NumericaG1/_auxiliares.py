@@ -0,0 +1,28 @@
+import numpy as np
+from typing import Callable
+
+
+def _avaliar_vetorizado(f: Callable, *args: np.ndarray) -> np.ndarray:
+    """
+    Função interna - Avalia f sobre arrays, com alternativa ponto a ponto.
+
+    Primeiro tenta chamar f uma única vez com os arrays inteiros. Se f não
+    aceitar arrays (lança uma exceção) ou não devolver um array do mesmo
+    formato da entrada (ex.: lambda x: 5), avalia f elemento a elemento.
+
+    Args:
+        f (Callable): Função a ser avaliada.
+        *args (np.ndarray): Arrays de mesmo formato com os argumentos de f.
+
+    Returns:
+        np.ndarray: Array de floats com os valores de f, no formato de args[0].
+    """
+    try:
+        y = np.asarray(f(*args), dtype=float)
+        if y.shape == args[0].shape:
+            return y
+    except Exception:
+        pass
+
+    valores = (f(*pontos) for pontos in zip(*(a.ravel() for a in args)))
+    return np.fromiter(valores, dtype=float, count=args[0].size).reshape(args[0].shape)
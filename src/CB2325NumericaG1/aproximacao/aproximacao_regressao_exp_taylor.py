@@ -1,13 +1,19 @@
 # Python 3
+from __future__ import annotations
 
 # Bibliotecas padrão.
 import math
+from typing import TYPE_CHECKING
 
 # Bibliotecas de terceiros.
 import numpy as np
 import numpy.typing as npt
-import sympy as sp
-import matplotlib.pyplot as plt
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+# Módulos do pacote.
+from ..cache import lambdify_cache, derivada_cache
 
 ## Funções polinomiais de aproximação.
 
@@ -69,6 +75,8 @@ def regressao(dados_x: npt.ArrayLike, dados_y: npt.ArrayLike, grau: int, plot: b
     coeficientes, restos, rank, singulares = np.linalg.lstsq(A, dados_y, rcond=None)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         # Gera pontos para a linha de ajuste
         x_fit = np.linspace(dados_x.min(), dados_x.max(), 500)
         
@@ -150,6 +158,8 @@ def _regressao_linear(x: npt.ArrayLike, y: npt.ArrayLike, plot: bool = False) ->
     b = y_media - (a * x_media)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         print(f"Coeficientes encontrados:")
         print(f"Inclinação (a): {a:.4f}")
         print(f"Intercepto (b): {b:.4f}")
@@ -244,6 +254,8 @@ def regressao_logaritmica(x: npt.ArrayLike, y: npt.ArrayLike, plot: bool = False
     a, b = _regressao_linear(log_x, y)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         print(f"Coeficientes encontrados:")
         print(f"a: {a:.4f}")
         print(f"b: {b:.4f}")
@@ -318,6 +330,8 @@ def polinomio_de_taylor(function: sp.Expr, x_symbol: sp.Symbol, point: float, ti
         - O plot (opcional) mostra a função e a aproximação de Taylor.
     """
 
+    import sympy as sp
+
     # Inicia o polinômio, iremos adicionar os termos aqui depois.
     f_poly = 0
 
@@ -325,7 +339,7 @@ def polinomio_de_taylor(function: sp.Expr, x_symbol: sp.Symbol, point: float, ti
     for i in range(times):
             
             # Calcula a i-ésima derivada simbólica (f"'(x)).
-            derivada_i_simbolica = sp.diff(function, x_symbol, i)
+            derivada_i_simbolica = derivada_cache(function, x_symbol, i)
             
             # Avalia a derivada no ponto 'a'.
             derivada_no_ponto = derivada_i_simbolica.subs(x_symbol, point)
@@ -343,12 +357,14 @@ def polinomio_de_taylor(function: sp.Expr, x_symbol: sp.Symbol, point: float, ti
     print(f_poly)
     
     if plot:
+        import matplotlib.pyplot as plt
+
         print("\nGerando gráfico de comparação.")
         
         # Convertendo expressões simbólicas em funções numéricas.
         # 'numpy' é usado para permitir que as funções lidem com arrays do numpy.
-        f_original_num = sp.lambdify(x_symbol, function, 'numpy')
-        f_poly_num = sp.lambdify(x_symbol, f_poly, 'numpy')
+        f_original_num = lambdify_cache(x_symbol, function)
+        f_poly_num = lambdify_cache(x_symbol, f_poly)
 
         # Definindo o intervalo de plotagem.
         # O np.linspace cria um array de pontos uniformemente espaçados.
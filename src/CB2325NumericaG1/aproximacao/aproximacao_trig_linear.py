@@ -1,5 +1,4 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import List, Tuple
 import numpy.typing as npt
 
@@ -73,6 +72,8 @@ def ajuste_linear(x: npt.ArrayLike, y: npt.ArrayLike, plot: bool = False) -> tup
     b = y_mean - (a * x_mean)
 
     if plot:
+        import matplotlib.pyplot as plt
+
         # Gerar pontos para a reta ajustada
         x_line = np.linspace(np.min(x_arr), np.max(x_arr), 100)
         y_line = a * x_line + b
@@ -144,6 +145,8 @@ def ajuste_trigonometrico(x: List[float], y: List[float], periodo: float, plot:
     c0, c1, c2 = coeficientes
 
     if plot:
+        import matplotlib.pyplot as plt
+
         plt.figure(figsize=(10, 6))
         # Pontos originais
         plt.scatter(x_arr, y_arr, color='red', label='Pontos Reais (Dados)')
@@ -0,0 +1 @@
+from .cache_sympy import lambdify_cache, derivada_cache, info_cache, limpar_cache, configurar_cache
@@ -0,0 +1,166 @@
+from __future__ import annotations
+
+import threading
+from collections import OrderedDict, namedtuple
+from typing import TYPE_CHECKING, Any, Callable, Hashable, Iterable
+
+if TYPE_CHECKING:
+    import sympy as sp
+
+InfoCache = namedtuple("InfoCache", ["acertos", "falhas", "tamanho_maximo", "tamanho_atual"])
+
+_TAMANHO_PADRAO = 256
+
+_entradas: OrderedDict = OrderedDict()
+_tamanho_maximo = _TAMANHO_PADRAO
+_acertos = 0
+_falhas = 0
+_trava = threading.RLock()
+
+
+def _buscar_ou_calcular(chave: Hashable, calcular: Callable[[], Any]) -> Any:
+    """
+    Função interna - Busca uma entrada no cache ou a calcula e armazena.
+
+    As entradas seguem a política LRU: cada acesso move a entrada para o
+    fim da fila e, quando o cache passa do tamanho máximo, a entrada usada
+    há mais tempo é descartada.
+
+    Args:
+        chave (Hashable): Chave da entrada.
+        calcular (Callable[[], Any]): Função chamada em caso de falha.
+
+    Returns:
+        Any: O valor armazenado para a chave.
+    """
+    global _acertos, _falhas
+
+    with _trava:
+        if chave in _entradas:
+            _acertos += 1
+            _entradas.move_to_end(chave)
+            return _entradas[chave]
+        _falhas += 1
+
+    valor = calcular()
+
+    with _trava:
+        if _tamanho_maximo > 0:
+            _entradas[chave] = valor
+            _entradas.move_to_end(chave)
+            while len(_entradas) > _tamanho_maximo:
+                _entradas.popitem(last=False)
+
+    return valor
+
+
+def lambdify_cache(simbolos: sp.Basic | Iterable[sp.Basic], expr: sp.Basic, modules: str = 'numpy') -> Callable:
+    """
+    Versão com cache de sp.lambdify.
+
+    A chave do cache é formada pela própria expressão e pelos símbolos, que
+    no SymPy têm hash e igualdade estruturais. Assim, duas expressões
+    construídas separadamente, mas idênticas, reutilizam a mesma função
+    compilada.
+
+    Args:
+        simbolos (sp.Basic | Iterable[sp.Basic]):
+            Símbolo ou sequência de símbolos que serão os argumentos da função.
+        expr (sp.Basic):
+            Expressão a ser compilada.
+        modules (str = 'numpy'):
+            Módulo numérico repassado para sp.lambdify.
+
+    Returns:
+        Callable:
+            Função numérica equivalente a sp.lambdify(simbolos, expr, modules).
+    """
+
+    import sympy as sp
+
+    if isinstance(simbolos, sp.Basic):
+        chave_simbolos = simbolos
+    else:
+        chave_simbolos = tuple(simbolos)
+
+    chave = ("lambdify", chave_simbolos, expr, modules)
+    return _buscar_ou_calcular(chave, lambda: sp.lambdify(chave_simbolos, expr, modules))
+
+
+def derivada_cache(expr: sp.Basic, simbolo: sp.Symbol, ordem: int = 1) -> sp.Basic:
+    """
+    Versão com cache de sp.diff.
+
+    Args:
+        expr (sp.Basic):
+            Expressão a ser derivada.
+        simbolo (sp.Symbol):
+            Símbolo em relação ao qual a derivada é calculada.
+        ordem (int = 1):
+            Ordem da derivada.
+
+    Returns:
+        sp.Basic:
+            A expressão equivalente a sp.diff(expr, simbolo, ordem).
+    """
+
+    import sympy as sp
+
+    chave = ("diff", expr, simbolo, ordem)
+    return _buscar_ou_calcular(chave, lambda: sp.diff(expr, simbolo, ordem))
+
+
+def info_cache() -> InfoCache:
+    """
+    Retorna as estatísticas do cache.
+
+    Returns:
+        InfoCache:
+            Tupla nomeada com os campos acertos, falhas, tamanho_maximo e
+            tamanho_atual.
+    """
+
+    with _trava:
+        return InfoCache(_acertos, _falhas, _tamanho_maximo, len(_entradas))
+
+
+def limpar_cache() -> None:
+    """
+    Remove todas as entradas do cache e zera os contadores de acertos e falhas.
+    """
+    global _acertos, _falhas
+
+    with _trava:
+        _entradas.clear()
+        _acertos = 0
+        _falhas = 0
+
+
+def configurar_cache(tamanho_maximo: int) -> None:
+    """
+    Define o número máximo de entradas do cache.
+
+    Se o novo tamanho for menor que o número atual de entradas, as entradas
+    usadas há mais tempo são descartadas. Com tamanho 0 o cache é desativado.
+
+    Args:
+        tamanho_maximo (int):
+            Número máximo de entradas armazenadas.
+
+    Raises:
+        ValueError:
+            Se tamanho_maximo for negativo.
+        TypeError:
+            Se tamanho_maximo não for um inteiro.
+    """
+    global _tamanho_maximo
+
+    if type(tamanho_maximo) != int:
+        raise TypeError("O argumento 'tamanho_maximo' deve ser um inteiro.")
+    if tamanho_maximo < 0:
+        raise ValueError("O argumento 'tamanho_maximo' não pode ser negativo.")
+
+    with _trava:
+        _tamanho_maximo = tamanho_maximo
+        while len(_entradas) > _tamanho_maximo:
+            _entradas.popitem(last=False)
@@ -0,0 +1,153 @@
+import math
+import numpy as np
+from typing import Iterator
+
+
+# Amostradores aceitos pelos métodos de Monte Carlo.
+AMOSTRADORES = ("uniforme", "estratificado", "antitetico", "hipercubo_latino", "halton")
+
+# Amostradores cujo erro é estimado a partir de réplicas independentes.
+_POR_REPLICAS = ("estratificado", "hipercubo_latino", "halton")
+
+# Número mínimo de réplicas independentes usadas para estimar o erro.
+_MIN_REPLICAS = 10
+
+
+def _validar_amostrador(amostrador: str) -> None:
+    """
+    Função interna - Verifica se o amostrador é conhecido.
+
+    Raises:
+        ValueError: Se `amostrador` não estiver em AMOSTRADORES.
+    """
+    if amostrador not in AMOSTRADORES:
+        raise ValueError(f"O amostrador deve ser um de {', '.join(AMOSTRADORES)}.")
+
+
+def _tamanhos_dos_blocos(n: int, tamanho_bloco: int, amostrador: str) -> Iterator[int]:
+    """
+    Função interna - Divide as n amostras em blocos.
+
+    - uniforme: blocos de tamanho_bloco amostras (o último pode ser menor).
+    - antitetico: blocos de pares; o número de pares é ceil(n / 2).
+    - estratificado, hipercubo_latino e halton: pelo menos _MIN_REPLICAS
+      blocos de tamanhos quase iguais. Cada bloco é uma réplica independente
+      que cobre o domínio inteiro, e o erro é estimado pela dispersão das
+      médias das réplicas.
+
+    Args:
+        n (int): Número total de amostras.
+        tamanho_bloco (int): Número máximo de amostras por bloco.
+        amostrador (str): Nome do amostrador.
+
+    Os tamanhos são gerados sob demanda, para que a amostragem possa parar
+    antes de usar todas as n amostras.
+
+    Returns:
+        Iterator[int]: Tamanho de cada bloco (em pares, para o antitético).
+    """
+    if amostrador == "antitetico":
+        n, tamanho_bloco = math.ceil(n / 2), max(1, tamanho_bloco // 2)
+
+    if amostrador in _POR_REPLICAS:
+        replicas = min(n, max(_MIN_REPLICAS, math.ceil(n / tamanho_bloco)))
+        for i in range(replicas):
+            yield n // replicas + (i < n % replicas)
+        return
+
+    for comeco in range(0, n, tamanho_bloco):
+        yield min(tamanho_bloco, n - comeco)
+
+
+def _primos(d: int) -> list[int]:
+    """Função interna - Retorna os d primeiros números primos."""
+    primos = []
+    candidato = 2
+    while len(primos) < d:
+        if all(candidato % p for p in primos if p * p <= candidato):
+            primos.append(candidato)
+        candidato += 1
+    return primos
+
+
+def _radical_inverso(indices: np.ndarray, base: int) -> np.ndarray:
+    """
+    Função interna - Função radical inversa de van der Corput na base dada.
+
+    Espelha os dígitos de cada índice na base em torno da vírgula:
+    i = d_0 + d_1 b + d_2 b² + ... vira d_0 / b + d_1 / b² + ...
+    """
+    resultado = np.zeros(indices.shape)
+    fator = 1.0 / base
+    i = indices.copy()
+    while np.any(i > 0):
+        resultado += (i % base) * fator
+        i //= base
+        fator /= base
+    return resultado
+
+
+def _pontos_unitarios(amostrador: str, rng: np.random.Generator, m: int, d: int) -> np.ndarray:
+    """
+    Função interna - Gera um bloco de pontos no cubo unitário [0, 1)^d.
+
+    - uniforme: m pontos independentes.
+    - antitetico: m pontos u seguidos dos m pontos refletidos 1 - u.
+    - estratificado: o cubo é dividido em k^d células iguais, com k^d <= m,
+      e um ponto é sorteado em cada célula; os m - k^d pontos restantes são
+      uniformes no cubo inteiro.
+    - hipercubo_latino: em cada coordenada, os m pontos caem um em cada um
+      dos m intervalos [j/m, (j+1)/m), em ordem aleatória.
+    - halton: os m primeiros pontos da sequência de Halton (bases primas),
+      deslocados módulo 1 por um vetor aleatório (Cranley–Patterson), para
+      que cada bloco seja uma réplica independente e não viesada.
+
+    Args:
+        amostrador (str): Nome do amostrador.
+        rng (np.random.Generator): Gerador de números aleatórios.
+        m (int): Número de pontos (de pares, para o antitético).
+        d (int): Dimensão.
+
+    Returns:
+        np.ndarray: Array (m, d) de pontos (ou (2m, d), para o antitético).
+    """
+    if amostrador == "uniforme":
+        return rng.random((m, d))
+
+    if amostrador == "antitetico":
+        u = rng.random((m, d))
+        return np.concatenate([u, 1 - u])
+
+    if amostrador == "estratificado":
+        k = int(m ** (1 / d))
+        while (k + 1) ** d <= m:
+            k += 1
+        celulas = np.indices((k,) * d).reshape(d, -1).T
+        estratificados = (celulas + rng.random(celulas.shape)) / k
+        return np.concatenate([estratificados, rng.random((m - k**d, d))])
+
+    if amostrador == "hipercubo_latino":
+        permutacoes = rng.permuted(np.tile(np.arange(m), (d, 1)), axis=1).T
+        return (permutacoes + rng.random((m, d))) / m
+
+    pontos = np.column_stack([_radical_inverso(np.arange(1, m + 1), p) for p in _primos(d)])
+    return (pontos + rng.random(d)) % 1.0
+
+
+def _unidades_independentes(amostrador: str, valores: np.ndarray) -> np.ndarray:
+    """
+    Função interna - Reduz os valores de f de um bloco às unidades
+    independentes usadas para estimar a média e o erro padrão.
+
+    - uniforme: cada valor.
+    - antitetico: a média de cada par (f(u) + f(1 - u)) / 2.
+    - por réplicas: a média do bloco inteiro.
+    """
+    if amostrador == "uniforme":
+        return valores
+
+    if amostrador == "antitetico":
+        metade = valores.size // 2
+        return (valores[:metade] + valores[metade:]) / 2
+
+    return np.array([np.mean(valores)])
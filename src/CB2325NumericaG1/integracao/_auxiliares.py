@@ -0,0 +1,131 @@
+import numpy as np
+from typing import Callable
+
+from .._auxiliares import _avaliar_vetorizado
+
+
+def _avaliar_linhas(f: Callable, pontos: np.ndarray) -> np.ndarray:
+    """
+    Função interna - Avalia f em cada linha de um array (m, d) de pontos.
+
+    Primeiro tenta chamar f uma única vez com o array inteiro. Se f não
+    aceitar o array (lança uma exceção) ou não devolver um valor por linha,
+    avalia f linha a linha.
+
+    Args:
+        f (Callable): Função que recebe um ponto (array de d coordenadas) ou
+            um array (m, d) de pontos.
+        pontos (np.ndarray): Array (m, d) de pontos.
+
+    Returns:
+        np.ndarray: Array (m,) de floats com os valores de f.
+    """
+    try:
+        y = np.asarray(f(pontos), dtype=float)
+        if y.shape == pontos.shape[:1]:
+            return y
+    except Exception:
+        pass
+
+    return np.fromiter((f(linha) for linha in pontos), dtype=float, count=len(pontos))
+
+
+class _SomaCompensada:
+    """
+    Classe interna - Soma compensada de Kahan–Babuška (Neumaier).
+
+    Guarda, além da soma, o erro de arredondamento acumulado em cada adição,
+    de modo que o erro total não cresce com o número de parcelas.
+    """
+
+    def __init__(self):
+        self._soma = 0.0
+        self._compensacao = 0.0
+
+    def adicionar(self, valor: float) -> None:
+        """Adiciona uma parcela à soma."""
+        t = self._soma + valor
+        if abs(self._soma) >= abs(valor):
+            self._compensacao += (self._soma - t) + valor
+        else:
+            self._compensacao += (valor - t) + self._soma
+        self._soma = t
+
+    def total(self) -> float:
+        """Retorna o valor da soma."""
+        return self._soma + self._compensacao
+
+
+def _soma_ponderada_em_blocos(f: Callable, inicio: float, final: float, n: int,
+                              tamanho_bloco: int, pesos: Callable[[np.ndarray], np.ndarray]) -> float:
+    """
+    Função interna - Calcula sum(pesos(i) * f(x_i)) para i = 0, ..., n sem
+    guardar a malha inteira.
+
+    Os pontos x_i = inicio + i * (final - inicio) / n são gerados em blocos
+    de tamanho_bloco. Dentro de cada bloco a soma é feita pelo NumPy (soma
+    em pares) e as somas dos blocos são acumuladas com soma compensada.
+    Assim, a memória usada depende apenas do tamanho do bloco.
+
+    Args:
+        f (Callable): Função a ser integrada.
+        inicio (float): Limite inferior da integral.
+        final (float): Limite superior da integral.
+        n (int): Número de subintervalos.
+        tamanho_bloco (int): Número de pontos avaliados por bloco.
+        pesos (Callable[[np.ndarray], np.ndarray]): Peso de cada índice i.
+
+    Returns:
+        float: A soma ponderada dos valores de f na malha.
+    """
+    step = (final - inicio) / n
+    soma = _SomaCompensada()
+
+    for i0 in range(0, n + 1, tamanho_bloco):
+        idx = np.arange(i0, min(i0 + tamanho_bloco, n + 1))
+        x = inicio + idx * step
+        if idx[-1] == n:
+            x[-1] = final
+        y = _avaliar_vetorizado(f, x)
+        soma.adicionar(float(np.sum(pesos(idx) * y)))
+
+    return soma.total()
+
+
+class _EstatisticasAmostra:
+    """
+    Classe interna - Média e variância de uma amostra acumuladas em blocos.
+
+    Guarda o número de valores, a média e M2 (soma dos quadrados dos desvios
+    em relação à média). Cada bloco é resumido pelo NumPy e combinado com o
+    acumulado pela fórmula de Chan (versão em blocos do algoritmo de Welford),
+    que não sofre o cancelamento da fórmula soma dos quadrados - quadrado da soma.
+    """
+
+    def __init__(self):
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+
+    def combinar(self, n: int, media: float, m2: float) -> None:
+        """Combina com as estatísticas (n, media, m2) de outra amostra."""
+        if n == 0:
+            return
+        total = self.n + n
+        delta = media - self.media
+        self.media += delta * n / total
+        self.m2 += m2 + delta**2 * self.n * n / total
+        self.n = total
+
+    def adicionar_bloco(self, valores: np.ndarray) -> None:
+        """Adiciona um bloco de valores à amostra."""
+        if valores.size == 0:
+            return
+        media = float(np.mean(valores))
+        self.combinar(valores.size, media, float(np.sum((valores - media)**2)))
+
+    def erro_padrao(self) -> float:
+        """Retorna o erro padrão da média (infinito com menos de 2 valores)."""
+        if self.n < 2:
+            return float("inf")
+        return (self.m2 / (self.n - 1) / self.n) ** 0.5
@@ -0,0 +1,194 @@
+import heapq
+import math
+import numpy as np
+from typing import Callable
+
+from .._auxiliares import _avaliar_vetorizado
+from .integracao_resultado import ResultadoIntegral
+
+
+# Nós e pesos da regra de Gauss–Kronrod 7-15 em [-1, 1] (tabelas do QUADPACK).
+# Os nós de índice ímpar são também os nós da regra de Gauss de 7 pontos.
+_XGK = np.array([
+    0.991455371120812639206854697526329,
+    0.949107912342758524526189684047851,
+    0.864864423359769072789712788640926,
+    0.741531185599394439863864773280788,
+    0.586087235467691130294144845693013,
+    0.405845151377397166906606412076961,
+    0.207784955007898467600689403773245,
+    0.000000000000000000000000000000000,
+])
+_WGK = np.array([
+    0.022935322010529224963732008058970,
+    0.063092092629978553290700663189204,
+    0.104790010322250183839876322541518,
+    0.140653259715525918745189590510238,
+    0.169004726639267902826583426598550,
+    0.190350578064785409913256402421014,
+    0.204432940075298892414161999234649,
+    0.209482141084727828012999174891714,
+])
+_WG = np.array([
+    0.129484966168869693270611432679082,
+    0.279705391489276667901467771423780,
+    0.381830050505118944950369775488975,
+    0.417959183673469387755102040816327,
+])
+
+# Versões completas (15 pontos, de -1 a 1) dos nós e pesos.
+_NOS = np.concatenate([-_XGK[:-1], _XGK[::-1]])
+_PESOS_K = np.concatenate([_WGK[:-1], _WGK[::-1]])
+_PESOS_G = np.zeros(15)
+_PESOS_G[1:7:2] = _WG[:3]
+_PESOS_G[7] = _WG[3]
+_PESOS_G[9:15:2] = _WG[2::-1]
+
+
+def _gk15(f: Callable, a: np.ndarray, b: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Função interna - Aplica a regra de Gauss–Kronrod 7-15 em vários intervalos.
+
+    Todos os intervalos são avaliados com uma única chamada de f (quando f
+    aceita arrays).
+
+    Args:
+        f (Callable): Função a ser integrada.
+        a (np.ndarray): Limites inferiores dos intervalos.
+        b (np.ndarray): Limites superiores dos intervalos.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            A integral de Kronrod em cada intervalo e a estimativa do erro,
+            |Kronrod - Gauss|.
+    """
+    centro = (a + b) / 2
+    meia_largura = (b - a) / 2
+    x = centro[:, np.newaxis] + meia_largura[:, np.newaxis] * _NOS
+    y = _avaliar_vetorizado(f, x)
+
+    kronrod = meia_largura * (y @ _PESOS_K)
+    gauss = meia_largura * (y @ _PESOS_G)
+    return kronrod, np.abs(kronrod - gauss)
+
+
+def gauss_kronrod(
+    f : Callable[[float], float],
+    inicio : float,
+    final : float,
+    tol_abs : float = 1e-10,
+    tol_rel : float = 1e-10,
+    max_subintervalos : int = 1000,
+    plot : bool = False
+    ) -> ResultadoIntegral :
+
+    """
+    Calcula a integral aproximada de uma função com a regra adaptativa de Gauss–Kronrod 7-15.
+
+    Em cada subintervalo a integral é calculada com a regra de Kronrod de 15
+    pontos, e a diferença para a regra de Gauss de 7 pontos (que usa parte dos
+    mesmos pontos) estima o erro. O subintervalo com o maior erro estimado é
+    dividido ao meio até que o erro total fique abaixo de
+    max(tol_abs, tol_rel * |integral|). Assim, regiões suaves recebem poucos
+    pontos e picos recebem muitos, sem que seja preciso escolher `n`.
+
+    Args:
+        f (Callable[[float], float]):
+            Função a ser integrada. Se aceitar arrays do NumPy, cada passo é
+            feito com uma única chamada; caso contrário, é avaliada ponto a ponto.
+        inicio (float):
+            Limite inferior da integral.
+        final (float):
+            Limite superior da integral.
+        tol_abs (float, optional):
+            Tolerância absoluta para o erro estimado. Padrão é 1e-10.
+        tol_rel (float, optional):
+            Tolerância relativa para o erro estimado. Padrão é 1e-10.
+        max_subintervalos (int, optional):
+            Número máximo de subintervalos. Se for atingido, o resultado é
+            retornado com o erro estimado até então. Padrão é 1000.
+        plot (bool, optional):
+            Se `True`, exibe o gráfico da função e dos subintervalos usados.
+            Padrão é `False`.
+
+    Returns:
+        ResultadoIntegral:
+            O valor da integral (sem arredondamento), a estimativa do erro
+            absoluto e o número de avaliações da função.
+
+    Raises:
+        TypeError:
+            Se `f` não for uma função chamável.
+        ValueError:
+            Se as duas tolerâncias não forem positivas.
+            Se `max_subintervalos` for menor ou igual a zero.
+
+    Notes:
+        - O gráfico mostra a função original em vermelho e os limites dos
+          subintervalos em azul.
+    """
+
+    if not callable(f) :
+        raise TypeError("O argumento 'f' deve ser uma função chamável.")
+
+    if tol_abs <= 0 and tol_rel <= 0 :
+        raise ValueError("Pelo menos uma das tolerâncias deve ser maior do que 0.")
+
+    if max_subintervalos <= 0 :
+        raise ValueError("O número máximo de subintervalos deve ser maior do que 0.")
+
+    valor, erro = _gk15(f, np.array([float(inicio)]), np.array([float(final)]))
+    avaliacoes = 15
+
+    # Heap de subintervalos ordenado pelo maior erro: (-erro, a, b, valor).
+    subintervalos = [(-erro[0], float(inicio), float(final), valor[0])]
+    valor_total = valor[0]
+    erro_total = erro[0]
+
+    while erro_total > max(tol_abs, tol_rel * abs(valor_total)) and len(subintervalos) < max_subintervalos :
+        menos_erro, a, b, valor_ab = heapq.heappop(subintervalos)
+
+        # Divide o pior subintervalo ao meio e avalia as duas metades juntas.
+        meio = (a + b) / 2
+        if not min(a, b) < meio < max(a, b) :
+            # O subintervalo chegou ao limite da precisão de ponto flutuante.
+            heapq.heappush(subintervalos, (menos_erro, a, b, valor_ab))
+            break
+
+        valores, erros = _gk15(f, np.array([a, meio]), np.array([meio, b]))
+        avaliacoes += 30
+
+        heapq.heappush(subintervalos, (-erros[0], a, meio, valores[0]))
+        heapq.heappush(subintervalos, (-erros[1], meio, b, valores[1]))
+        valor_total += valores[0] + valores[1] - valor_ab
+        erro_total += erros[0] + erros[1] + menos_erro
+
+    # Soma final exata das contribuições, sem o arredondamento acumulado.
+    valor_total = math.fsum(s[3] for s in subintervalos)
+    erro_total = math.fsum(-s[0] for s in subintervalos)
+
+    if plot :
+        import matplotlib.pyplot as plt
+
+        x = np.linspace(inicio, final, 1000)
+        y = _avaliar_vetorizado(f, x)
+
+        # Plota os limites dos subintervalos.
+        limites = sorted({s[1] for s in subintervalos} | {s[2] for s in subintervalos})
+        for limite in limites :
+            plt.axvline(limite, color='blue', linewidth=0.5, alpha=0.5)
+
+        # Plota a função original em vermelho.
+        plt.plot(x, y, color = 'red', linewidth = 1, label = 'f(x)')
+
+        # Plota o eixo x.
+        plt.axhline(0, color='black', linewidth=1)
+
+        # Configuração do gráfico
+        plt.title(f"Integração adaptativa de Gauss–Kronrod\n{len(subintervalos)} subintervalos, integral ≈ {valor_total:.6g}")
+        plt.xlabel("x")
+        plt.ylabel("f(x)")
+        plt.legend()
+        plt.show()
+
+    return ResultadoIntegral(valor=valor_total, erro=erro_total, avaliacoes=avaliacoes)
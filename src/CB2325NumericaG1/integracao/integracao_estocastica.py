@@ -1,11 +1,341 @@
+import math
+import pickle
 import numpy as np
-import matplotlib.pyplot as plt
-from mpl_toolkits.mplot3d import Axes3D
-import random
+from concurrent.futures import ProcessPoolExecutor
 from typing import Callable
 
+from ._amostradores import _MIN_REPLICAS, _pontos_unitarios, _tamanhos_dos_blocos, _unidades_independentes, _validar_amostrador
+from .._auxiliares import _avaliar_vetorizado
+from ._auxiliares import _avaliar_linhas, _EstatisticasAmostra
+from .integracao_resultado import ResultadoIntegral
 
-def monte_carlo_one_variable(f: Callable[[float], float],inicio: float,final: float,n: int,plot: bool = False) -> float:
+
+# Número padrão de amostras geradas e avaliadas por vez.
+_TAMANHO_BLOCO = 100_000
+
+# Número máximo de amostras desenhadas no gráfico 3D.
+_MAX_PONTOS_PLOT = 2_000
+
+
+class _ArgumentosSeparados:
+    """
+    Classe interna - Adapta uma função f(x, y, ...) de argumentos separados
+    para a forma f(pontos) usada por monte_carlo_nd, com pontos (m, d).
+
+    É uma classe, e não uma função aninhada, para poder ser enviada a outros
+    processos com pickle.
+    """
+
+    def __init__(self, f: Callable):
+        self.f = f
+
+    def __call__(self, pontos: np.ndarray) -> np.ndarray:
+        return _avaliar_vetorizado(self.f, *pontos.T)
+
+
+class _CriterioParada:
+    """
+    Classe interna - Decide se a amostragem já atingiu o erro desejado.
+
+    A amostragem para quando o erro padrão da integral fica abaixo de
+    max(erro_alvo, tol_rel * |integral|). O critério só é verificado depois
+    de pelo menos _MIN_REPLICAS unidades independentes, para que a
+    estimativa da variância seja confiável.
+    """
+
+    def __init__(self, erro_alvo: float | None, tol_rel: float | None, volume_dominio: float):
+        self.erro_alvo = erro_alvo or 0.0
+        self.tol_rel = tol_rel or 0.0
+        self.volume_dominio = volume_dominio
+
+    def escalado(self, fator: float) -> "_CriterioParada":
+        """Retorna o critério com as duas tolerâncias multiplicadas por fator."""
+        return _CriterioParada(self.erro_alvo * fator, self.tol_rel * fator, self.volume_dominio)
+
+    def __call__(self, estatisticas: _EstatisticasAmostra) -> bool:
+        if estatisticas.n < _MIN_REPLICAS:
+            return False
+        erro = self.volume_dominio * estatisticas.erro_padrao()
+        alvo = max(self.erro_alvo, self.tol_rel * self.volume_dominio * abs(estatisticas.media))
+        return erro <= alvo
+
+
+def _amostrar_em_blocos(f: Callable, limites: list[tuple[float, float]], n: int,
+                        rng: np.random.Generator, tamanho_bloco: int,
+                        amostrador: str = "uniforme",
+                        parar: _CriterioParada | None = None) -> tuple[_EstatisticasAmostra, int, list[np.ndarray]]:
+    """
+    Função interna - Sorteia n pontos na caixa definida por limites, em
+    blocos, e acumula a média e a variância dos valores de f.
+
+    Args:
+        f (Callable): Função a ser integrada, que recebe um array (m, d) de pontos.
+        limites (list[tuple[float, float]]): Limites (inicio, final) de cada dimensão.
+        n (int): Número total de amostras.
+        rng (np.random.Generator): Gerador de números aleatórios.
+        tamanho_bloco (int): Número de amostras por bloco.
+        amostrador (str): Forma de sortear os pontos (ver _amostradores).
+        parar (_CriterioParada | None): Se dado, a amostragem termina no
+            primeiro bloco em que o critério é satisfeito.
+
+    Returns:
+        tuple[_EstatisticasAmostra, int, list[np.ndarray]]:
+            As estatísticas das unidades independentes (amostras, pares
+            antitéticos ou réplicas), o número de avaliações de f e os arrays
+            do primeiro bloco (coordenadas seguidas dos valores de f), usados
+            nos gráficos.
+    """
+    inicio = np.array([a for a, _ in limites], dtype=float)
+    largura = np.array([b - a for a, b in limites], dtype=float)
+
+    estatisticas = _EstatisticasAmostra()
+    avaliacoes = 0
+    primeiro_bloco = []
+
+    for m in _tamanhos_dos_blocos(n, tamanho_bloco, amostrador):
+        pontos = inicio + largura * _pontos_unitarios(amostrador, rng, m, len(limites))
+        valores = _avaliar_linhas(f, pontos)
+        estatisticas.adicionar_bloco(_unidades_independentes(amostrador, valores))
+        avaliacoes += valores.size
+
+        if not primeiro_bloco:
+            primeiro_bloco = list(pontos.T) + [valores]
+
+        if parar is not None and parar(estatisticas):
+            break
+
+    return estatisticas, avaliacoes, primeiro_bloco
+
+
+def _trabalho_monte_carlo(f: Callable, limites: list[tuple[float, float]], n: int,
+                          rng: np.random.Generator, tamanho_bloco: int,
+                          amostrador: str, parar: _CriterioParada | None) -> tuple[_EstatisticasAmostra, int, list[np.ndarray]]:
+    """
+    Função interna - Parte da amostragem executada em um processo separado.
+
+    Igual a _amostrar_em_blocos, mas devolve só as primeiras amostras do
+    primeiro bloco, para não enviar o bloco inteiro de volta entre processos.
+    """
+    estatisticas, avaliacoes, primeiro_bloco = _amostrar_em_blocos(f, limites, n, rng, tamanho_bloco, amostrador, parar)
+    return estatisticas, avaliacoes, [a[:_MAX_PONTOS_PLOT] for a in primeiro_bloco]
+
+
+def _geradores_independentes(semente: int | np.random.Generator | None,
+                             processos: int) -> list[np.random.Generator]:
+    """
+    Função interna - Cria um gerador independente para cada processo.
+
+    Os geradores vêm de SeedSequence.spawn, disponível em todas as versões
+    do NumPy suportadas (Generator.spawn só existe a partir do NumPy 1.25).
+    Para uma semente inteira ou None, a SeedSequence é criada diretamente a
+    partir dela; para um gerador, a partir de inteiros sorteados por ele.
+
+    Args:
+        semente (int | np.random.Generator | None): Semente ou gerador do NumPy.
+        processos (int): Número de geradores.
+
+    Returns:
+        list[np.random.Generator]: Um gerador por processo.
+    """
+    if isinstance(semente, np.random.Generator):
+        sequencia = np.random.SeedSequence(semente.integers(0, 2**63, size=4).tolist())
+    else:
+        sequencia = np.random.SeedSequence(semente)
+    return [np.random.default_rng(filha) for filha in sequencia.spawn(processos)]
+
+
+def _estimar(f: Callable, limites: list[tuple[float, float]], n: int,
+             semente: int | np.random.Generator | None, tamanho_bloco: int,
+             processos: int | None, amostrador: str, erro_alvo: float | None = None,
+             tol_rel: float | None = None) -> tuple[_EstatisticasAmostra, int, list[np.ndarray]]:
+    """
+    Função interna - Executa a amostragem em um processo ou dividida entre vários.
+
+    No modo paralelo, as n amostras são divididas entre os processos e cada
+    um recebe um gerador próprio, criado com SeedSequence.spawn (ver
+    _geradores_independentes), de modo que as sequências são independentes. As
+    estatísticas parciais são combinadas sempre na mesma ordem, então o
+    resultado é reproduzível para uma semente e um número de processos fixos.
+
+    Com erro_alvo ou tol_rel, cada processo para ao atingir a tolerância
+    multiplicada por sqrt(processos), já que o erro padrão da combinação de
+    p estimativas independentes com o mesmo erro é esse erro / sqrt(p).
+
+    Args:
+        f (Callable): Função a ser integrada, que recebe um array (m, d) de pontos.
+        limites (list[tuple[float, float]]): Limites (inicio, final) de cada dimensão.
+        n (int): Número total de amostras.
+        semente (int | np.random.Generator | None): Semente ou gerador do NumPy.
+        tamanho_bloco (int): Número de amostras por bloco.
+        processos (int | None): Número de processos. None ou 1 executa no processo atual.
+        amostrador (str): Forma de sortear os pontos (ver _amostradores).
+        erro_alvo (float | None): Erro padrão desejado para a integral.
+        tol_rel (float | None): Erro padrão desejado, relativo à integral.
+
+    Returns:
+        tuple[_EstatisticasAmostra, int, list[np.ndarray]]:
+            As estatísticas das unidades independentes, o número de
+            avaliações de f e as amostras do primeiro bloco.
+    """
+    parar = None
+    if erro_alvo is not None or tol_rel is not None:
+        parar = _CriterioParada(erro_alvo, tol_rel, float(np.prod([abs(b - a) for a, b in limites])))
+
+    if processos is None or processos == 1:
+        rng = np.random.default_rng(semente)
+        return _amostrar_em_blocos(f, limites, n, rng, tamanho_bloco, amostrador, parar)
+
+    if parar is not None:
+        parar = parar.escalado(math.sqrt(processos))
+
+    geradores = _geradores_independentes(semente, processos)
+    partes = [n // processos + (i < n % processos) for i in range(processos)]
+
+    with ProcessPoolExecutor(max_workers=processos) as executor:
+        futuros = [executor.submit(_trabalho_monte_carlo, f, limites, parte, gerador, tamanho_bloco, amostrador, parar)
+                   for parte, gerador in zip(partes, geradores) if parte > 0]
+        resultados = [futuro.result() for futuro in futuros]
+
+    estatisticas = _EstatisticasAmostra()
+    for parcial, _, _ in resultados:
+        estatisticas.combinar(parcial.n, parcial.media, parcial.m2)
+
+    return estatisticas, sum(r[1] for r in resultados), resultados[0][2]
+
+
+def _validar_argumentos(f: Callable, n: int, tamanho_bloco: int, processos: int | None = None,
+                        amostrador: str = "uniforme", erro_alvo: float | None = None,
+                        tol_rel: float | None = None) -> None:
+    """
+    Função interna - Valida os argumentos comuns dos métodos de Monte Carlo.
+
+    Raises:
+        ValueError: Se `n`, `tamanho_bloco`, `processos`, `erro_alvo` ou
+            `tol_rel` forem menores ou iguais a zero, ou se o amostrador não
+            for conhecido.
+        TypeError: Se `f` não for uma função chamável, ou se não puder ser
+            enviada a outros processos quando `processos` > 1.
+    """
+    if n <= 0:
+        raise ValueError("O número de pontos 'n' deve ser maior do que 0.")
+
+    if tamanho_bloco <= 0:
+        raise ValueError("O tamanho do bloco deve ser maior do que 0.")
+
+    if processos is not None and processos <= 0:
+        raise ValueError("O número de processos deve ser maior do que 0.")
+
+    if (erro_alvo is not None and erro_alvo <= 0) or (tol_rel is not None and tol_rel <= 0):
+        raise ValueError("As tolerâncias 'erro_alvo' e 'tol_rel' devem ser maiores do que 0.")
+
+    _validar_amostrador(amostrador)
+
+    if not callable(f):
+        raise TypeError("O argumento 'f' deve ser uma função chamável.")
+
+    if processos is not None and processos > 1:
+        try:
+            pickle.dumps(f)
+        except Exception:
+            raise TypeError("Com 'processos' > 1, 'f' deve poder ser enviada a outros processos "
+                            "(por exemplo, uma função definida no nível do módulo, e não uma lambda).")
+
+
+def monte_carlo_nd(f: Callable[[np.ndarray], np.ndarray],limites: list[tuple[float, float]],n: int,
+                   semente: int | np.random.Generator | None = None,full_output: bool = False,
+                   tamanho_bloco: int = _TAMANHO_BLOCO,processos: int | None = None,
+                   amostrador: str = "uniforme",erro_alvo: float | None = None,
+                   tol_rel: float | None = None) -> float | ResultadoIntegral:
+    """
+    Calcula a integral aproximada de uma função de d variáveis sobre uma caixa
+    utilizando o método de Monte Carlo.
+
+    A caixa é o produto dos intervalos [inicio, final] de cada dimensão. As
+    amostras são geradas em blocos de 'tamanho_bloco' linhas, de modo que a
+    memória usada não depende de 'n'. monte_carlo_one_variable e
+    monte_carlo_two_variables usam este mesmo método.
+
+    Args:
+        f (Callable[[np.ndarray], np.ndarray]):
+            Função a ser integrada. Recebe um array (m, d), com um ponto por
+            linha, e deve retornar um array (m,) com os valores. Se não
+            aceitar esse array, é avaliada linha a linha, recebendo um array
+            de d coordenadas.
+        limites (list[tuple[float, float]]):
+            Limites (inicio, final) de cada uma das d dimensões.
+        n (int):
+            Número de pontos aleatórios (amostras) utilizados na aproximação.
+            Com 'erro_alvo' ou 'tol_rel', é o número máximo de amostras.
+        semente (int | np.random.Generator | None, optional):
+            Semente ou gerador do NumPy usado no sorteio. Padrão é None.
+        full_output (bool, optional):
+            Se True, retorna um ResultadoIntegral com o valor sem
+            arredondamento, o erro padrão e o número de avaliações (as
+            amostras realmente usadas, com 'erro_alvo' ou 'tol_rel').
+            Padrão é False.
+        tamanho_bloco (int, optional):
+            Número de pontos sorteados e avaliados por vez. Padrão é 100000.
+        processos (int | None, optional):
+            Número de processos entre os quais as amostras são divididas
+            (ver monte_carlo_one_variable). Padrão é None.
+        amostrador (str, optional):
+            Forma de sortear os pontos (ver monte_carlo_one_variable). Em
+            dimensões altas, o estratificado usa poucas células por eixo e
+            se aproxima do uniforme; o hipercubo latino e o Halton continuam
+            eficazes. Padrão é "uniforme".
+        erro_alvo (float | None, optional):
+            Se dado, a amostragem para assim que o erro padrão da integral
+            ficar abaixo deste valor, e 'n' passa a ser o número máximo de
+            amostras. O intervalo de 95% de confiança é de aproximadamente
+            ±1.96 erros padrão. Padrão é None.
+        tol_rel (float | None, optional):
+            Como 'erro_alvo', mas relativo ao valor da integral: para quando
+            erro padrão <= tol_rel * |integral|. Se os dois forem dados, vale
+            o menos exigente. Padrão é None.
+
+    Returns:
+        float | ResultadoIntegral:
+            Valor aproximado da integral, arredondado para 4 casas decimais,
+            ou um ResultadoIntegral se `full_output` for True.
+
+    Raises:
+        ValueError:
+            Se 'limites' não for uma lista não vazia de pares (inicio, final).
+            Se 'n', 'tamanho_bloco', 'processos', 'erro_alvo' ou 'tol_rel'
+            forem menores ou iguais a zero.
+            Se 'amostrador' não for um dos amostradores disponíveis.
+        TypeError:
+            Se 'f' não for uma função chamável, ou não puder ser serializada
+            quando 'processos' > 1.
+    """
+
+    try:
+        limites = [(float(inicio), float(final)) for inicio, final in limites]
+    except (TypeError, ValueError):
+        raise ValueError("Os limites devem ser uma lista de pares (inicio, final).")
+
+    if not limites:
+        raise ValueError("Os limites devem ter pelo menos uma dimensão.")
+
+    _validar_argumentos(f, n, tamanho_bloco, processos, amostrador, erro_alvo, tol_rel)
+
+    estatisticas, avaliacoes, _ = _estimar(f, limites, n, semente, tamanho_bloco, processos, amostrador,
+                                           erro_alvo, tol_rel)
+
+    volume_dominio = float(np.prod([abs(final - inicio) for inicio, final in limites]))
+    integral = volume_dominio * estatisticas.media
+
+    if full_output:
+        return ResultadoIntegral(valor=integral, erro=volume_dominio * estatisticas.erro_padrao(), avaliacoes=avaliacoes)
+
+    return round(integral, 4)
+
+
+def monte_carlo_one_variable(f: Callable[[float], float],inicio: float,final: float,n: int,plot: bool = False,
+                             semente: int | np.random.Generator | None = None,full_output: bool = False,
+                             tamanho_bloco: int = _TAMANHO_BLOCO,processos: int | None = None,
+                             amostrador: str = "uniforme",erro_alvo: float | None = None,
+                             tol_rel: float | None = None) -> float | ResultadoIntegral:
     """
     Calcula a integral aproximada de uma função univariada utilizando o método de Monte Carlo.
 
@@ -14,32 +344,78 @@ def monte_carlo_one_variable(f: Callable[[float], float],inicio: float,final: fl
 
     Args:
         f (Callable[[float], float]):
-            Função a ser integrada. Deve aceitar apenas um argumento escalar 'x'.
+            Função a ser integrada. Se aceitar arrays do NumPy, é avaliada uma
+            única vez por bloco de amostras; caso contrário, ponto a ponto.
         inicio (float):
             Limite inferior da integral.
         final (float):
             Limite superior da integral.
         n (int):
             Número de pontos aleatórios (amostras) utilizados na aproximação.
+            Com 'erro_alvo' ou 'tol_rel', é o número máximo de amostras.
         plot (bool, optional):
             Se True, exibe o gráfico da função e da área equivalente à integral.
             Padrão é False.
+        semente (int | np.random.Generator | None, optional):
+            Semente ou gerador do NumPy usado no sorteio. Com a mesma semente,
+            o resultado é sempre o mesmo. Padrão é None (semente aleatória).
+        full_output (bool, optional):
+            Se True, retorna um ResultadoIntegral com o valor sem
+            arredondamento, o erro padrão da estimativa e o número de
+            avaliações (as amostras realmente usadas, com 'erro_alvo' ou
+            'tol_rel'; com o amostrador antitético e 'n' ímpar, n + 1).
+            Padrão é False.
+        tamanho_bloco (int, optional):
+            Número de amostras sorteadas e avaliadas por vez. Limita a memória
+            usada. Padrão é 100000.
+        processos (int | None, optional):
+            Número de processos entre os quais as amostras são divididas. Cada
+            processo usa uma sequência aleatória independente, e o resultado
+            é reproduzível para a mesma semente e o mesmo número de processos
+            (mas difere do resultado com um só processo). Com mais de um
+            processo, 'f' deve poder ser serializada com pickle. Padrão é
+            None (um só processo).
+        amostrador (str, optional):
+            Forma de sortear os pontos, para reduzir a variância:
+            "uniforme" (pontos independentes), "estratificado" (um ponto em
+            cada célula de uma grade), "antitetico" (pares u e 1 - u, útil
+            para funções monótonas), "hipercubo_latino" ou "halton"
+            (sequência de baixa discrepância com deslocamento aleatório).
+            No estratificado, no hipercubo latino e no Halton, as amostras
+            são divididas em pelo menos 10 réplicas independentes, e o erro
+            padrão vem da dispersão das médias das réplicas. Padrão é
+            "uniforme".
+        erro_alvo (float | None, optional):
+            Se dado, a amostragem para assim que o erro padrão da integral
+            ficar abaixo deste valor, e 'n' passa a ser o número máximo de
+            amostras. O intervalo de 95% de confiança é de aproximadamente
+            ±1.96 erros padrão. Padrão é None.
+        tol_rel (float | None, optional):
+            Como 'erro_alvo', mas relativo ao valor da integral: para quando
+            erro padrão <= tol_rel * |integral|. Se os dois forem dados, vale
+            o menos exigente. Padrão é None.
 
     Returns:
-        float:
-            Valor aproximado da integral, arredondado para 4 casas decimais.
+        float | ResultadoIntegral:
+            Valor aproximado da integral, arredondado para 4 casas decimais,
+            ou um ResultadoIntegral se `full_output` for True.
 
-    Roots:
+    Raises:
         ValueError:
-            Se 'n' for menor ou igual a zero.
+            Se 'n', 'tamanho_bloco', 'processos', 'erro_alvo' ou 'tol_rel'
+            forem menores ou iguais a zero.
+            Se 'amostrador' não for um dos amostradores disponíveis.
         TypeError:
-            Se 'f' não for uma função chamável.
+            Se 'f' não for uma função chamável, ou não puder ser serializada
+            quando 'processos' > 1.
 
 
     Notes:
         - A função gera 'n' amostras uniformemente distribuídas no intervalo [inicio, final].
         - O resultado é uma estimativa estocástica da integral — portanto,
           valores diferentes de 'n' podem produzir pequenas variações nos resultados.
+          O erro padrão cai com 1/sqrt(n): para reduzi-lo à metade, é preciso
+          multiplicar 'n' por 4.
         - Se o parâmetro 'plot' for ativado, o gráfico exibirá:
             * A função f(x) em preto;
             * A média dos valores de f(x) (linha azul);
@@ -47,26 +423,21 @@ def monte_carlo_one_variable(f: Callable[[float], float],inicio: float,final: fl
             * A área sob a curva em verde.
     """
 
-    if n <= 0:
-        raise ValueError("O número de pontos 'n' deve ser maior do que 0.")
-
-    if not callable(f):
-        raise TypeError("O argumento 'f' deve ser uma função chamável.")
+    _validar_argumentos(f, n, tamanho_bloco, processos, amostrador, erro_alvo, tol_rel)
 
-    # Soma acumulada dos valores da função em pontos aleatórios
-    soma_valores = 0.0
-
-    for _ in range(n):
-        x_rand = random.uniform(inicio, final)
-        soma_valores += f(x_rand)
+    estatisticas, avaliacoes, _ = _estimar(_ArgumentosSeparados(f), [(inicio, final)], n, semente,
+                                           tamanho_bloco, processos, amostrador, erro_alvo, tol_rel)
 
     # Valor médio da função e cálculo da área estimada
-    media_f = soma_valores / n
-    area = abs(final - inicio) * media_f
+    media_f = estatisticas.media
+    comprimento = abs(final - inicio)
+    area = comprimento * media_f
 
     if plot:
+        import matplotlib.pyplot as plt
+
         xs = np.linspace(inicio, final, 400)
-        ys = np.array([f(x) for x in xs])
+        ys = _avaliar_vetorizado(f, xs)
         ys_media = np.full_like(xs, media_f)
 
         # Criação de dois subplots lado a lado
@@ -95,10 +466,17 @@ def monte_carlo_one_variable(f: Callable[[float], float],inicio: float,final: fl
         plt.tight_layout()
         plt.show()
 
+    if full_output:
+        return ResultadoIntegral(valor=area, erro=comprimento * estatisticas.erro_padrao(), avaliacoes=avaliacoes)
+
     return round(area, 4)
 
 
-def monte_carlo_two_variables(f: Callable[[float, float], float],inicio_x: float,final_x: float,inicio_y: float,final_y: float,n: int,plot: bool = False) -> float:
+def monte_carlo_two_variables(f: Callable[[float, float], float],inicio_x: float,final_x: float,inicio_y: float,final_y: float,n: int,plot: bool = False,
+                              semente: int | np.random.Generator | None = None,full_output: bool = False,
+                              tamanho_bloco: int = _TAMANHO_BLOCO,processos: int | None = None,
+                              amostrador: str = "uniforme",erro_alvo: float | None = None,
+                              tol_rel: float | None = None) -> float | ResultadoIntegral:
     """
     Calcula a integral dupla aproximada de uma função de duas variáveis
     utilizando o método de Monte Carlo.
@@ -109,6 +487,8 @@ def monte_carlo_two_variables(f: Callable[[float, float], float],inicio_x: float
     Args:
         f (Callable[[float, float], float]):
             Função a ser integrada. Deve aceitar dois argumentos 'x' e 'y'.
+            Se aceitar arrays do NumPy, é avaliada uma única vez por bloco de
+            amostras; caso contrário, ponto a ponto.
         inicio_x (float):
             Limite inferior no eixo x.
         final_x (float):
@@ -119,54 +499,89 @@ def monte_carlo_two_variables(f: Callable[[float, float], float],inicio_x: float
             Limite superior no eixo y.
         n (int):
             Número de pontos aleatórios (amostras) utilizados na aproximação.
+            Com 'erro_alvo' ou 'tol_rel', é o número máximo de amostras.
         plot(bool):
             Se 'True', exibe um gráfico 3D da superfície f(x, y)
             e dos pontos amostrados. Padrão é 'False'.
+        semente (int | np.random.Generator | None, optional):
+            Semente ou gerador do NumPy usado no sorteio. Com a mesma semente,
+            o resultado é sempre o mesmo. Padrão é None (semente aleatória).
+        full_output (bool, optional):
+            Se True, retorna um ResultadoIntegral com o valor sem
+            arredondamento, o erro padrão da estimativa e o número de
+            avaliações (as amostras realmente usadas, com 'erro_alvo' ou
+            'tol_rel'; com o amostrador antitético e 'n' ímpar, n + 1).
+            Padrão é False.
+        tamanho_bloco (int, optional):
+            Número de amostras sorteadas e avaliadas por vez. Limita a memória
+            usada. Padrão é 100000.
+        processos (int | None, optional):
+            Número de processos entre os quais as amostras são divididas. Cada
+            processo usa uma sequência aleatória independente, e o resultado
+            é reproduzível para a mesma semente e o mesmo número de processos
+            (mas difere do resultado com um só processo). Com mais de um
+            processo, 'f' deve poder ser serializada com pickle. Padrão é
+            None (um só processo).
+        amostrador (str, optional):
+            Forma de sortear os pontos, para reduzir a variância:
+            "uniforme" (pontos independentes), "estratificado" (um ponto em
+            cada célula de uma grade), "antitetico" (pares u e 1 - u, útil
+            para funções monótonas), "hipercubo_latino" ou "halton"
+            (sequência de baixa discrepância com deslocamento aleatório).
+            No estratificado, no hipercubo latino e no Halton, as amostras
+            são divididas em pelo menos 10 réplicas independentes, e o erro
+            padrão vem da dispersão das médias das réplicas. Padrão é
+            "uniforme".
+        erro_alvo (float | None, optional):
+            Se dado, a amostragem para assim que o erro padrão da integral
+            ficar abaixo deste valor, e 'n' passa a ser o número máximo de
+            amostras. O intervalo de 95% de confiança é de aproximadamente
+            ±1.96 erros padrão. Padrão é None.
+        tol_rel (float | None, optional):
+            Como 'erro_alvo', mas relativo ao valor da integral: para quando
+            erro padrão <= tol_rel * |integral|. Se os dois forem dados, vale
+            o menos exigente. Padrão é None.
 
     Returns:
-        float:
+        float | ResultadoIntegral:
             Valor aproximado da integral dupla (volume sob a superfície),
-            arredondado para 4 casas decimais.
+            arredondado para 4 casas decimais, ou um ResultadoIntegral se
+            `full_output` for True.
 
-    Roots:
+    Raises:
         ValueError:
-            Se 'n' for menor ou igual a zero.
+            Se 'n', 'tamanho_bloco', 'processos', 'erro_alvo' ou 'tol_rel'
+            forem menores ou iguais a zero.
+            Se 'amostrador' não for um dos amostradores disponíveis.
         TypeError:
-            Se 'f' não for uma função chamável.
+            Se 'f' não for uma função chamável, ou não puder ser serializada
+            quando 'processos' > 1.
+
+    Notes:
+        - O gráfico mostra no máximo 2000 amostras, tiradas do primeiro bloco.
     """
 
-    if n <= 0:
-        raise ValueError("O número de pontos 'n' deve ser maior do que 0.")
+    _validar_argumentos(f, n, tamanho_bloco, processos, amostrador, erro_alvo, tol_rel)
 
-    if not callable(f):
-        raise TypeError("O argumento 'f' deve ser uma função chamável.")
+    estatisticas, avaliacoes, primeiro_bloco = _estimar(
+        _ArgumentosSeparados(f), [(inicio_x, final_x), (inicio_y, final_y)], n, semente,
+        tamanho_bloco, processos, amostrador, erro_alvo, tol_rel)
 
-    soma_valores = 0.0
-    
-    #Vetores para plotagem 3D mais tarde.
-    pontos_x = []
-    pontos_y = []
-    pontos_z = []
-
-    # Determinação dos pontos para o cálculo da área.
-    for _ in range(n):
-        x_rand = random.uniform(inicio_x, final_x)
-        y_rand = random.uniform(inicio_y, final_y)
-        soma_valores += f(x_rand, y_rand)
-        pontos_x.append(x_rand)
-        pontos_y.append(y_rand)
-        pontos_z.append(f(x_rand,y_rand))
-
-    media_f = soma_valores / n
+    media_f = estatisticas.media
     area_dominio = abs(final_x - inicio_x) * abs(final_y - inicio_y)
     volume = media_f * area_dominio
     
     if plot:
+        import matplotlib.pyplot as plt
+
+        # Amostras do primeiro bloco, já avaliadas, para o gráfico.
+        pontos_x, pontos_y, pontos_z = (a[:_MAX_PONTOS_PLOT] for a in primeiro_bloco)
+
         # Cria uma malha regular para desenhar a superfície
         X = np.linspace(inicio_x, final_x, 50)
         Y = np.linspace(inicio_y, final_y, 50)
         X, Y = np.meshgrid(X, Y)
-        Z = f(X, Y)
+        Z = _avaliar_vetorizado(f, X, Y)
 
         fig = plt.figure(figsize=(10, 6))
         ax = fig.add_subplot(111, projection='3d')
@@ -191,8 +606,7 @@ def monte_carlo_two_variables(f: Callable[[float, float], float],inicio_x: float
         plt.tight_layout()
         plt.show()
 
-    return round(volume, 4)
-
-
-
+    if full_output:
+        return ResultadoIntegral(valor=volume, erro=area_dominio * estatisticas.erro_padrao(), avaliacoes=avaliacoes)
 
+    return round(volume, 4)
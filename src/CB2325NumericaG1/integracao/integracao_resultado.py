@@ -0,0 +1,20 @@
+from dataclasses import dataclass
+
+
+@dataclass
+class ResultadoIntegral:
+    """
+    Resultado detalhado de um método de integração.
+
+    Attributes:
+        valor (float):
+            Valor aproximado da integral.
+        erro (float):
+            Estimativa do erro absoluto da aproximação.
+        avaliacoes (int):
+            Número de avaliações da função.
+    """
+
+    valor: float
+    erro: float
+    avaliacoes: int
@@ -1,15 +1,35 @@
 
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Callable
 
+from .._auxiliares import _avaliar_vetorizado
+from ._auxiliares import _soma_ponderada_em_blocos
+
+
+def _validar_bloco(tamanho_bloco : int, plot : bool) -> None :
+
+    """
+    Função interna - Valida os argumentos do modo em blocos.
+
+    Raises:
+        ValueError:
+            Se `tamanho_bloco` for menor ou igual a zero ou se `plot` for `True`.
+    """
+
+    if tamanho_bloco <= 0 :
+        raise ValueError("O tamanho do bloco deve ser maior do que 0.")
+
+    if plot :
+        raise ValueError("O modo em blocos não pode ser usado junto com plot.")
+
 
 def trapezio(
     f : Callable[[float], float],
     inicio : float, 
     final : float, 
     n : int, 
-    plot : bool = False
+    plot : bool = False,
+    tamanho_bloco : int | None = None
     )-> float :
 
     """
@@ -20,7 +40,9 @@ def trapezio(
 
     Args:
         f (Callable[[float], float]): 
-            Função a ser integrada. Deve aceitar apenas um argumento escalar `x`.
+            Função a ser integrada. Deve aceitar apenas um argumento `x`.
+            Se aceitar arrays do NumPy, é avaliada uma única vez sobre todos
+            os pontos; caso contrário, é avaliada ponto a ponto.
         inicio (float): 
             Limite inferior da integral.
         final (float): 
@@ -30,6 +52,11 @@ def trapezio(
         plot (bool, optional): 
             Se `True`, exibe o gráfico da função e dos trapézios. 
             Padrão é `False`.
+        tamanho_bloco (int | None, optional):
+            Se informado, percorre o intervalo em blocos com esse número de
+            pontos, guardando apenas somas parciais (com soma compensada).
+            A memória usada passa a depender do bloco, e não de `n`.
+            Não pode ser usado junto com `plot`. Padrão é `None`.
 
     Returns:
         float: 
@@ -38,6 +65,7 @@ def trapezio(
     Raises:
         ValueError: 
             Se `n` for menor ou igual a zero.
+            Se `tamanho_bloco` for menor ou igual a zero ou usado com `plot`.
         TypeError:
             Se `f` não for uma função chamável.
 
@@ -56,17 +84,30 @@ def trapezio(
     if not callable(f) :
         raise TypeError("O argumento 'f' deve ser uma função chamável.")
 
+    if tamanho_bloco is not None :
+        _validar_bloco(tamanho_bloco, plot)
+
+        # Pesos da fórmula do trapézio: 1/2 nas pontas e 1 no interior.
+        def pesos(idx) :
+            w = np.ones(len(idx))
+            w[(idx == 0) | (idx == n)] = 0.5
+            return w
+
+        integral_total = (final - inicio) / n * _soma_ponderada_em_blocos(f, inicio, final, n, tamanho_bloco, pesos)
+        return round(integral_total, 4)
+
     # Lista de pontos no intervalo [inicio, final].
     x = np.linspace(inicio, final, n+1)
-    y = np.array([f(xi) for xi in x])
+    y = _avaliar_vetorizado(f, x)
 
     # Passo entre pontos.
     step = (final - inicio) / n
 
     # Aplica a fórmula do trápezio.
-    integral_total = step * (0.5*y[0] + sum(y[1:-1]) + 0.5*y[-1])
+    integral_total = step * (0.5*y[0] + np.sum(y[1:-1]) + 0.5*y[-1])
 
     if plot :
+        import matplotlib.pyplot as plt
 
         # Plota os trapézios.
         for i in range(n) :
@@ -102,7 +143,8 @@ def simpson13(
     inicio : float,
     final : float, 
     n : int, 
-    plot : bool = False
+    plot : bool = False,
+    tamanho_bloco : int | None = None
     ) -> float :
 
     """
@@ -113,7 +155,9 @@ def simpson13(
 
     Args:
         f (Callable[[float], float]): 
-            Função a ser integrada. Deve aceitar apenas um argumento escalar `x`.
+            Função a ser integrada. Deve aceitar apenas um argumento `x`.
+            Se aceitar arrays do NumPy, é avaliada uma única vez sobre todos
+            os pontos; caso contrário, é avaliada ponto a ponto.
         inicio (float): 
             Limite inferior da integral.
         final (float): 
@@ -123,6 +167,11 @@ def simpson13(
         plot (bool, optional): 
             Se `True`, exibe o gráfico da função e das parábolas de aproximação. 
             Padrão é `False`.
+        tamanho_bloco (int | None, optional):
+            Se informado, percorre o intervalo em blocos com esse número de
+            pontos, guardando apenas somas parciais (com soma compensada).
+            A memória usada passa a depender do bloco, e não de `n`.
+            Não pode ser usado junto com `plot`. Padrão é `None`.
 
     Returns:
         float: 
@@ -133,6 +182,7 @@ def simpson13(
             Se `f` não for uma função chamável.
         ValueError: 
             Se `n` não for par ou se for menor ou igual a zero.
+            Se `tamanho_bloco` for menor ou igual a zero ou usado com `plot`.
 
     Dependencies:
         - `numpy` (importado como `np`)
@@ -148,18 +198,32 @@ def simpson13(
 
     if n % 2 != 0 or n <= 0 :
         raise ValueError("O número de intervalos n deve um par maior do que 0.")
+
+    if tamanho_bloco is not None :
+        _validar_bloco(tamanho_bloco, plot)
+
+        # Pesos da fórmula de Simpson: 1 nas pontas, 4 nos ímpares e 2 nos pares.
+        def pesos(idx) :
+            w = np.where(idx % 2 == 1, 4.0, 2.0)
+            w[(idx == 0) | (idx == n)] = 1.0
+            return w
+
+        integral_total = (final - inicio) / n / 3 * _soma_ponderada_em_blocos(f, inicio, final, n, tamanho_bloco, pesos)
+        return round(integral_total, 4)
     
     x = np.linspace(inicio, final, n+1)
-    y = np.array([f(xi) for xi in x])
+    y = _avaliar_vetorizado(f, x)
 
     # Passo entre pontos.
     step = (final - inicio) / n
 
     # Aplica a fórmula do parábolas.
-    integral_total = y[0] + y[-1] + 4 * sum(y[1 : -1: 2]) + 2 * sum(y[2: -2: 2])
+    integral_total = y[0] + y[-1] + 4 * np.sum(y[1 : -1: 2]) + 2 * np.sum(y[2: -2: 2])
     integral_total *= step/3
 
     if plot :
+        import matplotlib.pyplot as plt
+
         # Plota as parábolas.
         for i in range(0, n, 2) :
             xi = x[i:i+3]
@@ -1,4 +1,7 @@
 from .interpolacao_polinomial_hermite import hermite_interp
 from .interpolacao_linear import lin_interp
 from .interpolacao_polinomial import poly_interp
-from .interpolacao_polinomial_vandermond import vandermond_interp
\ No newline at end of file
+from .interpolacao_polinomial_vandermond import vandermond_interp
+from .interpolacao_newton import InterpoladorNewton
+from .interpolacao_chebyshev import cheb_interp, InterpoladorChebyshev
+from .interpolacao_spline import spline_interp, pchip_interp
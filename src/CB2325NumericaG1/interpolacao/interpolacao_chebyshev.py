@@ -0,0 +1,270 @@
+import numpy as np
+from typing import Callable
+
+from .._auxiliares import _avaliar_vetorizado
+
+# Número de pontos avaliados por vez na recorrência de Clenshaw.
+_TAMANHO_BLOCO = 16384
+
+
+def _pontos_chebyshev(n: int, a: float, b: float) -> np.ndarray:
+    """Pontos de Chebyshev (extremos de T_n) levados ao intervalo [a, b].
+
+    São os n + 1 pontos x_k = cos(pi k / n), k = 0, ..., n, do maior para o
+    menor. Os pontos para n estão entre os pontos para 2n, o que permite
+    reaproveitar as avaliações ao dobrar o grau.
+
+    Args:
+        n: grau (número de pontos menos um).
+        a: limite inferior do intervalo.
+        b: limite superior do intervalo.
+
+    Returns:
+        Array com os n + 1 pontos.
+    """
+    if n == 0:
+        return np.array([(a + b) / 2])
+    t = np.cos(np.pi * np.arange(n + 1) / n)
+    return (a + b) / 2 + (b - a) / 2 * t
+
+
+def _coeficientes_chebyshev(valores: np.ndarray) -> np.ndarray:
+    """Coeficientes de Chebyshev a partir dos valores nos pontos de Chebyshev.
+
+    Calcula a DCT-I dos valores por meio de uma FFT real da sequência
+    estendida de forma par [v_0, ..., v_n, v_{n-1}, ..., v_1], em
+    O(n log n):
+
+        c_j = (2 / n) * sum''_{k} v_k cos(pi j k / n),
+
+    com os termos k = 0 e k = n pela metade, e c_0 e c_n também pela metade.
+
+    Args:
+        valores: valores v_0, ..., v_n da função nos pontos de
+            _pontos_chebyshev(n).
+
+    Returns:
+        Os coeficientes c_0, ..., c_n de P(x) = sum c_j T_j(x).
+    """
+    n = len(valores) - 1
+    if n == 0:
+        return valores.astype(float)
+
+    estendido = np.concatenate([valores, valores[-2:0:-1]])
+    coeficientes = np.fft.rfft(estendido).real / n
+    coeficientes[0] /= 2
+    coeficientes[n] /= 2
+    return coeficientes
+
+
+def _clenshaw(coeficientes: np.ndarray, t: np.ndarray) -> np.ndarray:
+    """Avalia sum c_j T_j(t) pela recorrência de Clenshaw.
+
+    b_k = c_k + 2 t b_{k+1} - b_{k+2}, e o resultado é c_0 + t b_1 - b_2.
+    Custa O(n) por ponto. Os pontos são processados em blocos de
+    _TAMANHO_BLOCO, com as contas feitas nos próprios arrays do bloco, que
+    assim cabem na memória cache durante as n iterações.
+
+    Args:
+        coeficientes: coeficientes c_0, ..., c_n.
+        t: array unidimensional de pontos em [-1, 1].
+
+    Returns:
+        Array com os valores em cada ponto.
+    """
+    resultado = np.empty(t.size)
+
+    for inicio in range(0, t.size, _TAMANHO_BLOCO):
+        bloco = t[inicio:inicio + _TAMANHO_BLOCO]
+        dois_t = 2 * bloco
+        b1 = np.zeros(bloco.size)
+        b2 = np.zeros(bloco.size)
+        auxiliar = np.empty(bloco.size)
+
+        for c in coeficientes[:0:-1]:
+            # auxiliar = c + 2 t b1 - b2 vira o novo b1; o antigo b1 vira b2
+            np.multiply(dois_t, b1, out=auxiliar)
+            auxiliar -= b2
+            auxiliar += c
+            b1, b2, auxiliar = auxiliar, b1, b2
+
+        resultado[inicio:inicio + _TAMANHO_BLOCO] = coeficientes[0] + bloco * b1 - b2
+
+    return resultado
+
+
+class InterpoladorChebyshev:
+    """Polinômio na base de Chebyshev em um intervalo [a, b].
+
+    P(x) = sum_{j=0}^{n} c_j T_j(t), com t = (2x - a - b) / (b - a).
+    Normalmente é criado por cheb_interp.
+
+    Args:
+        coeficientes: coeficientes c_0, ..., c_n.
+        a: limite inferior do intervalo.
+        b: limite superior do intervalo.
+    """
+
+    def __init__(self, coeficientes: np.ndarray, a: float = -1.0, b: float = 1.0):
+        self.coeficientes = np.asarray(coeficientes, dtype=float)
+        self.a = float(a)
+        self.b = float(b)
+
+    @property
+    def grau(self) -> int:
+        """Grau do polinômio (número de coeficientes menos um)."""
+        return len(self.coeficientes) - 1
+
+    def __call__(self, x: float | np.ndarray) -> float | np.ndarray:
+        """Avalia o polinômio pela recorrência de Clenshaw.
+
+        Aceita um número ou um array do NumPy de qualquer formato. Fora de
+        [a, b] o polinômio é extrapolado, o que em geral é pouco preciso.
+
+        Args:
+            x: ponto (ou array de pontos) de avaliação.
+
+        Returns:
+            O valor do polinômio em x, ou um array do mesmo formato de x.
+        """
+        escalar = np.ndim(x) == 0
+        x = np.asarray(x, dtype=float)
+        t = (2 * x - (self.a + self.b)) / (self.b - self.a)
+        resultado = _clenshaw(self.coeficientes, t.ravel()).reshape(x.shape)
+        return float(resultado[()]) if escalar else resultado
+
+
+def _plotar(P: InterpoladorChebyshev, f: Callable, titulo: str):
+    """Plotagem do interpolador de Chebyshev e da decaída dos coeficientes.
+
+    Função privada, auxiliar da função principal cheb_interp.
+
+    Args:
+        P: interpolador construído.
+        f: função interpolada.
+        titulo: título do gráfico.
+
+    Returns:
+        None
+    """
+    import matplotlib.pyplot as plt
+
+    x_points = np.linspace(P.a, P.b, 500)
+    x_nos = _pontos_chebyshev(P.grau, P.a, P.b)
+
+    _, (ax, ax_coef) = plt.subplots(1, 2, figsize=(12, 5))
+
+    ax.plot(x_points, P(x_points), 'b-', linewidth=2, label='Interpolação de Chebyshev')
+    ax.scatter(x_nos, _avaliar_vetorizado(f, x_nos), color='red', s=10, label='Pontos de Chebyshev')
+    ax.set_title(f'{titulo} - grau {P.grau}')
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+
+    ax_coef.semilogy(np.abs(P.coeficientes) + np.finfo(float).tiny, 'k.')
+    ax_coef.set_title('|c_j|')
+    ax_coef.set_xlabel('j')
+    ax_coef.grid(True, alpha=0.3)
+
+    plt.show()
+
+    return
+
+
+def cheb_interp(f: Callable,
+                a: float = -1.0,
+                b: float = 1.0,
+                n: int = None,
+                tol: float = 1e-14,
+                n_max: int = 2**16,
+                plot: bool = False) -> InterpoladorChebyshev:
+    """Interpolação de uma função nos pontos de Chebyshev.
+
+    Amostra f nos n + 1 pontos de Chebyshev de [a, b] e calcula os
+    coeficientes na base de Chebyshev por uma DCT feita com numpy.fft, em
+    O(n log n). Ao contrário de poly_interp e vandermond_interp, que
+    recebem os nós prontos, aqui os nós são escolhidos de forma que o
+    problema é bem condicionado mesmo com graus na casa das centenas ou
+    milhares.
+
+    Se 'n' não for dado, o grau é escolhido automaticamente: começa em 16
+    e é dobrado (reaproveitando as avaliações anteriores) até que os
+    coeficientes do último oitavo fiquem abaixo de tol vezes o maior
+    coeficiente. Então os coeficientes finais abaixo desse limite são
+    descartados.
+
+    Args:
+        f: função a ser interpolada. Se aceitar arrays do NumPy, é avaliada
+            uma única vez por grau testado; caso contrário, ponto a ponto.
+        a: limite inferior do intervalo.
+        b: limite superior do intervalo.
+        n: grau fixo do polinômio (opcional). Se dado, não há escolha
+            automática nem descarte de coeficientes.
+        tol: tolerância relativa para a decaída dos coeficientes.
+        n_max: grau máximo na escolha automática. Se for atingido sem
+            convergência, o polinômio de grau n_max é retornado.
+        plot: indica se deve haver a plotagem (True) ou não (False).
+
+    Returns:
+        InterpoladorChebyshev: polinômio interpolador, que pode ser chamado
+        com um número ou um array de pontos.
+
+    Raises:
+        TypeError: Caso 'f' não seja uma função (callable), ou caso 'plot'
+        não seja bool.
+        ValueError: Caso a >= b, caso 'n' seja negativo, ou caso 'tol' ou
+        'n_max' não sejam positivos.
+
+    Examples:
+        >>> P = cheb_interp(np.exp, 0, 1)
+        >>> P.grau
+        11
+    """
+    # Tratamento de erros
+    if not callable(f):
+        raise TypeError("O argumento 'f' deve ser uma função (callable).")
+    if type(plot) != bool:
+        raise TypeError("O argumento 'plot' deve ser bool")
+    if not a < b:
+        raise ValueError("O intervalo [a, b] deve ter a < b.")
+    if n is not None and n < 0:
+        raise ValueError("O grau 'n' não pode ser negativo.")
+    if tol <= 0 or n_max <= 0:
+        raise ValueError("Os argumentos 'tol' e 'n_max' devem ser positivos.")
+
+    if n is not None:
+        valores = _avaliar_vetorizado(f, _pontos_chebyshev(n, a, b))
+        P = InterpoladorChebyshev(_coeficientes_chebyshev(valores), a, b)
+    else:
+        grau = min(16, n_max)
+        valores = _avaliar_vetorizado(f, _pontos_chebyshev(grau, a, b))
+        while True:
+            coeficientes = _coeficientes_chebyshev(valores)
+            escala = np.max(np.abs(coeficientes))
+            limite = tol * escala
+            cauda = np.abs(coeficientes[grau - grau // 8:])
+            if escala == 0 or np.all(cauda <= limite) or grau >= n_max:
+                break
+
+            # Os pontos de grau 2n são os de grau n intercalados com os novos
+            novo_grau = min(2 * grau, n_max)
+            if novo_grau == 2 * grau:
+                novos = _pontos_chebyshev(novo_grau, a, b)[1::2]
+                intercalados = np.empty(novo_grau + 1)
+                intercalados[0::2] = valores
+                intercalados[1::2] = _avaliar_vetorizado(f, novos)
+                valores = intercalados
+            else:
+                valores = _avaliar_vetorizado(f, _pontos_chebyshev(novo_grau, a, b))
+            grau = novo_grau
+
+        # Descarta os coeficientes finais desprezíveis
+        significativos = np.flatnonzero(np.abs(coeficientes) > limite)
+        ultimo = significativos[-1] if significativos.size else 0
+        P = InterpoladorChebyshev(coeficientes[:ultimo + 1], a, b)
+
+    if plot:
+        _plotar(P, f, 'Interpolação de Chebyshev')
+
+    return P
@@ -1,5 +1,5 @@
-import matplotlib.pyplot as plt
 import numpy as np
+from bisect import bisect_right
 from typing import Callable
 
 def _ordenar_coordenadas(x: list, y: list) -> list:
@@ -46,9 +46,10 @@ def _plotar(x: list,
         None
     Raises:
     """
+    import matplotlib.pyplot as plt
     
     x_points = np.linspace(x[0], x[-1], 500)
-    y_points = [f(xp) for xp in x_points]
+    y_points = f(x_points)
 
     _, ax = plt.subplots()
     ax.scatter(x, y, color = 'red', label = 'Dados')
@@ -73,16 +74,23 @@ def lin_interp(x: list,
     É permitida extrapolação. Por fim, caso 'plot = True', há uma
     plotagem do gráfico correspondente.
 
+    As inclinações das retas são calculadas uma única vez, e f encontra o
+    intervalo de cada ponto por busca binária, em O(log n) por ponto. A
+    função f aceita um número ou um array do NumPy de qualquer formato; no
+    segundo caso, todos os pontos são avaliados de uma vez.
+
     Args:
         x: lista das coordenadas x, em x[i], de cada ponto i.
         y: lista das coordenadas y, em y[i], de cada ponto i.
         plot: indica se deve haver a plotagem (True) ou não (False).
 
     Returns:
-        f: função de interpolação linear por partes
+        f: função de interpolação linear por partes. Para um array de
+        pontos, retorna um array do mesmo formato.
     Raises:
         ValueError: Caso 'x' e 'y' tenham tamanhos diferentes, caso as listas
-        estejam vazias, ou caso as coordenadas em 'x' não sejam distintas.
+        estejam vazias ou tenham um único ponto, ou caso as coordenadas em 'x'
+        não sejam distintas.
         TypeError: caso 'x' ou 'y' não sejam listas, ou caso 'plot não seja bool'.
     """
     # Tratamento de erros
@@ -98,35 +106,35 @@ def lin_interp(x: list,
         raise ValueError("As listas de coordenadas x e y devem ter o mesmo tamanho.")
     if n == 0:
         raise ValueError("As listas x e y não podem estar vazias.")
+    if n == 1:
+        raise ValueError("São necessários pelo menos dois pontos para a interpolação.")
     if len(set(x)) != n:
         raise ValueError("As coordenadas x devem ser todas distintas.")
 
     # Ordenação das coordenadas x em ordem crescente
     x, y = _ordenar_coordenadas(x, y)
 
+    # Inclinação de cada reta, calculada uma única vez
+    inclinacoes = np.diff(y) / np.diff(x)
+
+    # Listas do Python são mais rápidas que arrays para bisect e indexação escalar
+    x_lista = x.tolist()
+    y_lista = y.tolist()
+    a_lista = inclinacoes.tolist()
+    ultimo = n - 2
+
     # Definição da função de interpolação
-    def f(x1: float) -> float:
-        if x1 < x[0]: # Caso fora do intervalo, continua a reta mais próxima
-            a = (y[1] - y[0])/(x[1] - x[0])
-            b = y[0]
-                    
-            y1 = b + (x1 - x[0]) * a 
-            return y1
-        elif x1 > x[-1]: # Caso fora do intervalo, continua a reta mais próxima
-            a = (y[-1] - y[-2])/(x[-1] - x[-2])
-            b = y[-2]
-                    
-            y1 = b + (x1 - x[-2]) * a
-            return y1
-        else:
-            for i in range (1, len(x)): # Busca intervalo do número x1 para atribuir valor f(x1)
-                if x[i] >= x1 >= x[i-1]:
-                    a = (y[i] - y[i-1])/(x[i] - x[i-1])
-                    b = y[i-1]
-                    
-                    y1 = b + (x1 - x[i-1]) * a # Aproximação linear
-                    
-                    return y1
+    def f(x1: float | np.ndarray) -> float | np.ndarray:
+        if np.ndim(x1) == 0:
+            # Índice k do intervalo [x[k], x[k+1]] que contém x1. Fora do
+            # intervalo, usa a reta mais próxima (extrapolação).
+            k = min(max(bisect_right(x_lista, x1) - 1, 0), ultimo)
+            return y_lista[k] + (x1 - x_lista[k]) * a_lista[k] # Aproximação linear
+
+        # Mesma busca para todos os pontos do array de uma vez
+        x1 = np.asarray(x1, dtype=float)
+        k = np.clip(np.searchsorted(x, x1, side='right') - 1, 0, ultimo)
+        return y[k] + (x1 - x[k]) * inclinacoes[k]
 
     # Plotagem do gráfico correspondente à função f
     if plot:
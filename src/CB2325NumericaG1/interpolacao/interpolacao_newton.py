@@ -0,0 +1,148 @@
+import numpy as np
+
+
+class InterpoladorNewton:
+    """Polinômio interpolador na forma de Newton, construído ponto a ponto.
+
+    Guarda a última diagonal da tabela de diferenças divididas,
+    d_j = f[x_j, ..., x_{n-1}], em que x_0 é o ponto mais antigo e x_{n-1}
+    o mais novo. Como as diferenças divididas não dependem da ordem dos
+    nós, d_j são os coeficientes da forma de Newton com os nós do mais novo
+    para o mais antigo:
+
+        P(x) = d_{n-1} + d_{n-2} (x - x_{n-1}) + ...
+               + d_0 (x - x_{n-1})(x - x_{n-2})...(x - x_1)
+
+    Adicionar um ponto custa O(n), em vez de reconstruir o polinômio em
+    O(n^2) (poly_interp) ou O(n^3) (vandermond_interp). Remover o ponto
+    mais antigo apenas descarta o último termo acima, sem nenhuma conta,
+    então uma janela deslizante pode andar indefinidamente sem acumular
+    erros de arredondamento.
+
+    Args:
+        x: lista inicial das coordenadas x (opcional).
+        y: lista inicial das coordenadas y (opcional).
+        janela: número máximo de pontos. Se dado, ao adicionar um ponto
+            além desse número, o mais antigo é removido.
+
+    Raises:
+        ValueError: Caso 'x' e 'y' tenham tamanhos diferentes, caso as
+        coordenadas em 'x' não sejam distintas, ou caso 'janela' seja
+        menor que 1.
+
+    Examples:
+        >>> p = InterpoladorNewton([0, 1], [1, 3])
+        >>> p.adicionar(2, 2)
+        >>> p(1.5)
+        2.875
+    """
+
+    def __init__(self, x: list = None, y: list = None, janela: int = None):
+        x = [] if x is None else list(x)
+        y = [] if y is None else list(y)
+
+        if len(x) != len(y):
+            raise ValueError("As listas de coordenadas x e y devem ter o mesmo tamanho.")
+        if janela is not None and janela < 1:
+            raise ValueError("O argumento 'janela' deve ser maior ou igual a 1.")
+
+        self.janela = janela
+        self._x = []        # nós, do mais antigo para o mais novo
+        self._y = []
+        self._diagonal = [] # d_j = f[x_j, ..., x_{n-1}]
+
+        for xi, yi in zip(x, y):
+            self.adicionar(xi, yi)
+
+    def __len__(self) -> int:
+        return len(self._x)
+
+    @property
+    def x(self) -> np.ndarray:
+        """Coordenadas x dos nós, do mais antigo para o mais novo."""
+        return np.array(self._x)
+
+    @property
+    def y(self) -> np.ndarray:
+        """Coordenadas y dos nós, do mais antigo para o mais novo."""
+        return np.array(self._y)
+
+    @property
+    def coeficientes(self) -> np.ndarray:
+        """Diferenças divididas d_j = f[x_j, ..., x_{n-1}], para j = 0, ..., n-1."""
+        return np.array(self._diagonal)
+
+    def adicionar(self, x: float, y: float) -> None:
+        """Adiciona um ponto ao interpolador em O(n).
+
+        A nova diagonal da tabela de diferenças divididas é calculada a
+        partir da anterior: f[x_j, ..., x_n] = (f[x_{j+1}, ..., x_n] -
+        f[x_j, ..., x_{n-1}]) / (x_n - x_j), para j de n-1 até 0. Se houver
+        janela e ela estiver cheia, o ponto mais antigo é removido antes.
+
+        Args:
+            x: coordenada x do novo ponto.
+            y: coordenada y do novo ponto.
+
+        Raises:
+            ValueError: Caso 'x' já seja um dos nós.
+        """
+        x = float(x)
+        y = float(y)
+        if x in self._x:
+            raise ValueError("As coordenadas x devem ser todas distintas.")
+
+        if self.janela is not None and len(self._x) >= self.janela:
+            self.remover_mais_antigo()
+
+        diagonal = self._diagonal + [y]
+        for j in range(len(self._x) - 1, -1, -1):
+            diagonal[j] = (diagonal[j + 1] - self._diagonal[j]) / (x - self._x[j])
+
+        self._x.append(x)
+        self._y.append(y)
+        self._diagonal = diagonal
+
+    def remover_mais_antigo(self) -> None:
+        """Remove o ponto mais antigo (x_0) em O(n).
+
+        As diferenças d_j, j >= 1, não envolvem x_0 e continuam valendo
+        para os nós restantes; basta descartar d_0.
+
+        Raises:
+            ValueError: Caso o interpolador não tenha pontos.
+        """
+        if not self._x:
+            raise ValueError("O interpolador não tem pontos.")
+
+        del self._x[0]
+        del self._y[0]
+        del self._diagonal[0]
+
+    def __call__(self, x: float | np.ndarray) -> float | np.ndarray:
+        """Avalia o polinômio pelo método de Horner na forma de Newton.
+
+        P(x) = d_{n-1} + (x - x_{n-1})(d_{n-2} + (x - x_{n-2})(... + (x - x_1) d_0)),
+        em O(n) por ponto. Aceita um número ou um array do NumPy de qualquer
+        formato, avaliando todos os pontos juntos.
+
+        Args:
+            x: ponto (ou array de pontos) de avaliação.
+
+        Returns:
+            O valor do polinômio em x, ou um array do mesmo formato de x.
+
+        Raises:
+            ValueError: Caso o interpolador não tenha pontos.
+        """
+        if not self._x:
+            raise ValueError("O interpolador não tem pontos.")
+
+        escalar = np.ndim(x) == 0
+        x = np.asarray(x, dtype=float)
+
+        resultado = np.full(x.shape, self._diagonal[0])
+        for j in range(1, len(self._x)):
+            resultado = resultado * (x - self._x[j]) + self._diagonal[j]
+
+        return float(resultado) if escalar else resultado
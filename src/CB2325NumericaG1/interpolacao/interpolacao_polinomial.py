@@ -1,7 +1,10 @@
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Callable
 
+# Número máximo de elementos da matriz (pontos x nós) montada de uma vez
+# na avaliação de vários pontos.
+_MAX_ELEMENTOS_BLOCO = 2**17
+
 def _poly_interp_plotter(x_val: list,
                          y_val: list,
                          P: Callable,
@@ -33,13 +36,14 @@ def _poly_interp_plotter(x_val: list,
     -------
         None
     """
+    import matplotlib.pyplot as plt
 
     # pontos recebidos
     plt.scatter(x_val, y_val, color=pcolor, label='Pontos Originais', zorder=5)
 
     # gerando e plotando os pontos do polinômio
     x_plot = np.linspace(min(x_val), max(x_val), res)
-    y_plot = [P(x) for x in x_plot]
+    y_plot = P(x_plot)
     plt.plot(x_plot, y_plot, color=ccolor, label='Interpolação Polinomial', linewidth=2)
 
     plt.title(titulo)
@@ -52,6 +56,90 @@ def _poly_interp_plotter(x_val: list,
     return
 
 
+def _pesos_baricentricos(x: np.ndarray) -> np.ndarray:
+    """
+    Calcula os pesos baricêntricos w_j = 1 / prod_{k != j} (x_j - x_k).
+
+    Os produtos são acumulados como soma de logaritmos, e os pesos são
+    divididos pelo maior deles. Isso evita overflow e underflow com muitos
+    nós e não altera o polinômio, pois a fórmula baricêntrica é invariante
+    por uma escala comum dos pesos. Custo O(n^2) e memória O(n).
+
+    Parameters
+    ----------
+    x : np.ndarray
+        Coordenadas x distintas dos nós.
+
+    Returns
+    -------
+    np.ndarray
+        Os pesos baricêntricos normalizados.
+    """
+    n = len(x)
+    log_abs = np.empty(n)
+    sinal = np.empty(n)
+
+    for j in range(n):
+        diferencas = x[j] - x
+        diferencas[j] = 1.0
+        log_abs[j] = np.sum(np.log(np.abs(diferencas)))
+        sinal[j] = -1.0 if np.count_nonzero(diferencas < 0) % 2 else 1.0
+
+    return sinal * np.exp(log_abs.min() - log_abs)
+
+
+def _avaliar_baricentrica(t: np.ndarray,
+                          x: np.ndarray,
+                          y: np.ndarray,
+                          pesos: np.ndarray) -> np.ndarray:
+    """
+    Avalia a fórmula baricêntrica em vários pontos de uma vez.
+
+    Os pontos são processados em blocos de linhas da matriz t_i - x_j, de
+    modo que a memória usada fica limitada a _MAX_ELEMENTOS_BLOCO elementos
+    por bloco, qualquer que seja o número de pontos. Pontos que coincidem
+    com um nó recebem exatamente o y daquele nó.
+
+    Parameters
+    ----------
+    t : np.ndarray
+        Array unidimensional dos pontos de avaliação.
+    x : np.ndarray
+        Coordenadas x dos nós.
+    y : np.ndarray
+        Coordenadas y dos nós.
+    pesos : np.ndarray
+        Pesos baricêntricos dos nós.
+
+    Returns
+    -------
+    np.ndarray
+        Os valores do polinômio em cada ponto de t.
+    """
+    resultado = np.empty(t.size)
+    linhas = max(1, _MAX_ELEMENTOS_BLOCO // len(x))
+    pesos_y = pesos * y
+
+    for inicio in range(0, t.size, linhas):
+        diferencas = np.subtract(t[inicio:inicio + linhas, np.newaxis], x)
+
+        # evita a divisão por zero nos nós; esses pontos são corrigidos abaixo
+        exatos = None
+        if not diferencas.all():
+            exatos = np.nonzero(diferencas == 0)
+            diferencas[exatos] = 1.0
+
+        # 1 / (t_i - x_j), calculado no próprio bloco para não alocar outra matriz
+        np.divide(1.0, diferencas, out=diferencas)
+        resultado[inicio:inicio + linhas] = (diferencas @ pesos_y) / (diferencas @ pesos)
+
+        if exatos is not None:
+            pontos, nos = exatos
+            resultado[inicio + pontos] = y[nos]
+
+    return resultado
+
+
 def poly_interp(x_val: list,
                 y_val: list,
                 plot: bool = False,
@@ -65,6 +153,12 @@ def poly_interp(x_val: list,
     Esta função recebe um conjunto de pontos (x, y) e retorna uma 
     função (polinômio) que passa exatamente por todos esses pontos.
 
+    O polinômio é avaliado pela forma baricêntrica da fórmula de Lagrange:
+    os pesos são calculados uma única vez, em O(n^2), e cada avaliação
+    custa O(n). Essa forma é também mais estável numericamente do que o
+    produto direto dos fatores de Lagrange. O polinômio também aceita um
+    array do NumPy, avaliando todos os pontos de uma vez.
+
     Parameters
     ----------
     x_val : list
@@ -91,7 +185,8 @@ def poly_interp(x_val: list,
     Callable
         Uma função P(x) que recebe um número (int ou float) e 
         retorna o valor do polinômio interpolador avaliado 
-        naquele ponto x.
+        naquele ponto x. Se x for um array, retorna um array
+        do mesmo formato.
 
     Raises
     ------
@@ -142,48 +237,54 @@ def poly_interp(x_val: list,
 
     
     # convertendo as arrays para o tipo do numpy
-    x_val_np = np.array(x_val)
-    y_val_np = np.array(y_val)
+    x_val_np = np.array(x_val, dtype=float)
+    y_val_np = np.array(y_val, dtype=float)
+
+    # pesos baricêntricos, calculados uma única vez
+    pesos = _pesos_baricentricos(x_val_np)
 
 
-    def P(x: int | float) -> int | float:
+    def P(x: int | float | np.ndarray) -> int | float | np.ndarray:
         """
         Função que calcula o valor do polinômio interpolador em x.
 
         Parameters
         ----------
-        x : int | float
-            Ponto onde o polinômio será avaliado.
+        x : int | float | np.ndarray
+            Ponto (ou array de pontos) onde o polinômio será avaliado.
 
         Returns
         -------
-        int | float
-            O valor do polinômio interpolador em x.
+        int | float | np.ndarray
+            O valor do polinômio interpolador em x, ou um array do
+            mesmo formato de x.
 
         Raises
         ------
         ValueError
-            Se x não for um número (int ou float).
+            Se x não for um número real (ou um array de números reais).
         """
 
+        if np.ndim(x) > 0:
+            x = np.asarray(x)
+            if not np.isrealobj(x):
+                raise ValueError("O argumento x deve ser um array de números reais.")
+            valores = _avaliar_baricentrica(x.astype(float).ravel(), x_val_np, y_val_np, pesos)
+            return valores.reshape(x.shape)
+
         if not np.isreal(x):
             raise ValueError("O argumento x deve ser um número real.")
 
-        # acumula o termo y_j * L_j(x)
-        acc_som = 0
-
-        # loop do somatório
-        for j in range(n):          
-            # o produtorio exije que j != i
-            x_val_sj = np.delete(x_val_np, j)
+        diferencas = x - x_val_np
 
-            # calculando numeradores e denominadores do produtorio
-            num = x - x_val_sj
-            den = x_val_np[j] - x_val_sj
+        # se x é um dos nós, o valor é exatamente o y correspondente
+        no = np.flatnonzero(diferencas == 0)
+        if no.size:
+            return y_val_np[no[0]]
 
-            acc_som += y_val_np[j] * np.prod(num / den)
-        
-        return acc_som
+        # fórmula baricêntrica: sum(w_j y_j / (x - x_j)) / sum(w_j / (x - x_j))
+        termos = pesos / diferencas
+        return np.dot(termos, y_val_np) / np.sum(termos)
     
     # plotagem do grafico caso o usuario deseje
     if plot:
@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from typing import Callable
 
@@ -71,6 +70,105 @@ def _hermite_interp_mat(x_pontos: list, y_pontos: list, dy_pontos: list) -> Call
     return polinomio_interpolador_hermite
 
 
+def _ordem_leja(x: np.ndarray) -> np.ndarray:
+    """
+    Função interna - Ordenação de Leja dos nós.
+
+    Começa pelo nó de maior módulo e, a cada passo, escolhe o nó que
+    maximiza o produto das distâncias aos já escolhidos (somando
+    logaritmos, para não estourar). Nessa ordem, a forma de Newton com
+    muitos nós não acumula os erros de arredondamento que aparecem com
+    os nós em ordem crescente.
+
+    Args:
+        x: array de nós distintos.
+
+    Returns:
+        Array de índices com a ordem de Leja.
+    """
+    ordem = [int(np.argmax(np.abs(x)))]
+    with np.errstate(divide='ignore'):
+        log_distancias = np.log(np.abs(x - x[ordem[0]]))
+        for _ in range(len(x) - 1):
+            log_distancias[ordem] = -np.inf
+            j = int(np.argmax(log_distancias))
+            ordem.append(j)
+            log_distancias += np.log(np.abs(x - x[j]))
+    return np.array(ordem)
+
+
+def _hermite_interp_dd(x_pontos: list, y_pontos: list, dy_pontos: list) -> Callable | None:
+    """
+    Função interna - Cria a função de interpolação por diferenças divididas.
+
+    Cada nó aparece duas vezes na sequência z = (x0, x0, x1, x1, ...). As
+    diferenças divididas de primeira ordem entre um nó e sua cópia são as
+    derivadas dadas; as demais seguem a recorrência usual. Os coeficientes
+    da forma de Newton saem em O(n^2), sem montar nenhuma matriz, e a
+    avaliação é um método de Horner em O(n) por ponto. Os nós são usados na
+    ordem de Leja. A precisão só se mantém com muitos nós se eles forem do
+    tipo Chebyshev (mais densos nas extremidades): com nós igualmente
+    espaçados, os erros de arredondamento da forma de Newton crescem
+    rapidamente a partir de uns 20 nós, e '_hermite_interp_mat' é mais
+    precisa.
+
+    Args:
+        x_pontos: Coordenadas x (n valores).
+        y_pontos: Coordenadas y (n valores).
+        dy_pontos: Derivadas dy/dx em cada x (n valores).
+
+    Returns:
+        Uma função (Callable) que avalia o polinômio, ou None se der erro.
+    """
+    try:
+        x_pts = np.asarray(x_pontos, dtype=float)
+        y_pts = np.asarray(y_pontos, dtype=float)
+        dy_pts = np.asarray(dy_pontos, dtype=float)
+    except Exception as e:
+        print(f"Erro ao converter entradas para arrays numpy: {e}")
+        return None
+
+    n = len(x_pts)
+    if n == 0:
+        print("Erro: As listas de pontos não podem estar vazias.")
+        return None
+    if len(y_pts) != n or len(dy_pts) != n:
+        print("Erro: As listas x, y, e dy devem ter o mesmo tamanho.")
+        return None
+    if len(np.unique(x_pts)) != n:
+        print("Erro: Há pontos x duplicados.")
+        return None
+
+    ordem = _ordem_leja(x_pts)
+    x_pts, y_pts, dy_pts = x_pts[ordem], y_pts[ordem], dy_pts[ordem]
+
+    # nós repetidos e tabela de diferenças divididas, atualizada no lugar
+    z = np.repeat(x_pts, 2)
+    coefs = np.repeat(y_pts, 2)
+
+    # primeira ordem: derivada entre um nó e sua cópia, quociente entre nós vizinhos
+    coefs[2::2] = (coefs[2::2] - coefs[1:-1:2]) / (z[2::2] - z[1:-1:2])
+    coefs[1::2] = dy_pts
+
+    for k in range(2, 2 * n):
+        coefs[k:] = (coefs[k:] - coefs[k-1:-1]) / (z[k:] - z[:-k])
+
+    def polinomio_interpolador_hermite(x_novo: float | np.ndarray) -> float | np.ndarray:
+        """
+        Avalia a forma de Newton P(x_novo) = c_0 + (x_novo - z_0)(c_1 + (x_novo - z_1)(c_2 + ...))
+        """
+        x_val = np.asarray(x_novo, dtype=float)
+
+        resultado = np.full(x_val.shape, coefs[-1])
+        for k in range(2 * n - 2, -1, -1):
+            resultado *= x_val - z[k]
+            resultado += coefs[k]
+
+        return resultado[()] if resultado.ndim == 0 else resultado
+
+    return polinomio_interpolador_hermite
+
+
 def _ordenar_coordenadas_hermite(x: list, y: list, dy: list) -> tuple:
     """
     Função interna - Ordena as coordenadas mantendo 'pareamento' para Hermite.
@@ -115,6 +213,7 @@ def _plotar_hermite(x: list, y: list, dy: list, f: Callable,
     Returns:
     None
     """
+    import matplotlib.pyplot as plt
     # criar pontos para a curva suave
     x_min, x_max = min(x), max(x)
     padding = 0.1 * (x_max - x_min)
@@ -186,10 +285,19 @@ def _plotar_hermite(x: list, y: list, dy: list, f: Callable,
 def hermite_interp(x_pontos: list, y_pontos: list, dy_pontos: list,
                    f_real: Callable | None = None,
                    titulo: str = "Interpolação de Hermite",
-                   plot: bool = False) -> Callable:
+                   plot: bool = False,
+                   metodo: str = 'matriz') -> Callable:
     """
     Cria e plota uma função de interpolação polinomial de Hermite.
 
+    Por padrão, os coeficientes na base de monômios são obtidos resolvendo
+    o sistema 2n x 2n, em O(n^3). Com 'metodo = "diferencas_divididas"', o
+    polinômio é construído na forma de Newton por diferenças divididas com
+    nós repetidos, em O(n^2) e com avaliação em O(n) por ponto: bem mais
+    rápido para muitos nós, mas só preciso se os nós forem do tipo
+    Chebyshev; com nós igualmente espaçados, perde precisão a partir de
+    uns 20 nós.
+
     Args:
         x_pontos: Coordenadas x (n valores).
         y_pontos: Coordenadas y (n valores).
@@ -197,11 +305,15 @@ def hermite_interp(x_pontos: list, y_pontos: list, dy_pontos: list,
         f_real: (Opcional) A função 'verdadeira' para plotar junto e calcular o gráfico de erro.
         titulo: Título para o gráfico.
         plot: indica se deve haver a plotagem (True) ou não (False).
+        metodo: 'matriz' ou 'diferencas_divididas'.
 
     Returns:
         Função de interpolação de Hermite.
         Se f_real for fornecida, imprime o erro médio e máximo
 
+    Raises:
+        ValueError: caso 'metodo' não seja 'diferencas_divididas' nem 'matriz'.
+
     Notes:
         Sobre a Extrapolação:
         Esta função sempre permite a extrapolação (avaliar valores de x 
@@ -210,12 +322,19 @@ def hermite_interp(x_pontos: list, y_pontos: list, dy_pontos: list,
         polinômios podem crescer rapidamente e produzir valores
         imprevisíveis fora do intervalo de interpolação.
     """
+    if metodo == 'diferencas_divididas':
+        construir = _hermite_interp_dd
+    elif metodo == 'matriz':
+        construir = _hermite_interp_mat
+    else:
+        raise ValueError("O argumento 'metodo' deve ser 'diferencas_divididas' ou 'matriz'.")
+
     # ordenar coordenadas
     x_ord, y_ord, dy_ord = _ordenar_coordenadas_hermite(
         x_pontos, y_pontos, dy_pontos)
 
     # criar função de interpolação
-    f_interp = _hermite_interp_mat(x_ord, y_ord, dy_ord)
+    f_interp = construir(x_ord, y_ord, dy_ord)
 
     if f_interp is None:
         print("Erro: Não foi possível criar a função de interpolação.")
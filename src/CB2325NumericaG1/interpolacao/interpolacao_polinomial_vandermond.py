@@ -1,4 +1,3 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from typing import Callable
 
@@ -85,10 +84,11 @@ def _plotar(x: list,
     Returns:
         None
     """
+    import matplotlib.pyplot as plt
     
     # Conversão para numpy.array
     x_points = np.linspace(x[0], x[-1], 500)
-    y_points = np.array([f(xp) for xp in x_points])
+    y_points = f(x_points)
 
     if f_ideal: # Caso exista uma função ideal, o erro médio é calculado e mostrado na plotagem
         _, (ax, ax_err) = plt.subplots(
@@ -97,7 +97,7 @@ def _plotar(x: list,
             sharex=True # Compartilha o eixo x
         )
         
-        y_ideal = np.array([f_ideal(xp) for xp in x_points]) # Pontos da função ideal
+        y_ideal = f_ideal(x_points) # Pontos da função ideal
 
         # Calcuando erros médio e máximo
         intv = [x[0], x[-1]]
@@ -131,10 +131,89 @@ def _plotar(x: list,
 
     return
 
+def _soma_exata(a: np.ndarray, b: np.ndarray) -> tuple:
+    """Soma com o erro de arredondamento (TwoSum de Knuth): a + b = s + e."""
+    s = a + b
+    z = s - a
+    e = (a - (s - z)) + (b - z)
+    return s, e
+
+def _produto_exato(a: np.ndarray, b: np.ndarray) -> tuple:
+    """Produto com o erro de arredondamento (TwoProduct de Dekker): a * b = p + e.
+
+    Cada fator é dividido em duas metades de 26 bits, cujos produtos são
+    exatos em ponto flutuante.
+    """
+    p = a * b
+    c = 134217729.0 * a # 2^27 + 1
+    a_alto = c - (c - a)
+    a_baixo = a - a_alto
+    c = 134217729.0 * b
+    b_alto = c - (c - b)
+    b_baixo = b - b_alto
+    e = a_baixo * b_baixo - (((p - a_alto * b_alto) - a_baixo * b_alto) - a_alto * b_baixo)
+    return p, e
+
+def _horner_compensado(coef: np.ndarray, x: np.ndarray) -> np.ndarray:
+    """Método de Horner compensado (Graillat, Langlois e Louvet).
+
+    Em cada passo do método de Horner, os erros do produto e da soma são
+    obtidos exatamente e acumulados em um segundo polinômio de correção,
+    também avaliado por Horner. O resultado é tão preciso quanto o Horner
+    comum feito com o dobro da precisão, pelo custo de algumas operações a
+    mais por coeficiente.
+
+    Args:
+        coef: coeficientes do maior para o menor grau (como em np.polyval).
+        x: array de pontos.
+
+    Returns:
+        Array com os valores do polinômio em cada ponto.
+    """
+    s = np.full(x.shape, coef[0], dtype=float)
+    correcao = np.zeros(x.shape)
+    for a in coef[1:]:
+        p, erro_produto = _produto_exato(s, x)
+        s, erro_soma = _soma_exata(p, a)
+        correcao = correcao * x + (erro_produto + erro_soma)
+    return s + correcao
+
+def _bjorck_pereyra(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Resolve o sistema de Vandermonde V a = y pelo algoritmo de Björck–Pereyra.
+
+    Em vez de montar e fatorar a matriz (O(n^3)), calcula primeiro as
+    diferenças divididas de y (forma de Newton) e depois as converte para a
+    base de monômios, em O(n^2) operações e O(n) de memória. Na base de
+    monômios o problema fica mal condicionado com algumas dezenas de nós, e
+    então o resultado pode ser menos preciso que o de np.linalg.solve; para
+    muitos nós, prefira poly_interp ou cheb_interp.
+
+    Args:
+        x: coordenadas x distintas dos nós.
+        y: coordenadas y dos nós.
+
+    Returns:
+        Coeficientes a_0, ..., a_{n-1} de P(x) = a_0 + a_1 x + ... .
+    """
+    n = len(x)
+    a = np.array(y, dtype=float)
+
+    # Diferenças divididas: a[i] = f[x_{i-k-1}, ..., x_i]
+    for k in range(n - 1):
+        a[k+1:] = (a[k+1:] - a[k:-1]) / (x[k+1:] - x[:n-k-1])
+
+    # Forma de Newton para a base de monômios
+    for k in range(n - 2, -1, -1):
+        a[k:-1] -= a[k+1:] * x[k]
+
+    return a
+
 def vandermond_interp(x: list,
                       y: list,
                       plot: bool = False,
-                      f_ideal: Callable = None) -> Callable:
+                      f_ideal: Callable = None,
+                      metodo: str = 'solve',
+                      horner_compensado: bool = False) -> Callable:
     """Interpolação polinomial pelo método de Vandermonde
 
     Essa função ordena pontos a partir da ordem crescente das
@@ -145,20 +224,36 @@ def vandermond_interp(x: list,
     plotagem do gráfico correspondente. Por padrão, 'plot = False',
     ou seja, por padrão não há a plotagem.
 
+    Com 'metodo = "solve"', a matriz de Vandermonde é montada com np.vander
+    e o sistema é resolvido por np.linalg.solve (O(n^3)). Com
+    'metodo = "bjorck_pereyra"', o sistema é resolvido pelo algoritmo de
+    Björck–Pereyra, em O(n^2) e sem montar a matriz.
+
+    A função retornada aceita um número ou um array do NumPy de qualquer
+    formato e usa o método de Horner (np.polyval). Com
+    'horner_compensado = True', usa o método de Horner compensado, mais
+    preciso para polinômios de grau alto perto de raízes múltiplas ou com
+    muito cancelamento.
+
     Args:
         x: lista das coordenadas x, em x[i], de cada ponto i.
         y: lista das coordenadas y, em y[i], de cada ponto i.
         plot: indica se deve haver a plotagem (True) ou não (False).
         f_ideal: função ideal, caso queira fazer comparação de erros.
+        metodo: 'solve' ou 'bjorck_pereyra'.
+        horner_compensado: indica se a avaliação usa o método de Horner
+            compensado (True) ou o comum (False).
 
     Returns:
-        f: função de interpolação linear por partes.
+        f: função de interpolação polinomial. Para um array de pontos,
+        retorna um array do mesmo formato.
 
     Raises:
         ValueError: Caso 'x' e 'y' tenham tamanhos diferentes, caso as listas
-        estejam vazias, ou caso as coordenadas em 'x' não sejam distintas.
+        estejam vazias, caso as coordenadas em 'x' não sejam distintas, ou
+        caso 'metodo' não seja 'solve' nem 'bjorck_pereyra'.
         TypeError: caso 'x' ou 'y' não sejam listas, caso 'f_ideal' não seja
-        callable, ou caso 'plot não seja bool'.
+        callable, ou caso 'plot' ou 'horner_compensado' não sejam bool.
     """
     # Tratamento de erros
     try:
@@ -171,6 +266,8 @@ def vandermond_interp(x: list,
         raise TypeError("O argumento 'f_ideal' deve ser uma função (callable).")
     if type(plot) != bool:
         raise TypeError("O argumento 'plot' deve ser bool")
+    if type(horner_compensado) != bool:
+        raise TypeError("O argumento 'horner_compensado' deve ser bool")
     
     if n != m:
         raise ValueError("As listas de coordenadas x e y devem ter o mesmo tamanho.")
@@ -178,25 +275,30 @@ def vandermond_interp(x: list,
         raise ValueError("As listas x e y não podem estar vazias.")
     if len(set(x)) != n:
         raise ValueError("As coordenadas x devem ser todas distintas.")
+    if metodo not in ('solve', 'bjorck_pereyra'):
+        raise ValueError("O argumento 'metodo' deve ser 'solve' ou 'bjorck_pereyra'.")
     
     # Ordenação das coordenadas x em ordem crescente
     x, y = _ordenar_coordenadas(x, y)
     
-    n = len(x)
-    matrix_vandermond = np.ones([n, n]) # Criação da matriz de Vandermonde com uns
-    for i in range(n): # Eleva cada elemento da matriz ao seu devido expoente
-        for k in range(1, n):
-            matrix_vandermond[i][k] = matrix_vandermond[i][k-1] * x[i]
-    
-    coef = np.linalg.solve(matrix_vandermond, y)
+    x = x.astype(float)
+    if metodo == 'bjorck_pereyra':
+        coef = _bjorck_pereyra(x, y)
+    else:
+        # Matriz de Vandermonde: coluna k com x[i] ** k
+        matrix_vandermond = np.vander(x, increasing=True)
+        coef = np.linalg.solve(matrix_vandermond, y)
     
+    # Coeficientes do maior para o menor grau, invertidos uma única vez
+    coef_horner = coef[::-1].copy()
+
     # Definição da função de interpolação
-    def f(x1: float) -> float:
-        y1 = 0
-        for a in coef[::-1]: # Método de Horner para calcular valores de polinômios
-            y1 = a + y1*x1
+    def f(x1: float | np.ndarray) -> float | np.ndarray:
+        if horner_compensado:
+            y1 = _horner_compensado(coef_horner, np.asarray(x1, dtype=float))
+            return y1[()] if np.ndim(x1) == 0 else y1
 
-        return y1
+        return np.polyval(coef_horner, x1) # Método de Horner para calcular valores de polinômios
 
     # Plotagem do gráfico correspondente à função f
     if plot:
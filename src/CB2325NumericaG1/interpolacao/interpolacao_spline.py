@@ -0,0 +1,416 @@
+import numpy as np
+from typing import Callable
+
+CONTORNOS = ('natural', 'fixada', 'not-a-knot')
+
+
+def _ordenar_coordenadas(x: list, y: list, dy: list | None = None) -> tuple:
+    """Ordena as coordenadas mantendo 'pareamento'.
+
+    Args:
+        x: lista das coordenadas x, em x[i], de cada ponto i.
+        y: lista das coordenadas y, em y[i], de cada ponto i.
+        dy: (Opcional) lista das derivadas dy[i] em cada ponto i.
+
+    Returns:
+        x_ord: array das coordenadas x em ordem crescente.
+        y_ord: array das coordenadas y, pareadas com as coordenadas x.
+        dy_ord: array das derivadas, pareadas com as coordenadas x (ou None).
+    """
+    x_np = np.asarray(x, dtype=float)
+    idx = np.argsort(x_np)
+
+    x_ord = x_np[idx]
+    y_ord = np.asarray(y, dtype=float)[idx]
+    dy_ord = None if dy is None else np.asarray(dy, dtype=float)[idx]
+
+    return x_ord, y_ord, dy_ord
+
+
+def _validar_pontos(x: list, y: list, plot: bool) -> int:
+    """Tratamento de erros comum às interpolações por partes.
+
+    Args:
+        x: lista das coordenadas x.
+        y: lista das coordenadas y.
+        plot: argumento 'plot' da função principal.
+
+    Returns:
+        n: número de pontos.
+
+    Raises:
+        ValueError: Caso 'x' e 'y' tenham tamanhos diferentes, caso tenham
+        menos de dois pontos, ou caso as coordenadas em 'x' não sejam distintas.
+        TypeError: caso 'x' ou 'y' não sejam listas, ou caso 'plot' não seja bool.
+    """
+    try:
+        n = len(x)
+        m = len(y)
+    except:
+        raise TypeError("Os argumentos 'x' e 'y' devem ser listas.")
+    if type(plot) != bool:
+        raise TypeError("O argumento 'plot' deve ser bool")
+
+    if n != m:
+        raise ValueError("As listas de coordenadas x e y devem ter o mesmo tamanho.")
+    if n < 2:
+        raise ValueError("São necessários pelo menos dois pontos para a interpolação.")
+    if len(np.unique(np.asarray(x, dtype=float))) != n:
+        raise ValueError("As coordenadas x devem ser todas distintas.")
+
+    return n
+
+
+def _thomas(inferior: np.ndarray,
+            diagonal: np.ndarray,
+            superior: np.ndarray,
+            lado_direito: np.ndarray) -> np.ndarray:
+    """Resolve um sistema tridiagonal pelo algoritmo de Thomas, em O(n).
+
+    Eliminação de Gauss sem pivotamento, restrita às três diagonais. Só é
+    garantidamente estável para matrizes diagonalmente dominantes. Os
+    sistemas dos splines natural e fixado já são assim; no not-a-knot, as
+    linhas de contorno não são, e '_derivadas_spline' as elimina antes.
+
+    Args:
+        inferior: diagonal abaixo da principal (n - 1 valores).
+        diagonal: diagonal principal (n valores).
+        superior: diagonal acima da principal (n - 1 valores).
+        lado_direito: vetor do lado direito (n valores).
+
+    Returns:
+        Array com a solução do sistema.
+    """
+    # Listas do Python são mais rápidas que arrays para laços escalares
+    a = inferior.tolist()
+    b = diagonal.tolist()
+    c = superior.tolist()
+    d = lado_direito.tolist()
+    n = len(b)
+
+    # Eliminação: zera a diagonal inferior
+    for i in range(1, n):
+        w = a[i-1] / b[i-1]
+        b[i] -= w * c[i-1]
+        d[i] -= w * d[i-1]
+
+    # Substituição de trás para frente
+    solucao = [0.0] * n
+    solucao[-1] = d[-1] / b[-1]
+    for i in range(n - 2, -1, -1):
+        solucao[i] = (d[i] - c[i] * solucao[i+1]) / b[i]
+
+    return np.array(solucao)
+
+
+def _derivadas_spline(x: np.ndarray,
+                      y: np.ndarray,
+                      contorno: str,
+                      dy_contorno: tuple | None) -> np.ndarray:
+    """Derivadas do spline cúbico em cada nó.
+
+    Impor a continuidade da segunda derivada nos nós internos dá, para as
+    derivadas m_i, as equações
+
+        h_i m_{i-1} + 2 (h_{i-1} + h_i) m_i + h_{i-1} m_{i+1}
+            = 3 (h_i s_{i-1} + h_{i-1} s_i),
+
+    com h_i = x[i+1] - x[i] e s_i a inclinação da reta entre os nós i e
+    i + 1. A primeira e a última equação vêm da condição de contorno, e o
+    sistema tridiagonal é resolvido por '_thomas'. No not-a-knot, as
+    equações de contorno não são diagonalmente dominantes; m_0 e m_{n-1}
+    são eliminados delas antes, o que deixa um sistema dominante para
+    m_1, ..., m_{n-2}.
+
+    Args:
+        x: nós em ordem crescente.
+        y: valores nos nós.
+        contorno: 'natural', 'fixada' ou 'not-a-knot'.
+        dy_contorno: derivadas nas extremidades, para 'fixada'.
+
+    Returns:
+        Array com as derivadas m_i.
+    """
+    n = len(x)
+    h = np.diff(x)
+    s = np.diff(y) / h
+
+    if contorno == 'fixada':
+        inicio, fim = dy_contorno
+        if n == 2:
+            return np.array([inicio, fim], dtype=float)
+    elif n == 2:
+        return np.array([s[0], s[0]])
+    elif n == 3 and contorno == 'not-a-knot':
+        # Com três pontos, o spline not-a-knot é a parábola que passa por eles
+        s2 = (s[1] - s[0]) / (x[2] - x[0])
+        return s[0] + s2 * (2 * x - x[0] - x[1])
+
+    inferior = np.empty(n - 1)
+    diagonal = np.empty(n)
+    superior = np.empty(n - 1)
+    lado_direito = np.empty(n)
+
+    # Equações dos nós internos
+    inferior[:-1] = h[1:]
+    diagonal[1:-1] = 2 * (h[:-1] + h[1:])
+    superior[1:] = h[:-1]
+    lado_direito[1:-1] = 3 * (h[1:] * s[:-1] + h[:-1] * s[1:])
+
+    # Condições de contorno
+    if contorno == 'natural': # segunda derivada nula nas extremidades
+        diagonal[0], superior[0], lado_direito[0] = 2, 1, 3 * s[0]
+        inferior[-1], diagonal[-1], lado_direito[-1] = 1, 2, 3 * s[-1]
+    elif contorno == 'fixada': # derivadas dadas nas extremidades
+        diagonal[0], superior[0], lado_direito[0] = 1, 0, inicio
+        inferior[-1], diagonal[-1], lado_direito[-1] = 0, 1, fim
+    else: # terceira derivada contínua em x[1] e x[n-2]
+        d = x[2] - x[0]
+        diagonal[0], superior[0] = h[1], d
+        lado_direito[0] = ((h[0] + 2 * d) * h[1] * s[0] + h[0]**2 * s[1]) / d
+        d = x[-1] - x[-3]
+        inferior[-1], diagonal[-1] = d, h[-2]
+        lado_direito[-1] = (h[-1]**2 * s[-2] + (2 * d + h[-1]) * h[-2] * s[-1]) / d
+
+        # Elimina m_0 da segunda equação e m_{n-1} da penúltima
+        w = inferior[0] / diagonal[0]
+        diagonal[1] -= w * superior[0]
+        lado_direito[1] -= w * lado_direito[0]
+        w = superior[-1] / diagonal[-1]
+        diagonal[-2] -= w * inferior[-1]
+        lado_direito[-2] -= w * lado_direito[-1]
+
+        m = np.empty(n)
+        m[1:-1] = _thomas(inferior[1:-1], diagonal[1:-1], superior[1:-1], lado_direito[1:-1])
+        m[0] = (lado_direito[0] - superior[0] * m[1]) / diagonal[0]
+        m[-1] = (lado_direito[-1] - inferior[-1] * m[-2]) / diagonal[-1]
+        return m
+
+    return _thomas(inferior, diagonal, superior, lado_direito)
+
+
+def _derivadas_pchip(x: np.ndarray, y: np.ndarray) -> np.ndarray:
+    """Derivadas que preservam a monotonicidade (Fritsch–Butland).
+
+    Nos nós internos, a derivada é nula se as inclinações vizinhas têm
+    sinais opostos (extremo local) e, caso contrário, é a média harmônica
+    ponderada das duas. Nas extremidades, usa a fórmula de três pontos,
+    corrigida para não criar oscilações.
+
+    Args:
+        x: nós em ordem crescente.
+        y: valores nos nós.
+
+    Returns:
+        Array com as derivadas em cada nó.
+    """
+    n = len(x)
+    h = np.diff(x)
+    s = np.diff(y) / h
+    if n == 2:
+        return np.array([s[0], s[0]])
+
+    m = np.zeros(n)
+    w1 = 2 * h[1:] + h[:-1]
+    w2 = h[1:] + 2 * h[:-1]
+    mesmo_sinal = s[:-1] * s[1:] > 0
+    with np.errstate(divide='ignore', invalid='ignore'):
+        media = (w1 + w2) / (w1 / s[:-1] + w2 / s[1:])
+    m[1:-1] = np.where(mesmo_sinal, media, 0.0)
+
+    def extremidade(h0, h1, s0, s1):
+        d = ((2 * h0 + h1) * s0 - h0 * s1) / (h0 + h1)
+        if np.sign(d) != np.sign(s0):
+            return 0.0
+        if np.sign(s0) != np.sign(s1) and abs(d) > 3 * abs(s0):
+            return 3 * s0
+        return d
+
+    m[0] = extremidade(h[0], h[1], s[0], s[1])
+    m[-1] = extremidade(h[-1], h[-2], s[-1], s[-2])
+
+    return m
+
+
+def _cubica_por_partes(x: np.ndarray, y: np.ndarray, dy: np.ndarray) -> Callable:
+    """Cria a função cúbica por partes dados valores e derivadas nos nós.
+
+    Em cada intervalo [x[k], x[k+1]], o polinômio é o cúbico de Hermite
+    com valores y[k], y[k+1] e derivadas dy[k], dy[k+1], escrito como
+
+        p(x) = y[k] + u (dy[k] + u (c2[k] + u c3[k])),   u = x - x[k].
+
+    Os coeficientes c2 e c3 são calculados uma única vez; a avaliação acha
+    os intervalos com np.searchsorted e aplica o método de Horner a todos
+    os pontos de uma vez. Fora de [x[0], x[-1]], usa o cúbico do intervalo
+    mais próximo (extrapolação).
+
+    Args:
+        x: nós em ordem crescente.
+        y: valores nos nós.
+        dy: derivadas nos nós.
+
+    Returns:
+        f: função que aceita um número ou um array do NumPy de qualquer
+        formato.
+    """
+    h = np.diff(x)
+    s = np.diff(y) / h
+    c2 = (3 * s - 2 * dy[:-1] - dy[1:]) / h
+    c3 = (dy[:-1] + dy[1:] - 2 * s) / h**2
+    ultimo = len(x) - 2
+
+    def f(x1: float | np.ndarray) -> float | np.ndarray:
+        t = np.asarray(x1, dtype=float)
+        k = np.clip(np.searchsorted(x, t, side='right') - 1, 0, ultimo)
+        u = t - x[k]
+        y1 = y[k] + u * (dy[k] + u * (c2[k] + u * c3[k]))
+        return y1[()] if y1.ndim == 0 else y1
+
+    return f
+
+
+def _plotar(x: np.ndarray,
+            y: np.ndarray,
+            f: Callable,
+            titulo: str = 'Gráfico'):
+    """Plotagem de pontos e de uma função.
+
+    Args:
+        x: coordenadas x dos pontos, em ordem crescente.
+        y: coordenadas y dos pontos.
+        f: função que será plotada.
+        titulo: título do gráfico (e legenda da curva).
+
+    Returns:
+        None
+    """
+    import matplotlib.pyplot as plt
+
+    x_points = np.linspace(x[0], x[-1], 500)
+    y_points = f(x_points)
+
+    _, ax = plt.subplots()
+    ax.scatter(x, y, color = 'red', label = 'Dados')
+    ax.plot(x_points, y_points, 'b-', linewidth=2, label = titulo)
+    ax.set_xlabel('x')
+    ax.set_ylabel('y')
+    ax.set_title(titulo)
+    ax.legend()
+    ax.grid(True)
+    plt.show()
+
+    return
+
+
+def spline_interp(x: list,
+                  y: list,
+                  contorno: str = 'natural',
+                  dy_contorno: tuple | None = None,
+                  plot: bool = False) -> Callable:
+    """Interpolação por spline cúbico.
+
+    Essa função ordena os pontos pelas coordenadas x e cria o spline
+    cúbico que passa por eles: um polinômio de grau 3 em cada intervalo,
+    com primeira e segunda derivadas contínuas. As derivadas nos nós saem
+    de um sistema tridiagonal, resolvido pelo algoritmo de Thomas em O(n),
+    o que permite usar tabelas grandes. A condição de contorno pode ser:
+
+        - 'natural': segunda derivada nula nas extremidades;
+        - 'fixada': derivadas nas extremidades dadas em 'dy_contorno';
+        - 'not-a-knot': terceira derivada contínua no segundo e no
+          penúltimo nó (reproduz exatamente polinômios cúbicos).
+
+    É permitida extrapolação. Caso 'plot = True', há uma plotagem do
+    gráfico correspondente.
+
+    Args:
+        x: lista das coordenadas x, em x[i], de cada ponto i.
+        y: lista das coordenadas y, em y[i], de cada ponto i.
+        contorno: 'natural', 'fixada' ou 'not-a-knot'.
+        dy_contorno: par (derivada em min(x), derivada em max(x)), usado
+            apenas com 'contorno = "fixada"'.
+        plot: indica se deve haver a plotagem (True) ou não (False).
+
+    Returns:
+        f: função de interpolação. Para um array de pontos, retorna um
+        array do mesmo formato.
+
+    Raises:
+        ValueError: Caso 'x' e 'y' tenham tamanhos diferentes, caso tenham
+        menos de dois pontos, caso as coordenadas em 'x' não sejam
+        distintas, caso 'contorno' seja desconhecido, ou caso
+        'dy_contorno' não tenha dois valores quando 'contorno = "fixada"'.
+        TypeError: caso 'x' ou 'y' não sejam listas, ou caso 'plot' não seja bool.
+    """
+    # Tratamento de erros
+    _validar_pontos(x, y, plot)
+    if contorno not in CONTORNOS:
+        raise ValueError(f"O argumento 'contorno' deve ser um de {CONTORNOS}.")
+    if contorno == 'fixada' and (dy_contorno is None or len(dy_contorno) != 2):
+        raise ValueError("Com 'contorno = \"fixada\"', 'dy_contorno' deve ter as duas derivadas das extremidades.")
+
+    # Ordenação das coordenadas x em ordem crescente
+    x, y, _ = _ordenar_coordenadas(x, y)
+
+    dy = _derivadas_spline(x, y, contorno, dy_contorno)
+    f = _cubica_por_partes(x, y, dy)
+
+    # Plotagem do gráfico correspondente à função f
+    if plot:
+        _plotar(x, y, f, 'Spline Cúbico')
+
+    return f
+
+
+def pchip_interp(x_pontos: list,
+                 y_pontos: list,
+                 dy_pontos: list | None = None,
+                 plot: bool = False) -> Callable:
+    """Interpolação cúbica de Hermite por partes.
+
+    Em cada intervalo entre nós consecutivos, usa o polinômio cúbico de
+    Hermite com os valores e as derivadas das duas extremidades. As
+    derivadas seguem a convenção de 'hermite_interp' (dy_pontos[i] é
+    dy/dx em x_pontos[i]); se não forem dadas, são estimadas como no
+    PCHIP (Fritsch–Butland), que preserva a monotonicidade dos dados e
+    não cria oscilações. Ao contrário de 'hermite_interp', o grau não
+    cresce com o número de pontos: a construção é O(n) e a avaliação
+    acha o intervalo de cada ponto por busca binária.
+
+    É permitida extrapolação. Caso 'plot = True', há uma plotagem do
+    gráfico correspondente.
+
+    Args:
+        x_pontos: Coordenadas x (n valores).
+        y_pontos: Coordenadas y (n valores).
+        dy_pontos: (Opcional) Derivadas dy/dx em cada x (n valores).
+        plot: indica se deve haver a plotagem (True) ou não (False).
+
+    Returns:
+        f: função de interpolação. Para um array de pontos, retorna um
+        array do mesmo formato.
+
+    Raises:
+        ValueError: Caso 'x_pontos', 'y_pontos' e 'dy_pontos' tenham
+        tamanhos diferentes, caso tenham menos de dois pontos, ou caso as
+        coordenadas em 'x_pontos' não sejam distintas.
+        TypeError: caso as coordenadas não sejam listas, ou caso 'plot' não seja bool.
+    """
+    # Tratamento de erros
+    n = _validar_pontos(x_pontos, y_pontos, plot)
+    if dy_pontos is not None and len(dy_pontos) != n:
+        raise ValueError("As listas x, y, e dy devem ter o mesmo tamanho.")
+
+    # Ordenação das coordenadas x em ordem crescente
+    x, y, dy = _ordenar_coordenadas(x_pontos, y_pontos, dy_pontos)
+
+    if dy is None:
+        dy = _derivadas_pchip(x, y)
+    f = _cubica_por_partes(x, y, dy)
+
+    # Plotagem do gráfico correspondente à função f
+    if plot:
+        _plotar(x, y, f, 'Interpolação Cúbica de Hermite por Partes')
+
+    return f
@@ -1,4 +1,6 @@
 #descomente essas linhas e coloque o nome das funcoes de vcs em func1 e func2
-from .raizes_bissecao import bissecao
+from .raizes_bissecao import bissecao, bissecao_vetorizada
 from .raizes_secante import secante
-from .raizes_newton_raphson import newton_raphson
\ No newline at end of file
+from .raizes_newton_raphson import newton_raphson, newton_raphson_vetorizado
+from .raizes_brent import brent
+from .raizes_resultado import ResultadoRaiz
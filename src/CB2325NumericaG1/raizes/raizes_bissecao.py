@@ -1,8 +1,14 @@
+import math
+import time
 import numpy as np
-import matplotlib.pyplot as plt
+import numpy.typing as npt
 from typing import Callable
+
+from .raizes_resultado import ResultadoRaiz, _criar_historico, _montar_saida
         
-def bissecao(function: Callable, lower: float, upper: float, tolerance: float, plot: bool = False) -> float:
+def bissecao(function: Callable, lower: float, upper: float, tolerance: float, plot: bool = False,
+             full_output: bool = False, callback: Callable[[int, float, float], None] | None = None,
+             historico: bool | int = False) -> float | ResultadoRaiz:
     """
     Encontra/aproxima uma raiz de uma função real de variável real usando o método da Bisseção.
 
@@ -19,30 +25,57 @@ def bissecao(function: Callable, lower: float, upper: float, tolerance: float, p
         plot (bool = False):
             Determina se uma visualização gráfica do método será plotada.
             Por padrão, não será.
+        full_output (bool = False):
+            Se True, retorna um ResultadoRaiz com a raiz, o número de iterações
+            e de avaliações, o tempo, o resíduo e o motivo da parada.
+        callback (Callable[[int, float, float], None] | None = None):
+            Função chamada a cada iteração como callback(iteracao, x, fx),
+            onde x é o ponto médio avaliado e fx = f(x).
+        historico (bool | int = False):
+            Registro dos intervalos visitados, devolvido em
+            ResultadoRaiz.historico. Com False nada é registrado (exceto
+            quando plot=True, pois o gráfico usa o registro), com True todos
+            os intervalos são registrados e com um inteiro k apenas os k
+            últimos.
 
     Returns:
-        float:
-            Valor aproximado da raiz.
+        float | ResultadoRaiz:
+            Valor aproximado da raiz, ou o resultado detalhado se full_output
+            for True.
 
     Raises:
         ValueError:
             Se a função não tem sinais opostos nos limites do intervalo.
             Se a tolerância não for positiva.
+        TypeError:
+            Se historico não for bool ou int.
     """
-    
-    # Listas para salvar os dados para o gráfico
-    lower_record = [lower]
-    upper_record = [upper]
+
+    inicio = time.perf_counter()
+    lower_start, upper_start = lower, upper
+
+    # Registro dos intervalos (alocado apenas se pedido ou se plot=True).
+    # A Bisseção faz no máximo log2((upper - lower) / tolerance) iterações.
+    capacidade = 2
+    if tolerance > 0 and upper - lower > tolerance:
+        capacidade += math.ceil(math.log2((upper - lower) / tolerance))
+    record = _criar_historico(historico, plot, capacidade, colunas=2)
+    if record is not None:
+        record.registrar(lower, upper)
 
     # Avalia a função nos pontos limites do intervalo
     lower_bound = function(lower)
     upper_bound = function(upper)
+    iteracoes = 0
+    avaliacoes_f = 2
         
     # Verifica se um dos limites do intervalo é raiz
     if lower_bound == 0:
-        return round(lower, 4)
+        return _montar_saida(round(lower, 4), full_output, inicio, record, iteracoes=0, avaliacoes_f=2,
+                             avaliacoes_df=0, residuo=0.0, motivo_parada="raiz_exata")
     elif upper_bound == 0:
-        return round(upper, 4)
+        return _montar_saida(round(upper, 4), full_output, inicio, record, iteracoes=0, avaliacoes_f=2,
+                             avaliacoes_df=0, residuo=0.0, motivo_parada="raiz_exata")
             
     # Verifica se a função cumpre as condições para a utilização desse método
     if lower_bound * upper_bound > 0:
@@ -50,12 +83,20 @@ def bissecao(function: Callable, lower: float, upper: float, tolerance: float, p
     if tolerance <= 0:
         raise ValueError("Valor de tolerância inválido.")
     
+    medium_value = lower_bound
     while upper - lower > tolerance:
         medium_point = (lower + upper) / 2
         medium_value = function(medium_point)
+        iteracoes += 1
+        avaliacoes_f += 1
+
+        if callback is not None:
+            callback(iteracoes, medium_point, medium_value)
         
         if medium_value == 0:
-            return round(medium_point, 4)
+            return _montar_saida(round(medium_point, 4), full_output, inicio, record, iteracoes=iteracoes,
+                                 avaliacoes_f=avaliacoes_f, avaliacoes_df=0, residuo=0.0,
+                                 motivo_parada="raiz_exata")
         
         if lower_bound * medium_value < 0:
             upper = medium_point
@@ -64,20 +105,26 @@ def bissecao(function: Callable, lower: float, upper: float, tolerance: float, p
             lower = medium_point
             lower_bound = medium_value
             
-        lower_record.append(lower)
-        upper_record.append(upper)
+        if record is not None:
+            record.registrar(lower, upper)
             
     if plot:
-        x = np.linspace(lower_record[0], upper_record[0], 100)
+        import matplotlib.pyplot as plt
+
+        intervals = record.valores()
+        lower_record = intervals[:, 0]
+        upper_record = intervals[:, 1]
+
+        x = np.linspace(lower_start, upper_start, 100)
         y = function(x)
 
         plt.axhline(0, color='dimgrey', linewidth=1.5)
         plt.plot(x, y, color='black', linewidth=1.0, label='f(x)') 
 
-        plt.scatter(lower_record, function(np.array(lower_record)), s=20, c='royalblue', label='Limite Inferior', zorder=2)
-        plt.scatter(upper_record, function(np.array(upper_record)), s=20, c='crimson', label='Limite Superior', zorder=2)
+        plt.scatter(lower_record, function(lower_record), s=20, c='royalblue', label='Limite Inferior', zorder=2)
+        plt.scatter(upper_record, function(upper_record), s=20, c='crimson', label='Limite Superior', zorder=2)
 
-        plt.xlim(lower_record[0], upper_record[0])
+        plt.xlim(lower_start, upper_start)
         plt.title("Raízes da função pelo Método da Bisseção")
         plt.grid(True, linestyle='--', alpha=0.6)
         plt.xlabel("x")
@@ -86,4 +133,113 @@ def bissecao(function: Callable, lower: float, upper: float, tolerance: float, p
         plt.show()
 
     final_root = (lower + upper) / 2
-    return round(final_root, 4)
\ No newline at end of file
+    return _montar_saida(round(final_root, 4), full_output, inicio, record, iteracoes=iteracoes,
+                         avaliacoes_f=avaliacoes_f, avaliacoes_df=0, residuo=abs(float(medium_value)),
+                         motivo_parada="tolerancia_intervalo")
+
+def bissecao_vetorizada(function: Callable, lower: npt.ArrayLike, upper: npt.ArrayLike, tolerance: float, args: tuple = (), max_iters: int = 1000) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aplica o método da Bisseção a vários intervalos ao mesmo tempo.
+
+    Em cada iteração a função é avaliada uma única vez sobre o vetor com os
+    pontos médios de todos os intervalos que ainda não convergiram. Os
+    intervalos que já convergiram saem da iteração, de modo que o custo do
+    laço é determinado apenas pelo intervalo mais lento.
+
+    Args:
+        function (Callable):
+            Função cuja raíz queremos encontrar ou aproximar.
+            Deve aceitar e retornar arrays do NumPy (ex.: lambda x: np.sin(x)).
+        lower (npt.ArrayLike):
+            Limites inferiores dos intervalos.
+        upper (npt.ArrayLike):
+            Limites superiores dos intervalos. Deve ter o mesmo formato de lower.
+            Intervalos com o limite inferior maior que o superior têm os
+            limites trocados.
+        tolerance (float):
+            Critério de parada.
+            Valor mínimo que cada intervalo pode assumir.
+        args (tuple = ()):
+            Parâmetros extras de cada intervalo, repassados como
+            function(x, *args). Cada parâmetro é ajustado ao formato de lower e
+            recortado junto com os intervalos que continuam ativos.
+        max_iters (int = 1000):
+            Número máximo de iterações.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            Um array com as raízes aproximadas e um array booleano indicando
+            quais intervalos convergiram. Ambos têm o formato de lower.
+            Intervalos sem sinais opostos nos limites recebem NaN e não
+            convergem. Diferentemente de bissecao, as raízes não são arredondadas.
+
+    Raises:
+        ValueError:
+            Se lower e upper tiverem formatos diferentes.
+            Se a tolerância não for positiva.
+    """
+
+    lower = np.array(lower, dtype=float)
+    upper = np.array(upper, dtype=float)
+
+    if lower.shape != upper.shape:
+        raise ValueError("Os limites inferiores e superiores devem ter o mesmo formato.")
+    if tolerance <= 0:
+        raise ValueError("Valor de tolerância inválido.")
+
+    shape = lower.shape
+    # Intervalos com os limites invertidos são reordenados
+    lower, upper = np.minimum(lower, upper).ravel(), np.maximum(lower, upper).ravel()
+    args = tuple(np.broadcast_to(arg, shape).ravel() for arg in args)
+
+    # Avalia a função nos pontos limites de todos os intervalos
+    lower_bound = np.asarray(function(lower, *args), dtype=float)
+    upper_bound = np.asarray(function(upper, *args), dtype=float)
+
+    roots = np.full(lower.shape, np.nan)
+    converged = np.zeros(lower.shape, dtype=bool)
+
+    # Limites que já são raiz
+    exact_upper = upper_bound == 0
+    roots[exact_upper] = upper[exact_upper]
+    exact_lower = lower_bound == 0
+    roots[exact_lower] = lower[exact_lower]
+    converged |= exact_lower | exact_upper
+
+    # Apenas intervalos com sinais opostos participam da iteração
+    valid = ~converged & (lower_bound * upper_bound < 0)
+    active = np.flatnonzero(valid)
+
+    lo = lower[active]
+    hi = upper[active]
+    f_lo = lower_bound[active]
+    params = tuple(arg[active] for arg in args)
+
+    for _ in range(max_iters):
+        # Remove da iteração os intervalos que já convergiram
+        done = hi - lo <= tolerance
+        if done.any():
+            roots[active[done]] = (lo[done] + hi[done]) / 2
+            converged[active[done]] = True
+            keep = ~done
+            active, lo, hi, f_lo = active[keep], lo[keep], hi[keep], f_lo[keep]
+            params = tuple(param[keep] for param in params)
+
+        if active.size == 0:
+            break
+
+        medium_point = (lo + hi) / 2
+        medium_value = np.asarray(function(medium_point, *params), dtype=float)
+
+        # Pontos médios que são raiz fecham o intervalo sobre si mesmos
+        exact = medium_value == 0
+        left = f_lo * medium_value < 0
+
+        hi = np.where(left | exact, medium_point, hi)
+        lo = np.where(left & ~exact, lo, medium_point)
+        f_lo = np.where(left, f_lo, medium_value)
+
+    # Intervalos que esgotaram as iterações recebem o ponto médio atual
+    roots[active] = (lo + hi) / 2
+
+    return roots.reshape(shape), converged.reshape(shape)
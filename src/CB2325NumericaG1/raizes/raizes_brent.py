@@ -0,0 +1,178 @@
+import time
+import numpy as np
+from typing import Callable
+
+from .raizes_resultado import ResultadoRaiz, _criar_historico, _montar_saida
+
+def brent(function: Callable, lower: float, upper: float, tolerance: float, plot: bool = False,
+          full_output: bool = False, callback: Callable[[int, float, float], None] | None = None,
+          historico: bool | int = False) -> float | ResultadoRaiz:
+    """
+    Encontra/aproxima uma raiz de uma função real de variável real usando o método de Brent.
+
+    Assim como a Bisseção, o método mantém sempre um intervalo com sinais
+    opostos nos limites, o que garante a convergência. Em cada iteração tenta
+    um passo de interpolação quadrática inversa (ou da secante) e só recorre
+    ao passo da Bisseção quando o passo interpolado cairia fora do intervalo
+    ou não reduziria o intervalo o suficiente. Para funções suaves, isso
+    exige bem menos avaliações da função do que a Bisseção.
+
+    Args:
+        function (Callable):
+            Função cuja raíz queremos encontrar ou aproximar.
+        lower (float):
+            Limite inferior do intervalo em que queremos calcular a raiz da função.
+        upper (float):
+            Limite superior do intervalo em que queremos calcular a raiz da função.
+        tolerance (float):
+            Critério de parada.
+            Valor mínimo que o intervalo pode assumir.
+        plot (bool = False):
+            Determina se uma visualização gráfica do método será plotada.
+            Por padrão, não será.
+        full_output (bool = False):
+            Se True, retorna um ResultadoRaiz com a raiz, o número de iterações
+            e de avaliações, o tempo, o resíduo e o motivo da parada.
+        callback (Callable[[int, float, float], None] | None = None):
+            Função chamada a cada iteração como callback(iteracao, x, fx),
+            onde x é o novo ponto avaliado e fx = f(x).
+        historico (bool | int = False):
+            Registro dos pontos visitados, devolvido em ResultadoRaiz.historico.
+            Com False nada é registrado (exceto quando plot=True, pois o
+            gráfico usa o registro), com True todos os pontos são registrados
+            e com um inteiro k apenas os k últimos.
+
+    Returns:
+        float | ResultadoRaiz:
+            Valor aproximado da raiz, ou o resultado detalhado se full_output
+            for True. Diferentemente de bissecao, o valor não é arredondado.
+
+    Raises:
+        ValueError:
+            Se a função não tem sinais opostos nos limites do intervalo.
+            Se a tolerância não for positiva.
+        TypeError:
+            Se historico não for bool ou int.
+        RunTimeError:
+            Se o método não convergir em no máximo 1000 iterações.
+    """
+
+    inicio = time.perf_counter()
+    MAX_ITERS = 1000
+    EPS = np.finfo(float).eps
+
+    a = float(lower)
+    b = float(upper)
+    record = _criar_historico(historico, plot, MAX_ITERS + 2)
+    if record is not None:
+        record.registrar(a)
+        record.registrar(b)
+
+    # Avalia a função nos pontos limites do intervalo
+    fa = function(a)
+    fb = function(b)
+
+    # Verifica se um dos limites do intervalo é raiz
+    if fa == 0:
+        return _montar_saida(a, full_output, inicio, record, iteracoes=0, avaliacoes_f=2,
+                             avaliacoes_df=0, residuo=0.0, motivo_parada="raiz_exata")
+    elif fb == 0:
+        return _montar_saida(b, full_output, inicio, record, iteracoes=0, avaliacoes_f=2,
+                             avaliacoes_df=0, residuo=0.0, motivo_parada="raiz_exata")
+
+    # Verifica se a função cumpre as condições para a utilização desse método
+    if fa * fb > 0:
+        raise ValueError("A função não tem sinais opostos nos limites do intervalo.")
+    if tolerance <= 0:
+        raise ValueError("Valor de tolerância inválido.")
+
+    # b é a melhor aproximação, a é a aproximação anterior e [b, c] contém a raiz
+    c, fc = b, fb
+    d = e = b - a
+    root = None
+
+    for i in range(MAX_ITERS):
+        if (fb > 0) == (fc > 0):
+            c, fc = a, fa
+            d = e = b - a
+
+        # Garante que b seja o limite com o menor |f|
+        if abs(fc) < abs(fb):
+            a, b, c = b, c, b
+            fa, fb, fc = fb, fc, fb
+
+        tol1 = 2 * EPS * abs(b) + 0.5 * tolerance
+        xm = 0.5 * (c - b)
+
+        # Critério de parada
+        if abs(xm) <= tol1 or fb == 0:
+            root = b
+            motivo = "raiz_exata" if fb == 0 else "tolerancia_intervalo"
+            break
+
+        if abs(e) >= tol1 and abs(fa) > abs(fb):
+            s = fb / fa
+            if a == c:
+                # Passo da secante
+                p = 2 * xm * s
+                q = 1 - s
+            else:
+                # Passo da interpolação quadrática inversa
+                q = fa / fc
+                r = fb / fc
+                p = s * (2 * xm * q * (q - r) - (b - a) * (r - 1))
+                q = (q - 1) * (r - 1) * (s - 1)
+            if p > 0:
+                q = -q
+            p = abs(p)
+
+            # Aceita o passo interpolado apenas se ele cair dentro do intervalo
+            # e reduzir o intervalo mais rápido do que a Bisseção
+            if 2 * p < min(3 * xm * q - abs(tol1 * q), abs(e * q)):
+                e = d
+                d = p / q
+            else:
+                d = xm
+                e = d
+        else:
+            # Passo da Bisseção
+            d = xm
+            e = d
+
+        a, fa = b, fb
+        if abs(d) > tol1:
+            b += d
+        else:
+            b += tol1 if xm > 0 else -tol1
+        fb = function(b)
+        if record is not None:
+            record.registrar(b)
+
+        if callback is not None:
+            callback(i + 1, b, fb)
+
+    if root is None:
+        raise RuntimeError(f"Não convergiu após {MAX_ITERS} iterações. Último x = {b}, f(x) = {fb}")
+
+    if plot:
+        import matplotlib.pyplot as plt
+
+        x_record = record.valores()
+        x = np.linspace(lower, upper, 100)
+        y = function(x)
+
+        plt.axhline(0, color='dimgrey', linewidth=1.5)
+        plt.plot(x, y, color='black', linewidth=1.0, label='f(x)')
+
+        plt.scatter(x_record, function(x_record), s=20, c='crimson', label='Pontos de Iteração', zorder=2)
+
+        plt.xlim(lower, upper)
+        plt.title("Raízes da função pelo Método de Brent")
+        plt.grid(True, linestyle='--', alpha=0.6)
+        plt.xlabel("x")
+        plt.ylabel("f(x)")
+        plt.legend()
+        plt.show()
+
+    return _montar_saida(root, full_output, inicio, record, iteracoes=i, avaliacoes_f=i + 2,
+                         avaliacoes_df=0, residuo=abs(float(fb)), motivo_parada=motivo)
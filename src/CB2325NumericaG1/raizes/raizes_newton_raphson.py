@@ -1,54 +1,50 @@
+from __future__ import annotations
+
+import sys
+import time
 import numpy as np
-import sympy as sp
-import matplotlib.pyplot as plt
-from typing import Callable, Union
+import numpy.typing as npt
+from typing import TYPE_CHECKING, Callable, Union
+
+if TYPE_CHECKING:
+    import sympy as sp
 
-def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance: float, plot: bool = False) -> float:
+from ..cache import lambdify_cache, derivada_cache
+from .raizes_resultado import ResultadoRaiz, _criar_historico, _montar_saida
+
+def _preparar_funcoes(function: Union[Callable, sp.Basic], n_params: int = 0) -> tuple[Callable, Callable]:
     """
-    Encontra/aproxima uma raiz de uma função real de variável real usando o método de Newton–Raphson.
+    Função interna - Prepara a função e sua derivada para o método de Newton–Raphson.
+
+    Se function for sp.Basic, a derivada é obtida analiticamente e as duas
+    expressões são compiladas com sp.lambdify uma única vez. Caso contrário,
+    a derivada é aproximada por diferença central.
 
-    Calcula onde a reta tangente ao gráfico da função no ponto x0 cruza o eixo x.
-    Repete o processo com esse novo ponto x1.
-    
     Args:
         function Union[Callable, sp.Basic]:
             Função cuja raíz queremos encontrar ou aproximar.
-            Pode ser Callable ou sp.Basic.
-            Para melhor eficiência do método, deve ser sp.Basic.
-        guess (float):
-            Chute inicial x0.
-        tolerance (float):
-            Critério de parada.
-            O método para quando |f| < tolerance ou |dx| < tolerance.
-        plot (bool = False):
-            Determina se uma visualização gráfica do método será plotada.
-            Por padrão, não será.
+        n_params (int = 0):
+            Quantidade de parâmetros extras, além de x. Para expressões SymPy
+            com parâmetros, function deve ser sp.Lambda((x, p1, ...), expr).
 
     Returns:
-        float:
-            Valor aproximado da raiz.
+        tuple[Callable, Callable]:
+            As funções f(x, *params) e df(x, *params).
 
     Raises:
         ValueError:
-            Se a expressão SymPy tiver mais de uma variável.
-            Se ocorrer NaN/Inf em algum momento da iteração.
-            Se em algum momento da iteração o ponto xn nao estiver
-            no domínio da f ou da df
+            Se a expressão SymPy não tiver o número esperado de variáveis.
         TypeError:
             Se function não for Callable ou sp.Basic.
-        ZeroDivisionError:
-            Se a derivada praticamente zerar em algum momento da iteração.
-        RunTimeError:
-            Se o método não convergir em no máximo 1000 iterações.
     """
 
-    MAX_ITERS = 1000
-    x0 = float(guess)
-    x_record = [x0]
-
-    # Preparar f e df: se function for sympy, obtenha a derivada analítca;
+    # Preparar f e df: se function for sympy, obtenha a derivada analítca
+    # (as funções compiladas ficam no cache do pacote);
     # caso contrário, use derivada numérica por quociente de newton.
-    if isinstance(function, sp.Basic):  # cobre sp.Expr, sp.Symbol, etc.
+    # Uma expressão SymPy só existe se o sympy já foi importado pelo usuário,
+    # então não é preciso importá-lo para Callables comuns.
+    sp = sys.modules.get("sympy")
+    if sp is not None and isinstance(function, sp.Basic):  # cobre sp.Expr, sp.Symbol, etc.
         if isinstance(function, sp.Lambda):
             f_expr = function.expr
             variables = function.variables
@@ -56,32 +52,107 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
             f_expr = function
             variables = function.free_symbols
 
+        if n_params > 0:
+            if not isinstance(function, sp.Lambda) or len(variables) != n_params + 1:
+                raise ValueError(f"Para {n_params} parâmetro(s), a função deve ser sp.Lambda com {n_params + 1} variáveis (x primeiro).")
+            x_sym = variables[0]
+            f = lambdify_cache(variables, f_expr)
+
+            df_expr = derivada_cache(f_expr, x_sym)
+            df = lambdify_cache(variables, df_expr)
         # Garante que é uma função de uma variável
-        if len(variables) == 0:
+        elif len(variables) == 0:
             # Caso constante
             f = lambda x: float(f_expr)
             df = lambda x: 0.0
         elif len(variables) == 1:
             x_sym = list(variables)[0]
-            f = sp.lambdify(x_sym, f_expr, 'numpy')
+            f = lambdify_cache(x_sym, f_expr)
             
-            df_expr = sp.diff(f_expr, x_sym)
-            df = sp.lambdify(x_sym, df_expr, 'numpy')
+            df_expr = derivada_cache(f_expr, x_sym)
+            df = lambdify_cache(x_sym, df_expr)
         else:
             raise ValueError(f"A expressão SymPy deve ter exatamente uma variável, mas foram encontradas {len(variables)}: {variables}")
         
     elif callable(function):
         f = function
-        def df(x):
+        def df(x, *params):
             h = 1e-8
-            return (f(x + h) - f(x - h)) / (2.0 * h)
+            return (f(x + h, *params) - f(x - h, *params)) / (2.0 * h)
     
     # Caso 3: Entrada inválida
     else:
         raise TypeError("function deve ser Callable ou sp.Basic.")
+
+    return f, df
+
+def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance: float, plot: bool = False,
+                   full_output: bool = False, callback: Callable[[int, float, float], None] | None = None,
+                   historico: bool | int = False) -> float | ResultadoRaiz:
+    """
+    Encontra/aproxima uma raiz de uma função real de variável real usando o método de Newton–Raphson.
+
+    Calcula onde a reta tangente ao gráfico da função no ponto x0 cruza o eixo x.
+    Repete o processo com esse novo ponto x1.
     
+    Args:
+        function Union[Callable, sp.Basic]:
+            Função cuja raíz queremos encontrar ou aproximar.
+            Pode ser Callable ou sp.Basic.
+            Para melhor eficiência do método, deve ser sp.Basic.
+        guess (float):
+            Chute inicial x0.
+        tolerance (float):
+            Critério de parada.
+            O método para quando |f| < tolerance ou |dx| < tolerance.
+        plot (bool = False):
+            Determina se uma visualização gráfica do método será plotada.
+            Por padrão, não será.
+        full_output (bool = False):
+            Se True, retorna um ResultadoRaiz com a raiz, o número de iterações
+            e de avaliações, o tempo, o resíduo e o motivo da parada.
+        callback (Callable[[int, float, float], None] | None = None):
+            Função chamada a cada iteração como callback(iteracao, x, fx),
+            onde x é o ponto atual e fx = f(x).
+        historico (bool | int = False):
+            Registro dos pontos visitados, devolvido em ResultadoRaiz.historico.
+            Com False nada é registrado (exceto quando plot=True, pois o
+            gráfico usa o registro), com True todos os pontos são registrados
+            e com um inteiro k apenas os k últimos.
+
+    Returns:
+        float | ResultadoRaiz:
+            Valor aproximado da raiz, ou o resultado detalhado se full_output
+            for True.
+
+    Raises:
+        ValueError:
+            Se a expressão SymPy tiver mais de uma variável.
+            Se ocorrer NaN/Inf em algum momento da iteração.
+            Se em algum momento da iteração o ponto xn nao estiver
+            no domínio da f ou da df
+        TypeError:
+            Se function não for Callable ou sp.Basic.
+            Se historico não for bool ou int.
+        ZeroDivisionError:
+            Se a derivada praticamente zerar em algum momento da iteração.
+        RunTimeError:
+            Se o método não convergir em no máximo 1000 iterações.
+    """
+
+    inicio = time.perf_counter()
+    MAX_ITERS = 1000
+    x0 = float(guess)
+    record = _criar_historico(historico, plot, MAX_ITERS + 1)
+    if record is not None:
+        record.registrar(x0)
+
+    f, df = _preparar_funcoes(function)
+
     root = None
     fx = None
+    avaliacoes_f = 0
+    avaliacoes_df = 0
 
     for i in range(MAX_ITERS):
         try:
@@ -89,12 +160,17 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
             fx = float(fx_val)
         except Exception as e:
             raise ValueError(f"f não pode ser avaliada em {x0}: {e}")
+        avaliacoes_f += 1
+
+        if callback is not None:
+            callback(i + 1, x0, fx)
         
         if np.isnan(fx) or np.isinf(fx):
             raise ValueError(f"f(x) retornou {fx} no ponto x = {x0}.")
         
         if abs(fx) < tolerance:
             root = x0
+            motivo = "raiz_exata" if fx == 0 else "tolerancia_f"
             break
 
         try:
@@ -102,6 +178,7 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
             dfx = float(dfx_val)
         except Exception as e:
             raise ValueError(f"f' não pode ser avaliada em {x0}: {e}")
+        avaliacoes_df += 1
 
         if np.isnan(dfx) or np.isinf(dfx):
             raise ValueError(f"f'(x) retornou {dfx} no ponto x = {x0}.")
@@ -110,11 +187,17 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
             raise ZeroDivisionError(f"Derivada muito próxima de zero em x = {x0}.")
         
         x1 = x0 - fx / dfx
-        x_record.append(x1)
+        if record is not None:
+            record.registrar(x1)
 
         # Critérios de parada 
         if abs(x1 - x0) < tolerance:
             root = x1
+            motivo = "tolerancia_x"
+            if full_output:
+                # O resíduo informado é o da raiz retornada, não o do ponto anterior
+                fx = float(f(root))
+                avaliacoes_f += 1
             break
 
         x0 = x1   
@@ -124,6 +207,9 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
     
     # Visualização gráfica
     if plot:
+        import matplotlib.pyplot as plt
+
+        x_record = record.valores()
         if len(x_record) > 1:
             x_min = min(x_record)
             x_max = max(x_record)
@@ -165,4 +251,100 @@ def newton_raphson(function: Union[Callable, sp.Basic], guess: float, tolerance:
         plt.legend()
         plt.show()
     
-    return root
\ No newline at end of file
+    return _montar_saida(root, full_output, inicio, record, iteracoes=i + 1, avaliacoes_f=avaliacoes_f,
+                         avaliacoes_df=avaliacoes_df, residuo=abs(fx), motivo_parada=motivo)
+
+
+def newton_raphson_vetorizado(function: Union[Callable, sp.Basic], guesses: npt.ArrayLike, tolerance: float, params: npt.ArrayLike | None = None, max_iters: int = 1000) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Aplica o método de Newton–Raphson a vários chutes iniciais ao mesmo tempo.
+
+    A função e sua derivada são preparadas uma única vez e todos os chutes
+    são iterados juntos com operações vetorizadas do NumPy. Cada chute para
+    individualmente quando |f| < tolerance ou |dx| < tolerance, e deixa de
+    ser avaliado nas iterações seguintes.
+
+    Args:
+        function Union[Callable, sp.Basic]:
+            Função cuja raíz queremos encontrar ou aproximar.
+            Se for Callable, deve aceitar e retornar arrays do NumPy.
+            Para famílias de funções, recebe os parâmetros depois de x:
+            function(x, p1, p2, ...), ou sp.Lambda((x, p1, p2, ...), expr).
+        guesses (npt.ArrayLike):
+            Chutes iniciais.
+        tolerance (float):
+            Critério de parada.
+            O método para quando |f| < tolerance ou |dx| < tolerance.
+        params (npt.ArrayLike | None = None):
+            Parâmetros da família de funções. Um array com o formato de
+            guesses (um parâmetro) ou com formato (k, *guesses.shape)
+            (k parâmetros). Valores escalares são repetidos para todos os chutes.
+        max_iters (int = 1000):
+            Número máximo de iterações.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]:
+            Um array com as raízes aproximadas e um array booleano indicando
+            quais chutes convergiram. Ambos têm o formato de guesses.
+            Chutes em que ocorreu NaN/Inf ou derivada praticamente nula
+            recebem NaN; chutes que esgotaram as iterações recebem o último x.
+
+    Raises:
+        ValueError:
+            Se a expressão SymPy não tiver o número esperado de variáveis.
+            Se a tolerância não for positiva.
+        TypeError:
+            Se function não for Callable ou sp.Basic.
+    """
+
+    if tolerance <= 0:
+        raise ValueError("Valor de tolerância inválido.")
+
+    x = np.array(guesses, dtype=float)
+    shape = x.shape
+    x = x.ravel()
+
+    if params is None:
+        params = ()
+    else:
+        params = np.asarray(params, dtype=float)
+        if params.ndim <= len(shape):
+            params = params[np.newaxis]
+        params = tuple(np.broadcast_to(p, shape).ravel() for p in params)
+
+    f, df = _preparar_funcoes(function, len(params))
+
+    roots = x.copy()
+    converged = np.zeros(x.shape, dtype=bool)
+    active = np.arange(x.size)
+
+    with np.errstate(all='ignore'):
+        for i in range(max_iters):
+            if active.size == 0:
+                break
+
+            fx = np.broadcast_to(np.asarray(f(x, *params), dtype=float), x.shape)
+            dfx = np.broadcast_to(np.asarray(df(x, *params), dtype=float), x.shape)
+
+            # Chutes que já estão numa raiz param antes do teste da derivada,
+            # para que uma raiz múltipla (derivada nula) não conte como falha
+            small_f = np.isfinite(fx) & (np.abs(fx) < tolerance)
+
+            # Os demais que chegaram a NaN/Inf ou a uma derivada nula são descartados
+            failed = ~small_f & (~np.isfinite(fx) | ~np.isfinite(dfx) | (np.abs(dfx) < 1e-16))
+
+            step = np.where(failed | small_f, 0.0, fx / np.where(failed | small_f, 1.0, dfx))
+            x_new = x - step
+            small_dx = ~failed & ~small_f & (np.abs(step) < tolerance)
+
+            roots[active] = np.where(failed, np.nan, x_new)
+            done = failed | small_f | small_dx
+            converged[active[small_f | small_dx]] = True
+
+            # Mantém apenas os chutes que ainda não pararam
+            keep = ~done
+            active = active[keep]
+            x = x_new[keep]
+            params = tuple(p[keep] for p in params)
+
+    return roots.reshape(shape), converged.reshape(shape)
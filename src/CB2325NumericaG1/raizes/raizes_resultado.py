@@ -0,0 +1,147 @@
+import time
+import numpy as np
+from dataclasses import dataclass
+
+@dataclass
+class ResultadoRaiz:
+    """
+    Resultado detalhado de um método de busca de raízes.
+
+    Retornado pelos métodos de raízes quando chamados com full_output=True.
+
+    Attributes:
+        raiz (float):
+            Valor aproximado da raiz (o mesmo valor retornado sem full_output).
+        iteracoes (int):
+            Número de iterações executadas.
+        avaliacoes_f (int):
+            Número de avaliações da função.
+        avaliacoes_df (int):
+            Número de avaliações da derivada (analítica ou numérica).
+        tempo (float):
+            Tempo total da execução, em segundos.
+        residuo (float):
+            Valor de |f(x)| no último ponto avaliado. Na Secante e em
+            Newton-Raphson é sempre |f(raiz)|: se o método parar por
+            "tolerancia_x", f é avaliada mais uma vez na raiz retornada
+            (e essa avaliação entra em avaliacoes_f).
+        motivo_parada (str):
+            Critério que encerrou o método:
+            "raiz_exata" (f(x) == 0 em algum ponto avaliado),
+            "tolerancia_intervalo" (o intervalo ficou menor que a tolerância),
+            "tolerancia_f" (|f| < tolerance) ou
+            "tolerancia_x" (|dx| < tolerance).
+        historico (np.ndarray | None):
+            Pontos registrados durante a iteração, em ordem, se o método foi
+            chamado com historico=True ou historico=k. Na Bisseção cada linha
+            contém (limite inferior, limite superior).
+    """
+
+    raiz: float
+    iteracoes: int
+    avaliacoes_f: int
+    avaliacoes_df: int
+    tempo: float
+    residuo: float
+    motivo_parada: str
+    historico: np.ndarray | None = None
+
+
+class _Historico:
+    """
+    Classe interna - Registro dos pontos visitados por um método de raízes.
+
+    Os pontos são gravados em um array do NumPy alocado uma única vez. Sem
+    limite, o array tem a capacidade informada (e dobra de tamanho caso ela
+    seja ultrapassada). Com limite, funciona como um buffer circular que
+    guarda apenas os últimos pontos.
+
+    Args:
+        capacidade (int): Número esperado de registros.
+        limite (int | None): Número máximo de registros guardados.
+        colunas (int): Número de valores em cada registro.
+    """
+
+    def __init__(self, capacidade: int, limite: int | None = None, colunas: int = 1):
+        tamanho = capacidade if limite is None else limite
+        self._dados = np.empty((max(tamanho, 1), colunas))
+        self._circular = limite is not None
+        self._n = 0
+
+    def registrar(self, *valores: float) -> None:
+        """Grava um registro com um valor por coluna."""
+        tamanho = len(self._dados)
+        if self._circular:
+            self._dados[self._n % tamanho] = valores
+        else:
+            if self._n == tamanho:
+                self._dados = np.concatenate([self._dados, np.empty_like(self._dados)])
+            self._dados[self._n] = valores
+        self._n += 1
+
+    def valores(self) -> np.ndarray:
+        """Retorna os registros guardados em ordem cronológica."""
+        tamanho = len(self._dados)
+        if self._n <= tamanho:
+            dados = self._dados[:self._n].copy()
+        else:
+            inicio = self._n % tamanho
+            dados = np.concatenate([self._dados[inicio:], self._dados[:inicio]])
+        return dados[:, 0] if dados.shape[1] == 1 else dados
+
+
+def _criar_historico(historico: bool | int, plot: bool, capacidade: int, colunas: int = 1) -> _Historico | None:
+    """
+    Função interna - Cria o registro de pontos pedido pelo usuário.
+
+    Args:
+        historico (bool | int):
+            False não registra nada (a menos que plot seja True), True
+            registra todos os pontos e um inteiro k guarda apenas os k últimos.
+        plot (bool): Se True, o gráfico precisa dos pontos registrados.
+        capacidade (int): Número esperado de registros.
+        colunas (int): Número de valores em cada registro.
+
+    Returns:
+        _Historico | None:
+            O registro, ou None se nada deve ser registrado.
+
+    Raises:
+        TypeError:
+            Se historico não for bool ou int.
+        ValueError:
+            Se historico for um inteiro menor que 1.
+    """
+    if type(historico) == bool:
+        if historico or plot:
+            return _Historico(capacidade, colunas=colunas)
+        return None
+
+    if type(historico) != int:
+        raise TypeError("O argumento 'historico' deve ser bool ou int.")
+    if historico < 1:
+        raise ValueError("O argumento 'historico' deve ser maior do que 0.")
+
+    return _Historico(capacidade, limite=historico, colunas=colunas)
+
+
+def _montar_saida(raiz: float, full_output: bool, inicio: float, historico: _Historico | None = None, **campos) -> float | ResultadoRaiz:
+    """
+    Função interna - Monta o valor de retorno dos métodos de raízes.
+
+    Args:
+        raiz (float): Valor aproximado da raiz.
+        full_output (bool): Se True, retorna um ResultadoRaiz.
+        inicio (float): Instante inicial, medido com time.perf_counter().
+        historico (_Historico | None): Registro dos pontos visitados.
+        **campos: Os demais campos de ResultadoRaiz, exceto raiz e tempo.
+
+    Returns:
+        float | ResultadoRaiz:
+            A raiz, ou o resultado detalhado se full_output for True.
+    """
+    if not full_output:
+        return raiz
+
+    valores = historico.valores() if historico is not None else None
+    return ResultadoRaiz(raiz=raiz, tempo=time.perf_counter() - inicio, historico=valores, **campos)
@@ -1,8 +1,12 @@
+import time
 import numpy as np
-import matplotlib.pyplot as plt
 from typing import Callable
 
-def secante(function: Callable, guess0: float, guess1: float, tolerance: float, plot: bool = False) -> float:
+from .raizes_resultado import ResultadoRaiz, _criar_historico, _montar_saida
+
+def secante(function: Callable, guess0: float, guess1: float, tolerance: float, plot: bool = False,
+            full_output: bool = False, callback: Callable[[int, float, float], None] | None = None,
+            historico: bool | int = False) -> float | ResultadoRaiz:
     """
     Encontra/aproxima uma raiz de uma função real de variável real usando o método da secante.
 
@@ -22,10 +26,22 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
         plot (bool = False):
             Determina se uma visualização gráfica do método será plotada.
             Por padrão, não será.
+        full_output (bool = False):
+            Se True, retorna um ResultadoRaiz com a raiz, o número de iterações
+            e de avaliações, o tempo, o resíduo e o motivo da parada.
+        callback (Callable[[int, float, float], None] | None = None):
+            Função chamada a cada iteração como callback(iteracao, x, fx),
+            onde x é o ponto atual e fx = f(x).
+        historico (bool | int = False):
+            Registro dos pontos visitados, devolvido em ResultadoRaiz.historico.
+            Com False nada é registrado (exceto quando plot=True, pois o
+            gráfico usa o registro), com True todos os pontos são registrados
+            e com um inteiro k apenas os k últimos.
 
     Returns:
-        float:
-            Valor aproximado da raiz.
+        float | ResultadoRaiz:
+            Valor aproximado da raiz, ou o resultado detalhado se full_output
+            for True.
 
     Raises:
         ValueError:
@@ -34,11 +50,14 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
             no domínio
         TypeError:
             Se function não for Callable.
+            Se historico não for bool ou int.
         ZeroDivisionError:
             Se a derivada praticamente zerar em algum momento da iteração.
         RunTimeError:
             Se o método não convergir em no máximo 1000 iterações.
     """
+
+    inicio = time.perf_counter()
     
     if not callable(function):
         raise TypeError("function deve ser um Callable.")
@@ -54,12 +73,16 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
         f_prev = float(f_prev_raw)
     except Exception as e:
         raise ValueError(f"f(x) não pôde ser avaliada no chute inicial x0 = {x_prev}: {e}")
+    avaliacoes_f = 1
     
     if np.isnan(f_prev) or np.isinf(f_prev):
         raise ValueError(f"f(x) retornou {f_prev} no chute inicial x0 = {x_prev}.")
     
-    x_record = [x_prev, x_curr]
     MAX_ITERS = 1000
+    record = _criar_historico(historico, plot, MAX_ITERS + 2)
+    if record is not None:
+        record.registrar(x_prev)
+        record.registrar(x_curr)
     root = None
     f_curr = None    
 
@@ -70,6 +93,10 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
             f_curr = float(f_curr_raw)
         except Exception as e:
             raise ValueError(f"f(x) não pôde ser avaliada no ponto x = {x_curr} na iteração {i}: {e}")
+        avaliacoes_f += 1
+
+        if callback is not None:
+            callback(i + 1, x_curr, f_curr)
 
         if np.isnan(f_curr) or np.isinf(f_curr):
             raise ValueError(f"f(x) retornou {f_curr} no ponto x = {x_curr} na iteração {i}.")
@@ -77,6 +104,7 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
         # Critério de parada
         if abs(f_curr) < tolerance:
             root = x_curr
+            motivo = "raiz_exata" if f_curr == 0 else "tolerancia_f"
             break
 
         if abs(f_curr - f_prev) < 1e-16:
@@ -85,11 +113,17 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
         # A fórmula de iteração da Secante
         x_next = x_curr - f_curr * (x_curr - x_prev) / (f_curr - f_prev)
         
-        x_record.append(x_next)
+        if record is not None:
+            record.registrar(x_next)
 
         # Critério de parada
         if abs(x_next - x_curr) < tolerance:
             root = x_next
+            motivo = "tolerancia_x"
+            if full_output:
+                # O resíduo informado é o da raiz retornada, não o do ponto anterior
+                f_curr = float(f(root))
+                avaliacoes_f += 1
             break
 
         # Atualiza os pontos para a próxima iteração
@@ -106,6 +140,9 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
     
     # Visualização Gráfica
     if plot:
+        import matplotlib.pyplot as plt
+
+        x_record = record.valores()
         if len(x_record) > 1:
             x_min = min(x_record)
             x_max = max(x_record)
@@ -154,4 +191,5 @@ def secante(function: Callable, guess0: float, guess1: float, tolerance: float,
         plt.legend()
         plt.show()
     
-    return root
\ No newline at end of file
+    return _montar_saida(root, full_output, inicio, record, iteracoes=i + 1, avaliacoes_f=avaliacoes_f,
+                         avaliacoes_df=0, residuo=abs(f_curr), motivo_parada=motivo)
\ No newline at end of file
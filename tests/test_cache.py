@@ -0,0 +1,74 @@
+import numpy as np
+import sympy as sp
+import pytest
+from pytest import approx
+
+from CB2325NumericaG1.cache import lambdify_cache, derivada_cache, info_cache, limpar_cache, configurar_cache
+from CB2325NumericaG1.raizes import newton_raphson
+from CB2325NumericaG1.aproximacao import polinomio_de_taylor
+
+x = sp.symbols('x')
+
+@pytest.fixture(autouse=True)
+def cache_limpo():
+    configurar_cache(256)
+    limpar_cache()
+    yield
+    configurar_cache(256)
+    limpar_cache()
+
+def test_lambdify_cache_reutiliza_expressoes_identicas():
+    f1 = lambdify_cache(x, sp.sin(x) + x**2)
+    # Expressão construída de novo, mas estruturalmente igual
+    f2 = lambdify_cache(x, sp.sympify("sin(x) + x**2"))
+    assert f1 is f2
+    assert f1(2.0) == approx(np.sin(2.0) + 4.0)
+
+    info = info_cache()
+    assert info.acertos == 1
+    assert info.falhas == 1
+    assert info.tamanho_atual == 1
+
+def test_derivada_cache():
+    assert derivada_cache(x**3, x) == 3 * x**2
+    assert derivada_cache(x**3, x, 2) == 6 * x
+    assert derivada_cache(x**3, x) == 3 * x**2
+    assert info_cache().acertos == 1
+
+def test_cache_lru_descarta_entrada_mais_antiga():
+    configurar_cache(2)
+    f_a = lambdify_cache(x, x + 1)
+    lambdify_cache(x, x + 2)
+    lambdify_cache(x, x + 1)       # x + 1 passa a ser a mais recente
+    lambdify_cache(x, x + 3)       # descarta x + 2
+    assert info_cache().tamanho_atual == 2
+    assert lambdify_cache(x, x + 1) is f_a
+    falhas = info_cache().falhas
+    lambdify_cache(x, x + 2)
+    assert info_cache().falhas == falhas + 1
+
+def test_limpar_e_configurar_cache():
+    lambdify_cache(x, x)
+    limpar_cache()
+    assert info_cache() == (0, 0, 256, 0)
+
+    configurar_cache(0)
+    lambdify_cache(x, x)
+    assert info_cache().tamanho_atual == 0
+
+    with pytest.raises(ValueError):
+        configurar_cache(-1)
+    with pytest.raises(TypeError):
+        configurar_cache(2.5)
+
+def test_newton_raphson_e_taylor_usam_o_cache():
+    f = x**2 - 2
+    newton_raphson(f, 1.0, 1e-10)
+    falhas = info_cache().falhas
+    newton_raphson(x**2 - 2, 3.0, 1e-10)
+    assert info_cache().falhas == falhas
+
+    polinomio_de_taylor(sp.exp(x), x, 0, 4)
+    falhas = info_cache().falhas
+    polinomio_de_taylor(sp.exp(x), x, 0, 4)
+    assert info_cache().falhas == falhas
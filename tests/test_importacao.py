@@ -0,0 +1,46 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def _modulos_importados(codigo: str) -> dict:
+    """Executa 'codigo' em um processo novo com 'python -X importtime' e
+    retorna um dicionário {módulo: tempo cumulativo em microssegundos}."""
+    processo = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", codigo],
+        capture_output=True, text=True, check=True,
+    )
+    modulos = {}
+    for linha in processo.stderr.splitlines():
+        if not linha.startswith("import time:") or "cumulative" in linha:
+            continue
+        _, cumulativo, nome = linha.split("|")
+        modulos[nome.strip()] = int(cumulativo)
+    return modulos
+
+
+def test_importar_pacote_nao_carrega_matplotlib_nem_sympy():
+    modulos = _modulos_importados("import CB2325NumericaG1")
+    assert "CB2325NumericaG1" in modulos
+    carregados = [m for m in modulos if m.split(".")[0] in ("matplotlib", "sympy", "mpl_toolkits")]
+    assert carregados == []
+
+
+def test_sympy_so_e_carregado_quando_usado():
+    codigo = (
+        "import sys\n"
+        "from CB2325NumericaG1.raizes import newton_raphson\n"
+        "newton_raphson(lambda x: x**2 - 2, 1.0, 1e-8)\n"
+        "assert 'sympy' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", codigo], check=True)
+
+
+@pytest.mark.parametrize("modulo", ["matplotlib.pyplot", "sympy"])
+def test_tempo_de_importacao_menor_que_backends(modulo):
+    # O pacote inteiro deve importar mais rápido do que qualquer um dos
+    # backends que ele deixou de carregar na importação.
+    pacote = _modulos_importados("import numpy, CB2325NumericaG1")["CB2325NumericaG1"]
+    backend = _modulos_importados(f"import numpy, {modulo}")[modulo]
+    assert pacote < backend
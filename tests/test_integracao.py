@@ -1,4 +1,4 @@
-from CB2325NumericaG1.integracao import trapezio, simpson13, monte_carlo_one_variable, monte_carlo_two_variables
+from CB2325NumericaG1.integracao import trapezio, simpson13, monte_carlo_one_variable, monte_carlo_two_variables, monte_carlo_nd, gauss_kronrod
 import math
 
 def test_trapezio_seno() :
@@ -75,6 +75,105 @@ def test_simpson13_negativa() :
     resultado = simpson13(f, 0, 2, n = 50)
     assert abs(resultado + 2) < 0.01
 
+def test_trapezio_simpson13_vetorizado_igual_ponto_a_ponto() :
+
+    """Testa se a avaliação vetorizada (np.sin) e a ponto a ponto (math.sin)
+        dão o mesmo resultado."""
+
+    import numpy as np
+
+    for metodo in (trapezio, simpson13) :
+        vetorizado = metodo(np.sin, 0, math.pi, n = 1000)
+        ponto_a_ponto = metodo(lambda x: math.sin(x), 0, math.pi, n = 1000)
+        assert vetorizado == ponto_a_ponto
+
+def test_trapezio_funcao_com_condicional() :
+
+    """Testa uma função que não aceita arrays (usa 'if').
+        Integral de |x| de -1 a 1 = 1."""
+
+    f = lambda x: x if x > 0 else -x
+    assert abs(trapezio(f, -1, 1, n = 100) - 1) < 0.001
+    assert abs(simpson13(f, -1, 1, n = 100) - 1) < 0.001
+
+def test_trapezio_simpson13_em_blocos() :
+
+    """Testa se o modo em blocos dá o mesmo resultado que a malha inteira,
+        inclusive com blocos que não dividem n + 1."""
+
+    import numpy as np
+
+    for metodo in (trapezio, simpson13) :
+        for bloco in (1, 7, 64, 10**6) :
+            assert metodo(np.exp, 0, 1, n = 100, tamanho_bloco = bloco) == metodo(np.exp, 0, 1, n = 100)
+
+def test_trapezio_em_blocos_argumentos_invalidos() :
+
+    """Testa os erros do modo em blocos."""
+
+    import pytest
+
+    with pytest.raises(ValueError) :
+        trapezio(math.sin, 0, 1, n = 10, tamanho_bloco = 0)
+    with pytest.raises(ValueError) :
+        simpson13(math.sin, 0, 1, n = 10, tamanho_bloco = 4, plot = True)
+
+# Integração adaptativa
+
+def test_gauss_kronrod_polinomio_exato() :
+
+    """Testa que a regra de 15 pontos integra um polinômio de grau baixo
+        sem subdividir o intervalo."""
+
+    resultado = gauss_kronrod(lambda x: 3*x**2 + 2*x, 0, 2)
+    assert abs(resultado.valor - 12) < 1e-12
+    assert resultado.avaliacoes == 15
+
+def test_gauss_kronrod_pico() :
+
+    """Testa a integral de 1/(1e-4 + (x - 0.3)²) de 0 a 1, com um pico
+        estreito em x = 0.3, e se o erro estimado está abaixo da tolerância."""
+
+    f = lambda x: 1 / (1e-4 + (x - 0.3)**2)
+    exato = (math.atan(0.7 / 1e-2) + math.atan(0.3 / 1e-2)) / 1e-2
+    resultado = gauss_kronrod(f, 0, 1, tol_abs = 1e-8, tol_rel = 0)
+    assert resultado.erro <= 1e-8
+    assert abs(resultado.valor - exato) < 1e-8
+    assert resultado.avaliacoes > 15
+
+def test_gauss_kronrod_limites_invertidos() :
+
+    """Testa que inverter os limites troca o sinal da integral, com a mesma
+        precisão e o mesmo número de avaliações."""
+
+    f = lambda x: 1 / (1e-4 + (x - 0.3)**2)
+    direto = gauss_kronrod(f, 0, 1, tol_abs = 1e-8, tol_rel = 0)
+    invertido = gauss_kronrod(f, 1, 0, tol_abs = 1e-8, tol_rel = 0)
+    assert invertido.erro <= 1e-8
+    assert abs(invertido.valor + direto.valor) < 1e-8
+    assert invertido.avaliacoes == direto.avaliacoes
+
+def test_gauss_kronrod_funcao_escalar() :
+
+    """Testa uma função que não aceita arrays (math.sqrt) e a singularidade
+        da derivada em x = 0."""
+
+    resultado = gauss_kronrod(math.sqrt, 0, 1, tol_abs = 1e-9)
+    assert abs(resultado.valor - 2/3) < 1e-9
+
+def test_gauss_kronrod_argumentos_invalidos() :
+
+    """Testa os erros de argumentos inválidos."""
+
+    import pytest
+
+    with pytest.raises(TypeError) :
+        gauss_kronrod(2, 0, 1)
+    with pytest.raises(ValueError) :
+        gauss_kronrod(math.sin, 0, 1, tol_abs = 0, tol_rel = 0)
+    with pytest.raises(ValueError) :
+        gauss_kronrod(math.sin, 0, 1, max_subintervalos = 0)
+
 # Integração estocástica
 
 def test_monte_carlo_one_variable_seno():
@@ -147,3 +246,167 @@ def test_monte_carlo_two_variables_negativa():
     f = lambda x, y: -x * y
     resultado = monte_carlo_two_variables(f, 0, 1, 0, 1, n=200000)
     assert abs(resultado + 0.25) < 0.05
+
+def test_monte_carlo_semente_reproduzivel():
+    """Testa se a mesma semente produz o mesmo resultado, inclusive com um
+       Generator do NumPy."""
+    import numpy as np
+
+    assert monte_carlo_one_variable(math.sin, 0, math.pi, 1000, semente=7) == monte_carlo_one_variable(math.sin, 0, math.pi, 1000, semente=7)
+    assert monte_carlo_two_variables(lambda x, y: x * y, 0, 1, 0, 1, 1000, semente=np.random.default_rng(3)) == \
+        monte_carlo_two_variables(lambda x, y: x * y, 0, 1, 0, 1, 1000, semente=np.random.default_rng(3))
+
+def test_monte_carlo_erro_padrao():
+    """Testa o erro padrão retornado com full_output: o valor exato deve
+       estar a poucos erros padrão da estimativa."""
+    import numpy as np
+
+    resultado = monte_carlo_one_variable(np.sin, 0, math.pi, 10**5, semente=1, full_output=True)
+    assert resultado.avaliacoes == 10**5
+    assert 0 < resultado.erro < 0.01
+    assert abs(resultado.valor - 2.0) < 5 * resultado.erro
+
+    resultado = monte_carlo_two_variables(lambda x, y: x + y, 0, 1, 0, 2, 10**5, semente=1, full_output=True)
+    assert abs(resultado.valor - 3.0) < 5 * resultado.erro
+
+def test_monte_carlo_uma_chamada_por_bloco():
+    """Testa se f é chamada uma única vez por bloco de amostras."""
+    import numpy as np
+
+    chamadas = []
+    def f(x, y):
+        chamadas.append(1)
+        return x + y
+
+    monte_carlo_two_variables(f, 0, 1, 0, 1, 10, semente=0, tamanho_bloco=4)
+    assert len(chamadas) == 3
+
+def test_monte_carlo_paralelo():
+    """Testa o modo com vários processos: resultado reproduzível para a
+       mesma semente e número de processos, e erro padrão coerente."""
+    import numpy as np
+    import operator
+
+    a = monte_carlo_one_variable(np.sin, 0, math.pi, 10**5, semente=5, full_output=True, processos=2)
+    b = monte_carlo_one_variable(np.sin, 0, math.pi, 10**5, semente=5, full_output=True, processos=2)
+    assert a == b
+    assert a.avaliacoes == 10**5
+    assert abs(a.valor - 2.0) < 5 * a.erro
+
+    # Um gerador como semente também dá resultados reproduzíveis
+    a = monte_carlo_one_variable(np.sin, 0, math.pi, 10**4, semente=np.random.default_rng(5), processos=2)
+    b = monte_carlo_one_variable(np.sin, 0, math.pi, 10**4, semente=np.random.default_rng(5), processos=2)
+    assert a == b
+
+    resultado = monte_carlo_two_variables(operator.mul, 0, 1, 0, 2, 10**5, semente=5, full_output=True, processos=3)
+    assert abs(resultado.valor - 1.0) < 5 * resultado.erro
+
+def test_monte_carlo_paralelo_argumentos_invalidos():
+    """Testa os erros do modo paralelo."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        monte_carlo_one_variable(math.sin, 0, 1, 100, processos=0)
+    with pytest.raises(TypeError):
+        monte_carlo_one_variable(lambda x: x, 0, 1, 100, processos=2)
+
+def test_monte_carlo_amostradores():
+    """Testa os amostradores de redução de variância: todos devem estimar a
+       integral dentro de poucos erros padrão, e os amostradores
+       estratificado, hipercubo latino e Halton devem ter erro padrão menor
+       que o uniforme para uma função suave."""
+    import numpy as np
+
+    uniforme = monte_carlo_one_variable(np.sin, 0, math.pi, 10**4, semente=1, full_output=True)
+    for amostrador in ("estratificado", "antitetico", "hipercubo_latino", "halton"):
+        resultado = monte_carlo_one_variable(np.sin, 0, math.pi, 10**4, semente=1,
+                                             full_output=True, amostrador=amostrador)
+        assert resultado.avaliacoes == 10**4
+        assert abs(resultado.valor - 2.0) < 5 * resultado.erro + 1e-12
+        if amostrador != "antitetico":
+            assert resultado.erro < uniforme.erro / 10
+
+        resultado = monte_carlo_two_variables(lambda x, y: np.exp(x + y), 0, 1, 0, 1, 10**4, semente=1,
+                                              full_output=True, amostrador=amostrador)
+        assert abs(resultado.valor - (math.e - 1)**2) < 5 * resultado.erro
+
+def test_monte_carlo_antitetico_funcao_monotona():
+    """Testa se o amostrador antitético reduz o erro padrão para uma função
+       monótona."""
+    import numpy as np
+
+    uniforme = monte_carlo_one_variable(np.exp, 0, 1, 10**4, semente=2, full_output=True)
+    antitetico = monte_carlo_one_variable(np.exp, 0, 1, 10**4, semente=2, full_output=True, amostrador="antitetico")
+    assert antitetico.erro < uniforme.erro / 5
+    assert abs(antitetico.valor - (math.e - 1)) < 5 * antitetico.erro
+
+def test_monte_carlo_amostrador_invalido():
+    """Testa o erro para um amostrador desconhecido."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        monte_carlo_one_variable(math.sin, 0, 1, 100, amostrador="sobol")
+
+def test_monte_carlo_nd_dimensao_alta():
+    """Testa a integral de x1² + ... + x5² em [0, 1]^5 (resultado 5/3) e de
+       cos(x1)...cos(x10) em [0, 1]^10 (resultado sin(1)^10)."""
+    import numpy as np
+
+    resultado = monte_carlo_nd(lambda p: np.sum(p**2, axis=1), [(0, 1)] * 5, 10**5, semente=1, full_output=True)
+    assert abs(resultado.valor - 5/3) < 5 * resultado.erro
+
+    resultado = monte_carlo_nd(lambda p: np.prod(np.cos(p), axis=1), [(0, 1)] * 10, 10**4, semente=1,
+                               full_output=True, amostrador="hipercubo_latino")
+    assert abs(resultado.valor - math.sin(1)**10) < 5 * resultado.erro
+
+def test_monte_carlo_nd_linha_a_linha():
+    """Testa uma função que só aceita um ponto por vez e limites invertidos."""
+    resultado = monte_carlo_nd(lambda p: p[0] * p[1] * p[2], [(0, 1), (0, 2), (3, 0)], 10**4, semente=1, full_output=True)
+    assert abs(resultado.valor - 4.5) < 5 * resultado.erro
+
+def test_monte_carlo_nd_igual_as_funcoes_antigas():
+    """Testa se monte_carlo_one_variable e monte_carlo_two_variables dão o
+       mesmo resultado que monte_carlo_nd com a mesma semente."""
+    import numpy as np
+
+    assert monte_carlo_one_variable(np.sin, 0, 1, 1000, semente=3) == \
+        monte_carlo_nd(lambda p: np.sin(p[:, 0]), [(0, 1)], 1000, semente=3)
+    assert monte_carlo_two_variables(lambda x, y: x * y, 0, 1, 0, 2, 1000, semente=3) == \
+        monte_carlo_nd(lambda p: p[:, 0] * p[:, 1], [(0, 1), (0, 2)], 1000, semente=3)
+
+def test_monte_carlo_nd_limites_invalidos():
+    """Testa os erros de limites inválidos."""
+    import pytest
+
+    with pytest.raises(ValueError):
+        monte_carlo_nd(lambda p: p[0], [], 100)
+    with pytest.raises(ValueError):
+        monte_carlo_nd(lambda p: p[0], [(0, 1, 2)], 100)
+
+def test_monte_carlo_parada_antecipada():
+    """Testa a parada pelo erro padrão: o erro retornado deve atingir o alvo
+       usando bem menos amostras que o máximo permitido."""
+    import numpy as np
+
+    resultado = monte_carlo_one_variable(np.sin, 0, math.pi, 10**9, semente=1, full_output=True,
+                                         erro_alvo=1e-3, tamanho_bloco=10**4)
+    assert resultado.erro <= 1e-3
+    assert resultado.avaliacoes < 10**7
+    assert abs(resultado.valor - 2.0) < 5 * resultado.erro
+
+    resultado = monte_carlo_nd(lambda p: np.sum(p, axis=1), [(0, 1)] * 3, 10**9, semente=1, full_output=True,
+                               tol_rel=1e-5, amostrador="hipercubo_latino")
+    assert resultado.erro <= 1e-5 * abs(resultado.valor)
+    assert resultado.avaliacoes < 10**8
+
+def test_monte_carlo_parada_antecipada_orcamento():
+    """Testa que, se o alvo não for atingido, todas as n amostras são usadas."""
+    import numpy as np
+    import pytest
+
+    resultado = monte_carlo_one_variable(np.sin, 0, math.pi, 10**4, semente=1, full_output=True, erro_alvo=1e-9)
+    assert resultado.avaliacoes == 10**4
+    assert resultado.erro > 1e-9
+
+    with pytest.raises(ValueError):
+        monte_carlo_one_variable(np.sin, 0, 1, 100, erro_alvo=0)
@@ -1,4 +1,4 @@
-from CB2325NumericaG1.interpolacao import lin_interp, hermite_interp, poly_interp, vandermond_interp
+from CB2325NumericaG1.interpolacao import lin_interp, hermite_interp, poly_interp, vandermond_interp, InterpoladorNewton, cheb_interp, spline_interp, pchip_interp
 from pytest import approx, raises
 
 def test_lin_interp():
@@ -33,6 +33,41 @@ def test_lin_interp():
     with raises(ValueError):
         poly_interp(x_empty, y_empty)
 
+def test_lin_interp_busca_binaria():
+    """Teste da busca do intervalo em lin_interp.
+
+    Verificação nos nós, nas extrapolações dos dois lados, com pontos fora de
+    ordem e com uma tabela grande, comparando com np.interp no interior.
+    Tratamento de erro para um único ponto.
+    """
+    p = lin_interp([3, 0, 1, 2], [4, 1, 2, 0])
+    assert [p(t) for t in (0, 1, 2, 3)] == approx([1, 2, 0, 4])
+    assert p(-1) == approx(0.0)
+    assert p(4) == approx(8.0)
+
+    import numpy as np
+    x = np.sort(np.random.default_rng(0).random(10**4))
+    y = np.cos(x)
+    p = lin_interp(list(x), list(y))
+    for t in np.linspace(x[0], x[-1], 101):
+        assert p(t) == approx(np.interp(t, x, y))
+
+    with raises(ValueError):
+        lin_interp([1], [2])
+
+def test_lin_interp_array():
+    """Teste da avaliação de lin_interp em arrays.
+
+    O resultado deve ter o formato da entrada e coincidir com a avaliação
+    ponto a ponto, inclusive nas extrapolações.
+    """
+    import numpy as np
+    p = lin_interp([0, 1, 2, 3], [1, 2, 0, 4])
+    t = np.linspace(-1, 4, 12).reshape(3, 4)
+    valores = p(t)
+    assert valores.shape == (3, 4)
+    assert valores.ravel() == approx([p(float(ti)) for ti in t.ravel()])
+
 def test_hermite_interp():
     """Teste da função hermite_interp.
 
@@ -51,6 +86,42 @@ def test_hermite_interp():
     assert p(1.5) == approx(-1.125)
     assert p(3) == approx(9)
 
+def test_hermite_interp_metodos():
+    """Teste da opção 'metodo' de hermite_interp.
+
+    As diferenças divididas e o sistema na base de monômios (padrão) devem
+    dar o mesmo polinômio para poucos nós.
+    Com 40 nós de Chebyshev, as diferenças divididas devem continuar
+    reproduzindo sin(3x).
+    Com 20 nós igualmente espaçados, o padrão deve reproduzir sin(3x).
+    Tratamento de erro para um método desconhecido.
+    """
+    import numpy as np
+    x = [0.5, -1, 2, 0, 1.5]
+    y = [np.exp(xi) for xi in x]
+    p = hermite_interp(x, y, y, metodo='diferencas_divididas')
+    q = hermite_interp(x, y, y)
+    t = np.linspace(-1, 2, 13)
+    assert p(t) == approx(q(t))
+    assert p(0.25) == approx(np.exp(0.25), rel=1e-4)
+
+    n = 40
+    x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+    p = hermite_interp(list(x), list(np.sin(3 * x)), list(3 * np.cos(3 * x)),
+                       metodo='diferencas_divididas')
+    t = np.linspace(-1, 1, 101)
+    assert p(t) == approx(np.sin(3 * t), abs=1e-12)
+
+    x = np.linspace(-1, 1, 20)
+    p = hermite_interp(list(x), list(np.sin(3 * x)), list(3 * np.cos(3 * x)))
+    assert p(t) == approx(np.sin(3 * t), abs=1e-8)
+    p = hermite_interp(list(x), list(np.sin(3 * x)), list(3 * np.cos(3 * x)),
+                       metodo='diferencas_divididas')
+    assert p(t) == approx(np.sin(3 * t), abs=1e-6)
+
+    with raises(ValueError):
+        hermite_interp([0, 1], [0, 1], [1, 1], metodo='lu')
+
 def test_poly_interp():
     """Teste da função poly_interp.
     
@@ -91,6 +162,49 @@ def test_poly_interp():
     with raises(ValueError):
         poly_interp(x_empty, y_empty)
 
+def test_poly_interp_baricentrica():
+    """Teste da forma baricêntrica de poly_interp.
+
+    Nos nós, o valor deve ser exatamente o y dado. Com 1000 nós de
+    Chebyshev, os produtos de Lagrange estouram, mas a forma baricêntrica
+    deve reproduzir exp(x) com precisão de máquina.
+    """
+    import numpy as np
+    p = poly_interp([0, 1, 2], [1, 3, 2])
+    assert p(1) == 3
+    assert p(2) == 2
+
+    n = 1000
+    x = np.cos(np.pi * (np.arange(n) + 0.5) / n)
+    p = poly_interp(list(x), list(np.exp(x)))
+    for t in np.linspace(-1, 1, 11):
+        assert p(t) == approx(np.exp(t), rel=1e-12)
+
+def test_poly_interp_array():
+    """Teste da avaliação de poly_interp em arrays.
+
+    O resultado deve ter o formato da entrada, coincidir com a avaliação
+    ponto a ponto e ser exato nos pontos que coincidem com os nós, inclusive
+    quando os pontos passam por vários blocos.
+    """
+    import numpy as np
+    from CB2325NumericaG1.interpolacao import interpolacao_polinomial
+
+    p = poly_interp([0, 1, 2, 3], [1, 2, 0, 4])
+    t = np.array([[0, 0.5, 1], [1.5, 2, 3.5]])
+    valores = p(t)
+    assert valores.shape == (2, 3)
+    assert valores.ravel() == approx([p(float(ti)) for ti in t.ravel()])
+    assert valores[0, 0] == 1 and valores[0, 2] == 2 and valores[1, 1] == 0
+
+    # blocos de 2 linhas para 4 nós
+    limite = interpolacao_polinomial._MAX_ELEMENTOS_BLOCO
+    interpolacao_polinomial._MAX_ELEMENTOS_BLOCO = 8
+    try:
+        assert p(t.ravel()) == approx(valores.ravel())
+    finally:
+        interpolacao_polinomial._MAX_ELEMENTOS_BLOCO = limite
+
 def test_vandermond_interp():
     """Teste da função vandermond_interp.
     
@@ -124,4 +238,192 @@ def test_vandermond_interp():
     x_empty = []
     y_empty = []
     with raises(ValueError):
-        poly_interp(x_empty, y_empty)
\ No newline at end of file
+        poly_interp(x_empty, y_empty)
+
+def test_vandermond_interp_bjorck_pereyra():
+    """Teste da opção metodo = 'bjorck_pereyra' de vandermond_interp.
+
+    Deve dar o mesmo polinômio que a solução densa.
+    Tratamento de erro para um método desconhecido.
+    """
+    import numpy as np
+    x = [-2, -1, 0, 1, 2, 3]
+    y = [4, -3, 1, 0, 2, 5]
+    p = vandermond_interp(x, y)
+    q = vandermond_interp(x, y, metodo='bjorck_pereyra')
+    t = np.linspace(-2, 3, 11)
+    assert [q(ti) for ti in t] == approx([p(ti) for ti in t])
+
+    q = vandermond_interp([-2, -1, 0, 1, 2], [-16, -3, 0, -1, 0], metodo='bjorck_pereyra')
+    assert q(1.5) == approx(-1.125)
+
+    with raises(ValueError):
+        vandermond_interp(x, y, metodo='lu')
+
+def test_vandermond_interp_horner():
+    """Teste da avaliação de vandermond_interp em arrays e do Horner compensado.
+
+    Arrays de qualquer formato devem manter o formato.
+    Perto da raiz sêxtupla de (x - 1)^6, o Horner comum perde todos os
+    dígitos e o compensado deve acertar o valor.
+    """
+    import numpy as np
+    x = [0, 1, 2, 3, 4, 5, 6]
+    y = [(xi - 1)**6 for xi in x]
+    p = vandermond_interp(x, y, metodo='bjorck_pereyra')
+    q = vandermond_interp(x, y, metodo='bjorck_pereyra', horner_compensado=True)
+
+    t = np.linspace(0, 6, 12).reshape(3, 4)
+    assert p(t).shape == (3, 4)
+    assert q(t).shape == (3, 4)
+    assert p(t).ravel() == approx([p(ti) for ti in t.ravel()])
+    assert q(t).ravel() == approx((t.ravel() - 1)**6)
+
+    assert q(1.001) == approx(1e-18, rel=1e-6, abs=0)
+    assert p(1.001) != approx(1e-18, rel=1e-6, abs=0)
+
+    with raises(TypeError):
+        vandermond_interp(x, y, horner_compensado=1)
+
+def test_interpolador_newton():
+    """Teste da classe InterpoladorNewton.
+
+    Adicionando os pontos um a um, o polinômio deve coincidir com o de
+    poly_interp. A avaliação aceita arrays.
+    Tratamento de erros.
+    """
+    import numpy as np
+    p = InterpoladorNewton([0, 1], [1, 3])
+    p.adicionar(2, 2)
+    assert len(p) == 3
+    assert p(1.5) == approx(2.875)
+    assert p(np.array([0.2, 2.75])) == approx([1.64, -0.71875])
+
+    q = poly_interp([0, 1, 2, 3], [1, 2, 0, 4])
+    p = InterpoladorNewton()
+    for xi, yi in zip([3, 0, 2, 1], [4, 1, 0, 2]):
+        p.adicionar(xi, yi)
+    t = np.linspace(-1, 4, 11)
+    assert p(t) == approx(q(t))
+
+    with raises(ValueError):
+        p.adicionar(2, 5)
+    with raises(ValueError):
+        InterpoladorNewton()(1.0)
+    with raises(ValueError):
+        InterpoladorNewton().remover_mais_antigo()
+
+def test_interpolador_newton_janela():
+    """Teste da janela deslizante do InterpoladorNewton.
+
+    Depois de deslizar por 2000 pontos de sin(x), o polinômio deve ser o
+    mesmo de um interpolador construído só com os últimos pontos.
+    """
+    import numpy as np
+    x = np.linspace(0, 20, 2001)
+    p = InterpoladorNewton(janela=10)
+    for xi, yi in zip(x, np.sin(x)):
+        p.adicionar(xi, yi)
+    assert len(p) == 10
+    assert list(p.x) == list(x[-10:])
+
+    novo = InterpoladorNewton(x[-10:], np.sin(x[-10:]))
+    t = np.linspace(x[-10], x[-1], 21)
+    assert p(t) == approx(novo(t))
+    assert p(t) == approx(np.sin(t))
+
+def test_cheb_interp():
+    """Teste da função cheb_interp.
+
+    O grau escolhido automaticamente deve reproduzir a função de Runge
+    1/(1 + 25x^2) com precisão de máquina em [-1, 1], e um polinômio de
+    grau 3 deve ser recuperado com grau 3. Os coeficientes devem coincidir
+    com a fórmula direta da DCT.
+    Tratamento de erros.
+    """
+    import numpy as np
+    runge = lambda x: 1 / (1 + 25 * x**2)
+    P = cheb_interp(runge)
+    t = np.linspace(-1, 1, 1001)
+    assert np.max(np.abs(P(t) - runge(t))) < 1e-13
+    assert P(0.3) == approx(runge(0.3))
+
+    P = cheb_interp(lambda x: 4 * x**3 - 3 * x, 0, 2)
+    assert P.grau == 3
+    assert P(1.5) == approx(4 * 1.5**3 - 4.5)
+
+    # coeficientes pela soma direta, para grau fixo
+    n = 8
+    k = np.arange(n + 1)
+    v = np.exp(np.cos(np.pi * k / n))
+    pesos = np.where((k == 0) | (k == n), 0.5, 1.0)
+    c = np.array([2 / n * np.sum(pesos * v * np.cos(np.pi * j * k / n)) for j in k])
+    c[0] /= 2
+    c[n] /= 2
+    assert cheb_interp(np.exp, n=n).coeficientes == approx(c)
+
+    with raises(TypeError):
+        cheb_interp(3)
+    with raises(ValueError):
+        cheb_interp(np.exp, 1, 0)
+
+def test_spline_interp():
+    """Teste da função spline_interp.
+
+    Os splines fixado (com as derivadas exatas nas extremidades) e
+    not-a-knot devem reproduzir exatamente um polinômio cúbico.
+    O spline natural deve passar pelos pontos e ter segunda derivada
+    nula nas extremidades.
+    Tratamento de erros.
+    """
+    import numpy as np
+    x = [3, 0, 1.5, 2, 0.5, 4]
+    y = [xi**3 - 2*xi + 1 for xi in x]
+    t = np.linspace(-1, 5, 25).reshape(5, 5)
+
+    p = spline_interp(x, y, contorno='not-a-knot')
+    assert p(t).shape == (5, 5)
+    assert p(t).ravel() == approx((t**3 - 2*t + 1).ravel())
+
+    p = spline_interp(x, y, contorno='fixada', dy_contorno=(-2, 46))
+    assert p(t).ravel() == approx((t**3 - 2*t + 1).ravel())
+
+    p = spline_interp([0, 1, 2, 3], [0, 1, 0, 1])
+    assert [p(xi) for xi in [0, 1, 2, 3]] == approx([0, 1, 0, 1])
+    h = 1e-4
+    assert (p(2*h) - 2*p(h) + p(0)) / h**2 == approx(0, abs=1e-3)
+    assert (p(3) - 2*p(3 - h) + p(3 - 2*h)) / h**2 == approx(0, abs=1e-3)
+
+    with raises(ValueError):
+        spline_interp(x, y, contorno='periodica')
+    with raises(ValueError):
+        spline_interp(x, y, contorno='fixada')
+    with raises(ValueError):
+        spline_interp([0, 1, 1], [0, 1, 2])
+    with raises(ValueError):
+        spline_interp([0], [0])
+
+def test_pchip_interp():
+    """Teste da função pchip_interp.
+
+    Com as derivadas exatas, deve reproduzir um polinômio cúbico.
+    Sem derivadas, deve preservar a monotonicidade dos dados e não
+    ultrapassar os valores de um degrau.
+    Tratamento de erros.
+    """
+    import numpy as np
+    x = [0, 1, 2.5, 3, 4]
+    p = pchip_interp(x, [xi**3 - 2*xi for xi in x], [3*xi**2 - 2 for xi in x])
+    t = np.linspace(0, 4, 17)
+    assert p(t) == approx(t**3 - 2*t)
+
+    x = [0, 1, 2, 3, 4, 5]
+    y = [0, 0, 0, 1, 1, 1]
+    p = pchip_interp(x, y)
+    t = np.linspace(0, 5, 1001)
+    assert np.all(np.diff(p(t)) >= 0)
+    assert np.min(p(t)) == approx(0) and np.max(p(t)) == approx(1)
+    assert p(2.5) == approx(0.5)
+
+    with raises(ValueError):
+        pchip_interp(x, y, [0, 1])
@@ -10,7 +10,7 @@ from typing import Callable, Union
 from pytest import approx
 
 # Funções a serem testadas
-from CB2325NumericaG1.raizes import bissecao, newton_raphson, secante
+from CB2325NumericaG1.raizes import bissecao, bissecao_vetorizada, brent, newton_raphson, newton_raphson_vetorizado, secante, ResultadoRaiz
 
 # ====== TESTES DA BISSEÇÃO ======
 
@@ -46,6 +46,68 @@ def test_bissecao_tolerancia_menor_que_zero():
     with pytest.raises(ValueError,match="Valor de tolerância inválido."):
         bissecao(f, limite_inferior, limite_superior,tolerancia)
 
+def test_bissecao_vetorizada_varios_intervalos():
+    # Raízes de x^2 - c para vários valores de c, cada uma em um intervalo
+    c = np.array([2.0, 3.0, 5.0, 10.0])
+    f = lambda x, c: x**2 - c
+    raizes, convergiu = bissecao_vetorizada(f, [0, 1, 2, 0], [4, 2, 3, 10], 1e-10, args=(c,))
+    assert convergiu.all()
+    assert raizes == approx(np.sqrt(c), abs=1e-9)
+
+def test_bissecao_vetorizada_concorda_com_bissecao():
+    f = lambda x: np.sin(x)
+    raizes, convergiu = bissecao_vetorizada(f, [1, 3, 6], [6, 4, 7], 1e-7)
+    assert convergiu.all()
+    assert [round(r, 4) for r in raizes] == [bissecao(f, a, b, 1e-7) for a, b in [(1, 6), (3, 4), (6, 7)]]
+
+def test_bissecao_vetorizada_intervalo_invalido_e_raiz_exata():
+    f = lambda x: x**2 - 1
+    raizes, convergiu = bissecao_vetorizada(f, [-2, 1, 0], [2, 3, 2], 1e-8)
+    assert list(convergiu) == [False, True, True]
+    assert np.isnan(raizes[0])
+    assert raizes[1] == 1.0
+    assert raizes[2] == approx(1.0, abs=1e-8)
+
+def test_bissecao_vetorizada_limites_invertidos():
+    f = lambda x: x**2 - 2
+    raizes, convergiu = bissecao_vetorizada(f, [2, 0], [0, 2], 1e-10)
+    assert convergiu.all()
+    assert raizes == approx([np.sqrt(2), np.sqrt(2)], abs=1e-9)
+
+def test_bissecao_vetorizada_tolerancia_invalida():
+    with pytest.raises(ValueError, match="Valor de tolerância inválido."):
+        bissecao_vetorizada(np.sin, [1], [6], 0)
+
+# ====== TESTES DE BRENT ======
+
+def test_brent_funcao_seno():
+    f = lambda x: np.sin(x)
+    assert round(brent(f, 1, 6, 1e-7), 4) == bissecao(f, 1, 6, 1e-7)
+
+def test_brent_exponencial():
+    f = lambda x: np.exp(x) - 2
+    assert brent(f, 0, 1, 1e-12) == approx(math.log(2), abs=1e-12)
+
+def test_brent_usa_menos_avaliacoes_que_bissecao():
+    avaliacoes = {"bissecao": 0, "brent": 0}
+    def contador(metodo):
+        def f(x):
+            avaliacoes[metodo] += 1
+            return x**3 - 2*x - 5
+        return f
+    bissecao(contador("bissecao"), 2, 3, 1e-10)
+    raiz = brent(contador("brent"), 2, 3, 1e-10)
+    assert raiz == approx(2.0945514815423265, abs=1e-10)
+    assert avaliacoes["brent"] < avaliacoes["bissecao"] / 2
+
+def test_brent_funcao_impropria_para_o_metodo():
+    with pytest.raises(ValueError, match="A função não tem sinais opostos nos limites do intervalo."):
+        brent(lambda x: x**2, -2, 2, 1e-8)
+
+def test_brent_tolerancia_invalida():
+    with pytest.raises(ValueError, match="Valor de tolerância inválido."):
+        brent(np.sin, 1, 6, 0)
+
 # ====== TESTES DE NEWTON-RAPHSON ======
 x = sp.symbols('x')
 y = sp.symbols('y')
@@ -126,6 +188,50 @@ def test_newton_raphson_funcao_sem_problemas():
     tolerancia = 1e-12
     assert newton_raphson(f,chute,tolerancia) == 1.4142139095356205
 
+def test_newton_raphson_vetorizado_varios_chutes():
+    f = x**3 - 2*x - 5
+    chutes = np.linspace(1, 4, 50)
+    raizes, convergiu = newton_raphson_vetorizado(f, chutes, 1e-12)
+    assert convergiu.all()
+    assert raizes == approx(np.full(50, 2.0945514815423265))
+
+def test_newton_raphson_vetorizado_familia_de_funcoes():
+    a = sp.symbols('a')
+    f = sp.Lambda((x, a), x**2 - a)
+    parametros = np.array([2.0, 9.0, 10.0])
+    raizes, convergiu = newton_raphson_vetorizado(f, [1.0, 1.0, 5.0], 1e-12, params=parametros)
+    assert convergiu.all()
+    assert raizes == approx(np.sqrt(parametros))
+
+    # Callable com o mesmo parâmetro
+    raizes, convergiu = newton_raphson_vetorizado(lambda x, a: x**2 - a, [1.0, 1.0, 5.0], 1e-12, params=parametros)
+    assert convergiu.all()
+    assert raizes == approx(np.sqrt(parametros))
+
+def test_newton_raphson_vetorizado_concorda_com_newton_raphson():
+    f = sp.sympify("x**4 - 4*x**2 + 4")
+    raizes, convergiu = newton_raphson_vetorizado(f, [1.5], 1e-12)
+    assert convergiu[0]
+    assert raizes[0] == approx(newton_raphson(f, 1.5, 1e-12))
+
+def test_newton_raphson_vetorizado_falhas_por_elemento():
+    # Derivada nula em x = 0 para cos(x); os outros chutes convergem
+    raizes, convergiu = newton_raphson_vetorizado(sp.cos(x), [0.0, 1.0, 2.0], 1e-10)
+    assert list(convergiu) == [False, True, True]
+    assert np.isnan(raizes[0])
+    assert raizes[1:] == approx([np.pi / 2, np.pi / 2])
+
+def test_newton_raphson_vetorizado_chute_em_raiz_dupla():
+    # x = 0 já é raiz (dupla) de x^2: converge mesmo com derivada nula, como em newton_raphson
+    raizes, convergiu = newton_raphson_vetorizado(x**2, [0.0, 1.0], 1e-8)
+    assert list(convergiu) == [True, True]
+    assert raizes[0] == newton_raphson(x**2, 0.0, 1e-8) == 0.0
+    assert abs(raizes[1]) < 1e-3
+
+def test_newton_raphson_vetorizado_parametros_sem_lambda():
+    with pytest.raises(ValueError):
+        newton_raphson_vetorizado(x**2 - y, [1.0], 1e-8, params=[2.0])
+
 # ====== TESTES DA SECANTE ======
 def test_secante_type_error():
     with pytest.raises(TypeError):
@@ -166,3 +272,85 @@ def test_secante_successo():
         return x**2 - 2
     root = secante(f, 1.0, 2.0, 1e-6)
     assert abs(root - np.sqrt(2)) < 1e-6
+
+# ====== TESTES DO RESULTADO DETALHADO ======
+def test_full_output_bissecao():
+    resultado = bissecao(np.sin, 1, 6, 1e-7, full_output=True)
+    assert isinstance(resultado, ResultadoRaiz)
+    assert resultado.raiz == bissecao(np.sin, 1, 6, 1e-7)
+    assert resultado.avaliacoes_f == resultado.iteracoes + 2
+    assert resultado.avaliacoes_df == 0
+    assert resultado.motivo_parada == "tolerancia_intervalo"
+    assert resultado.tempo >= 0
+
+def test_full_output_newton_raphson():
+    f = x**2 - 2
+    resultado = newton_raphson(f, 1.0, 1e-10, full_output=True)
+    assert resultado.raiz == newton_raphson(f, 1.0, 1e-10)
+    assert resultado.avaliacoes_f == resultado.iteracoes
+    assert resultado.avaliacoes_df == resultado.iteracoes - 1
+    assert resultado.residuo < 1e-10
+    assert resultado.motivo_parada == "tolerancia_f"
+
+def test_full_output_secante_e_brent():
+    f = lambda x: x**2 - 2
+    resultado = secante(f, 1.0, 2.0, 1e-8, full_output=True)
+    assert resultado.raiz == approx(np.sqrt(2))
+    assert resultado.avaliacoes_f == resultado.iteracoes + 1
+
+    resultado = brent(f, 1.0, 2.0, 1e-8, full_output=True)
+    assert resultado.raiz == approx(np.sqrt(2))
+    assert resultado.avaliacoes_f == resultado.iteracoes + 2
+
+def test_full_output_residuo_na_raiz_retornada():
+    # Com f em escala grande, a parada é por |dx| < tolerance; o resíduo deve ser o de f(raiz)
+    f = lambda x: 1e8 * (x**2 - 2)
+    for resultado in (newton_raphson(f, 1.0, 1e-6, full_output=True),
+                      secante(f, 1.0, 2.0, 1e-6, full_output=True)):
+        assert resultado.motivo_parada == "tolerancia_x"
+        assert resultado.residuo == abs(f(resultado.raiz))
+
+def test_full_output_raiz_exata_no_limite():
+    resultado = bissecao(lambda x: x - 1, 1, 3, 1e-8, full_output=True)
+    assert resultado.raiz == 1
+    assert resultado.motivo_parada == "raiz_exata"
+
+def test_callback_recebe_cada_iteracao():
+    registros = []
+    callback = lambda i, x, fx: registros.append((i, x, fx))
+
+    resultado = bissecao(np.sin, 1, 6, 1e-7, full_output=True, callback=callback)
+    assert len(registros) == resultado.iteracoes
+    assert [r[0] for r in registros] == list(range(1, resultado.iteracoes + 1))
+
+    registros.clear()
+    resultado = newton_raphson(x**2 - 2, 1.0, 1e-10, full_output=True, callback=callback)
+    assert len(registros) == resultado.iteracoes
+    assert registros[-1][2] == approx(0, abs=1e-10)
+
+# ====== TESTES DO HISTÓRICO ======
+def test_historico_desativado_por_padrao():
+    assert bissecao(np.sin, 1, 6, 1e-7, full_output=True).historico is None
+    assert newton_raphson(x**2 - 2, 1.0, 1e-10, full_output=True).historico is None
+    assert secante(lambda x: x**2 - 2, 1.0, 2.0, 1e-8, full_output=True).historico is None
+
+def test_historico_completo():
+    resultado = bissecao(np.sin, 1, 6, 1e-7, full_output=True, historico=True)
+    assert resultado.historico.shape == (resultado.iteracoes + 1, 2)
+    assert list(resultado.historico[0]) == [1, 6]
+
+    resultado = secante(lambda x: x**2 - 2, 1.0, 2.0, 1e-8, full_output=True, historico=True)
+    assert list(resultado.historico[:2]) == [1.0, 2.0]
+    assert resultado.historico[-1] == approx(np.sqrt(2))
+
+def test_historico_circular_guarda_os_ultimos():
+    completo = newton_raphson(x**3 - 2*x - 5, 10.0, 1e-12, full_output=True, historico=True).historico
+    ultimos = newton_raphson(x**3 - 2*x - 5, 10.0, 1e-12, full_output=True, historico=3).historico
+    assert len(completo) > 3
+    assert list(ultimos) == list(completo[-3:])
+
+def test_historico_invalido():
+    with pytest.raises(ValueError):
+        brent(np.sin, 1, 6, 1e-7, historico=0)
+    with pytest.raises(TypeError):
+        brent(np.sin, 1, 6, 1e-7, historico=2.5)